@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark the optimized CPU mode (int8 dynamic quantization / torch.compile) against fp32.
+
+Runs the same inputs through a pipeline before and after optimize_pipeline and reports
+latency and output drift (text similarity to the fp32 output) as JSON.
+
+Usage:
+    python benchmarks/cpu_optimization.py --pipeline summarization
+    python benchmarks/cpu_optimization.py --pipeline transcription --audio sample.wav --compile
+"""
+
+import argparse
+import difflib
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+SAMPLE_TEXT = (
+    "The city council met on Tuesday to discuss the new public transport plan. Members debated the cost "
+    "of extending the tram network to the northern suburbs, which has been delayed twice due to funding "
+    "shortfalls. Supporters argued that the extension would reduce traffic congestion and air pollution, "
+    "while critics warned that the budget could grow further. The council agreed to commission an "
+    "independent review and to hold a public consultation before making a final decision next spring."
+)
+
+
+def build_pipeline(pipeline_type: str, model_name: str):
+    if pipeline_type == "transcription":
+        from template.pipelines.transcription_pipeline import TranscriptionPipeline
+        return TranscriptionPipeline(model_name=model_name) if model_name else TranscriptionPipeline()
+    if pipeline_type == "summarization":
+        from template.pipelines.summarization_pipeline import SummarizationPipeline
+        return SummarizationPipeline(model_name=model_name) if model_name else SummarizationPipeline()
+    from template.pipelines.translation_pipeline import TranslationPipeline
+    return TranslationPipeline(model_name=model_name) if model_name else TranslationPipeline()
+
+
+def run_once(pipeline, pipeline_type: str, audio_path: str) -> str:
+    if pipeline_type == "transcription":
+        return pipeline.transcribe(audio_path, language="en")[0]
+    if pipeline_type == "summarization":
+        return pipeline.summarize(SAMPLE_TEXT)[0]
+    return pipeline.translate_text(SAMPLE_TEXT, "en", "es")[0]
+
+
+def measure(pipeline, pipeline_type: str, audio_path: str, iterations: int, warmup: int):
+    for _ in range(warmup):
+        run_once(pipeline, pipeline_type, audio_path)
+    latencies = []
+    output = ""
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        output = run_once(pipeline, pipeline_type, audio_path)
+        latencies.append(time.perf_counter() - start_time)
+    return output, {
+        'mean': statistics.mean(latencies),
+        'p50': statistics.median(latencies),
+        'min': min(latencies),
+        'max': max(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pipeline", choices=["transcription", "summarization", "translation"], required=True)
+    parser.add_argument("--model", default=None, help="Model name (default: the pipeline's default model)")
+    parser.add_argument("--audio", default=None, help="Audio file for the transcription benchmark")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--no-quantize", action="store_true", help="Only compile, don't quantize")
+    parser.add_argument("--compile", action="store_true", help="Also torch.compile the model")
+    parser.add_argument("--cache-dir", default=None, help="Quantized weight cache (default: ~/.cache/violet/optimized_models)")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    if args.pipeline == "transcription" and not args.audio:
+        parser.error("--audio is required for the transcription benchmark")
+
+    import torch
+    from template.pipelines.model_optimizer import DEFAULT_OPTIMIZED_MODEL_DIR, optimize_pipeline
+    from template.pipelines.pipeline_manager import estimate_pipeline_size
+
+    pipeline = build_pipeline(args.pipeline, args.model)
+    if pipeline.device != "cpu":
+        print("⚠️ CUDA is available - the optimized CPU mode only applies to CPU pipelines", file=sys.stderr)
+
+    print(f"⏱️ Benchmarking fp32 {pipeline.model_name}...", file=sys.stderr)
+    fp32_size = estimate_pipeline_size(pipeline)
+    fp32_output, fp32_latency = measure(pipeline, args.pipeline, args.audio, args.iterations, args.warmup)
+
+    conversion_start = time.perf_counter()
+    optimize_pipeline(pipeline, quantize=not args.no_quantize, compile=args.compile,
+                      cache_dir=args.cache_dir or DEFAULT_OPTIMIZED_MODEL_DIR)
+    conversion_time = time.perf_counter() - conversion_start
+
+    print(f"⏱️ Benchmarking optimized {pipeline.model_name}...", file=sys.stderr)
+    optimized_output, optimized_latency = measure(pipeline, args.pipeline, args.audio, args.iterations, args.warmup)
+
+    report = {
+        'pipeline': args.pipeline,
+        'model_name': pipeline.model_name,
+        'torch_version': torch.__version__,
+        'torch_threads': torch.get_num_threads(),
+        'quantized': not args.no_quantize,
+        'compiled': args.compile,
+        'iterations': args.iterations,
+        'conversion_time': conversion_time,
+        'fp32': {'latency': fp32_latency, 'parameter_bytes': fp32_size, 'output': fp32_output},
+        'optimized': {'latency': optimized_latency, 'output': optimized_output},
+        'speedup_p50': fp32_latency['p50'] / optimized_latency['p50'] if optimized_latency['p50'] else None,
+        'output_similarity': difflib.SequenceMatcher(None, fp32_output.split(), optimized_output.split()).ratio(),
+        'exact_match': fp32_output.strip() == optimized_output.strip(),
+    }
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report_json)
+    print(report_json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the inference pipelines on synthetic inputs.
+
+Runs TranscriptionPipeline, SummarizationPipeline, TranslationPipeline (text, PDF and DOCX),
+TTSPipeline and VideoProcessor on generated inputs of set sizes, with warm-up iterations first,
+and reports p50/p95 latency, throughput and peak RSS per case as JSON. Result caches (summary
+cache, translation memory) are disabled so every iteration does the full work.
+
+Usage:
+    python benchmarks/pipelines.py --output bench.json
+    python benchmarks/pipelines.py --pipelines transcription,video --audio-seconds 30,300 --iterations 3
+    python benchmarks/pipelines.py --pipelines translation --model translation=Helsinki-NLP/opus-mt-en-es
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_inputs import lorem_text, noise_audio, sample_docx, sample_pdf, sample_video, sine_audio, wav_bytes
+
+PIPELINES = ["transcription", "summarization", "translation", "tts", "video"]
+
+
+def log(message: str):
+    print(message, file=sys.stderr)
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # kB on Linux
+
+
+class PeakRSS:
+    """Sample RSS on a background thread and keep the maximum"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float]:
+    """p50/p95/mean/min/max of a list of latencies (seconds)"""
+    return {
+        'p50': float(np.percentile(latencies, 50)),
+        'p95': float(np.percentile(latencies, 95)),
+        'mean': statistics.mean(latencies),
+        'min': min(latencies),
+        'max': max(latencies),
+    }
+
+
+def run_case(pipeline: str, case: str, fn: Callable[[], Any], units: float, unit: str,
+             iterations: int, warmup: int, **details) -> Dict[str, Any]:
+    """
+    Time fn after warm-up calls.
+
+    Args:
+        pipeline: Pipeline name
+        case: Case name (input kind and size)
+        fn: Benchmark body
+        units: Work per call (e.g. seconds of audio, input tokens), for throughput
+        unit: Name of the work unit
+        iterations: Timed calls
+        warmup: Untimed calls before timing
+
+    Returns:
+        Case report
+    """
+    log(f"⏱️ {pipeline}/{case}: {warmup} warm-up + {iterations} timed iterations")
+    for _ in range(warmup):
+        fn()
+
+    latencies = []
+    rss_before = current_rss()
+    with PeakRSS() as rss:
+        for _ in range(iterations):
+            start_time = time.perf_counter()
+            fn()
+            latencies.append(time.perf_counter() - start_time)
+
+    latency = summarize_latencies(latencies)
+    return {
+        'pipeline': pipeline,
+        'case': case,
+        'iterations': iterations,
+        'warmup': warmup,
+        'units': units,
+        'unit': unit,
+        'latency': latency,
+        'throughput': units * len(latencies) / sum(latencies),
+        'throughput_unit': f"{unit}/s",
+        'rss_before_mb': rss_before / (1024 * 1024),
+        'peak_rss_mb': rss.peak / (1024 * 1024),
+        **details,
+    }
+
+
+def load(pipeline: str, factory: Callable[[], Any]):
+    """Build a pipeline and report its load time and RSS growth"""
+    rss_before = current_rss()
+    start_time = time.perf_counter()
+    instance = factory()
+    load_report = {
+        'load_time': time.perf_counter() - start_time,
+        'load_rss_mb': (current_rss() - rss_before) / (1024 * 1024),
+    }
+    log(f"✅ Loaded {pipeline} in {load_report['load_time']:.1f}s")
+    return instance, load_report
+
+
+def bench_transcription(args, model: Optional[str]) -> List[Dict[str, Any]]:
+    from template.pipelines.transcription_pipeline import TranscriptionPipeline
+    pipeline, load_report = load("transcription", lambda: TranscriptionPipeline(model_name=model) if model else TranscriptionPipeline())
+    results = []
+    for seconds in args.audio_seconds:
+        # Noise bursts split at pauses; the unbroken tone has none, so it exercises the no-pause fallback
+        inputs = {
+            f"audio_{seconds:g}s": wav_bytes(noise_audio(seconds, seed=args.seed)),
+            f"sine_{seconds:g}s": wav_bytes(sine_audio(seconds)),
+        }
+        for case, audio in inputs.items():
+            results.append(run_case(
+                "transcription", case, lambda: pipeline.transcribe(audio, language="en"),
+                seconds, "audio_seconds", args.iterations, args.warmup, model_name=pipeline.model_name, **load_report
+            ))
+    return results
+
+
+def bench_summarization(args, model: Optional[str]) -> List[Dict[str, Any]]:
+    from template.pipelines.summarization_pipeline import SummarizationPipeline
+    from template.pipelines.text_chunker import token_counter
+    kwargs = {'cache_entries': 0}
+    if model:
+        kwargs['model_name'] = model
+    pipeline, load_report = load("summarization", lambda: SummarizationPipeline(**kwargs))
+    count_tokens = token_counter(pipeline.tokenizer)
+    results = []
+    for tokens in args.text_tokens:
+        text = lorem_text(tokens, count_tokens, seed=args.seed)
+        results.append(run_case(
+            "summarization", f"text_{tokens}_tokens", lambda: pipeline.summarize(text),
+            count_tokens(text), "tokens", args.iterations, args.warmup, model_name=pipeline.model_name, **load_report
+        ))
+    return results
+
+
+def bench_translation(args, model: Optional[str]) -> List[Dict[str, Any]]:
+    from template.pipelines.text_chunker import token_counter
+    from template.pipelines.translation_pipeline import TranslationPipeline
+    kwargs = {'memory_entries': 0}
+    if model:
+        kwargs['model_name'] = model
+    pipeline, load_report = load("translation", lambda: TranslationPipeline(**kwargs))
+    count_tokens = token_counter(pipeline.tokenizer)
+    results = []
+    for tokens in args.text_tokens:
+        text = lorem_text(tokens, count_tokens, seed=args.seed)
+        units = count_tokens(text)
+        results.append(run_case(
+            "translation", f"text_{tokens}_tokens", lambda: pipeline.translate_text(text, "en", "es"),
+            units, "tokens", args.iterations, args.warmup, model_name=pipeline.model_name, **load_report
+        ))
+        for extension, build in (("pdf", sample_pdf), ("docx", sample_docx)):
+            try:
+                document = build(text)
+            except ImportError as e:
+                log(f"⚠️ Skipping {extension} case: {e}")
+                continue
+            results.append(run_case(
+                "translation", f"{extension}_{tokens}_tokens",
+                lambda: pipeline.translate_document(document, f"sample.{extension}", "en", "es"),
+                units, "tokens", args.iterations, args.warmup,
+                model_name=pipeline.model_name, document_bytes=len(document), **load_report
+            ))
+    return results
+
+
+def bench_tts(args, model: Optional[str]) -> List[Dict[str, Any]]:
+    import io
+    import soundfile as sf
+    from template.pipelines.tts_pipeline import TTSPipeline
+    pipeline, load_report = load("tts", lambda: TTSPipeline(model_name=model) if model else TTSPipeline())
+    results = []
+    for tokens in args.tts_tokens:
+        text = lorem_text(tokens, seed=args.seed).replace("\n\n", " ")
+        audio_bytes, _ = pipeline.synthesize(text, language="en")
+        audio_seconds = sf.info(io.BytesIO(audio_bytes)).duration
+        result = run_case(
+            "tts", f"text_{tokens}_words", lambda: pipeline.synthesize(text, language="en"),
+            len(text), "characters", args.iterations, args.warmup,
+            model_name=pipeline.model_name, audio_seconds=audio_seconds, **load_report
+        )
+        result['realtime_factor'] = audio_seconds / result['latency']['p50']
+        results.append(result)
+    return results
+
+
+def bench_video(args, model: Optional[str]) -> List[Dict[str, Any]]:
+    from template.pipelines.video_utils import VideoProcessor
+    processor = VideoProcessor()
+    if not processor.ffmpeg_available:
+        raise RuntimeError("ffmpeg is not installed")
+    results = []
+    for seconds in args.video_seconds:
+        video = sample_video(seconds)
+
+        def probe_and_extract():
+            processor._probe_cache.clear()  # Measure a cold probe every time
+            media_info = processor.probe(video, "sample.mkv")
+            return processor.extract_audio_array(video, "sample.mkv", media_info=media_info)
+
+        results.append(run_case(
+            "video", f"video_{seconds:g}s", probe_and_extract,
+            seconds, "media_seconds", args.iterations, args.warmup, video_bytes=len(video)
+        ))
+    return results
+
+
+BENCHMARKS = {
+    'transcription': bench_transcription,
+    'summarization': bench_summarization,
+    'translation': bench_translation,
+    'tts': bench_tts,
+    'video': bench_video,
+}
+
+
+def environment() -> Dict[str, Any]:
+    """Commit and machine details, so reports from different runs can be compared"""
+    info = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+    try:
+        info['commit'] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        info['commit'] = None
+    try:
+        import torch
+        info['torch_version'] = torch.__version__
+        info['torch_threads'] = torch.get_num_threads()
+        info['cuda'] = torch.cuda.is_available()
+    except ImportError:
+        pass
+    return info
+
+
+def parse_list(value: str, cast=float) -> List:
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pipelines", default=",".join(PIPELINES),
+                        help=f"Comma-separated pipelines to run (default: {','.join(PIPELINES)})")
+    parser.add_argument("--model", action="append", default=[], metavar="PIPELINE=MODEL",
+                        help="Model for a pipeline, e.g. transcription=openai/whisper-base (repeatable)")
+    parser.add_argument("--audio-seconds", type=parse_list, default=[10.0, 60.0], help="Transcription audio durations")
+    parser.add_argument("--text-tokens", type=lambda v: parse_list(v, int), default=[128, 1024],
+                        help="Summarization/translation input sizes in tokens")
+    parser.add_argument("--tts-tokens", type=lambda v: parse_list(v, int), default=[16, 64], help="TTS input sizes in words")
+    parser.add_argument("--video-seconds", type=parse_list, default=[10.0, 120.0], help="Video durations")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic inputs")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    selected = parse_list(args.pipelines, str)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown pipelines: {', '.join(unknown)}")
+    models = dict(item.split("=", 1) for item in args.model)
+
+    report = {'environment': environment(), 'results': [], 'errors': {}}
+    for name in selected:
+        try:
+            report['results'].extend(BENCHMARKS[name](args, models.get(name)))
+        except Exception as e:
+            log(f"❌ {name} benchmark failed: {e}")
+            report['errors'][name] = str(e)
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report_json)
+    print(report_json)
+
+
+if __name__ == "__main__":
+    main()
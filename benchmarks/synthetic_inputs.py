@@ -0,0 +1,124 @@
+"""
+Synthetic benchmark inputs: audio, text, documents and video generated on the fly.
+
+Everything is deterministic for a given seed, so runs on different commits see identical inputs.
+"""
+
+import io
+import random
+import shutil
+import subprocess
+import tempfile
+from typing import Callable, Optional
+
+import numpy as np
+
+LOREM_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et "
+    "dolore magna aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea "
+    "commodo consequat duis aute irure in reprehenderit voluptate velit esse cillum eu fugiat nulla pariatur "
+    "excepteur sint occaecat cupidatat non proident sunt culpa qui officia deserunt mollit anim id est laborum"
+).split()
+
+
+def sine_audio(duration: float, sample_rate: int = 16000, frequency: float = 440.0, amplitude: float = 0.5) -> np.ndarray:
+    """Mono float32 sine tone"""
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def noise_audio(duration: float, sample_rate: int = 16000, amplitude: float = 0.3, seed: int = 0) -> np.ndarray:
+    """
+    Mono float32 noise in 4 s bursts separated by 1 s pauses, so voice activity detection
+    sees speech-like structure instead of one unbroken segment.
+    """
+    rng = np.random.default_rng(seed)
+    audio = np.zeros(int(duration * sample_rate), dtype=np.float32)
+    for start in range(0, len(audio), 5 * sample_rate):
+        end = min(start + 4 * sample_rate, len(audio))
+        audio[start:end] = amplitude * rng.standard_normal(end - start)
+    return np.clip(audio, -1.0, 1.0)
+
+
+def wav_bytes(audio: np.ndarray, sample_rate: int = 16000) -> bytes:
+    """Encode audio as 16-bit PCM WAV"""
+    import soundfile as sf
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format='WAV', subtype='PCM_16')
+    return buffer.getvalue()
+
+
+def lorem_text(num_tokens: int, count_tokens: Optional[Callable[[str], int]] = None, seed: int = 0) -> str:
+    """
+    Lorem ipsum prose of about num_tokens tokens.
+
+    Args:
+        num_tokens: Target length
+        count_tokens: Token counting function (default: whitespace words)
+        seed: Word order seed
+
+    Returns:
+        Sentences of 8-16 words, grouped into paragraphs of 5 sentences
+    """
+    rng = random.Random(seed)
+    count_tokens = count_tokens or (lambda text: len(text.split()))
+    paragraphs = []
+    sentences = []
+    tokens = 0
+    while tokens < num_tokens:
+        words = [rng.choice(LOREM_WORDS) for _ in range(rng.randint(8, 16))]
+        sentence = " ".join(words).capitalize() + "."
+        sentences.append(sentence)
+        tokens += count_tokens(sentence)
+        if len(sentences) == 5:
+            paragraphs.append(" ".join(sentences))
+            sentences = []
+    if sentences:
+        paragraphs.append(" ".join(sentences))
+    return "\n\n".join(paragraphs)
+
+
+def sample_pdf(text: str) -> bytes:
+    """Multi-page PDF containing text (requires PyMuPDF)"""
+    import fitz
+    document = fitz.open()
+    for paragraph in text.split("\n\n"):
+        page = document.new_page()
+        page.insert_textbox(fitz.Rect(50, 50, 545, 792), paragraph, fontsize=11)
+    data = document.tobytes()
+    document.close()
+    return data
+
+
+def sample_docx(text: str) -> bytes:
+    """DOCX with one paragraph per text paragraph (requires python-docx)"""
+    from docx import Document
+    document = Document()
+    for paragraph in text.split("\n\n"):
+        document.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def sample_video(duration: float, width: int = 320, height: int = 240) -> bytes:
+    """
+    Matroska video with a test pattern and a sine audio track (requires ffmpeg).
+
+    Returns:
+        Video bytes
+    """
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is required to generate a sample video")
+    with tempfile.NamedTemporaryFile(suffix=".mkv") as output:
+        subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", f"testsrc=size={width}x{height}:rate=15:duration={duration}",
+                "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=44100:duration={duration}",
+                "-c:v", "mpeg4", "-q:v", "10", "-c:a", "pcm_s16le", "-shortest", "-y", output.name
+            ],
+            check=True
+        )
+        with open(output.name, "rb") as f:
+            return f.read()
@@ -0,0 +1,141 @@
+"""
+Streaming File Downloader for Miner
+Streams task inputs to temporary files with a size cap and length/hash verification,
+so large inputs (videos) never have to be held in memory as one bytes object.
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+import bittensor as bt
+
+
+class DownloadError(Exception):
+    """Raised when a streamed download is rejected (too large, truncated or corrupted)"""
+    pass
+
+
+@dataclass
+class DownloadedFile:
+    """A downloaded input stored on disk. Path-like, so it can be passed to librosa/ffmpeg directly."""
+    path: str
+    size: int
+    sha256: str
+    content_type: str = ""
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def read_bytes(self) -> bytes:
+        """Read the whole file (only for small inputs such as documents)"""
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def read_text(self, encoding: str = 'utf-8') -> str:
+        """Read the file as text"""
+        return self.read_bytes().decode(encoding, errors='replace')
+
+    @contextmanager
+    def open_mmap(self):
+        """Memory-map the file read-only"""
+        with open(self.path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    def cleanup(self):
+        """Delete the file from disk"""
+        try:
+            if self.path and os.path.exists(self.path):
+                os.unlink(self.path)
+                bt.logging.debug(f"🧹 Cleaned up downloaded file: {self.path}")
+        except Exception as e:
+            bt.logging.warning(f"⚠️ Failed to delete downloaded file {self.path}: {e}")
+
+
+async def stream_download(
+    http_client,
+    url: str,
+    max_bytes: int,
+    headers: Optional[dict] = None,
+    timeout: float = 120.0,
+    expected_size: Optional[int] = None,
+    expected_sha256: Optional[str] = None,
+    suffix: str = "",
+    download_dir: Optional[str] = None,
+    chunk_size: int = 1024 * 1024,
+) -> DownloadedFile:
+    """
+    Stream a URL to a temporary file.
+
+    Args:
+        http_client: ProxyHTTPClient (or anything with an httpx-style `stream` context manager)
+        url: URL to download
+        max_bytes: Maximum accepted size - the download is aborted once exceeded
+        headers: Request headers (e.g. auth)
+        timeout: Request timeout in seconds
+        expected_size: Expected size in bytes (e.g. file_size from the task), verified after download
+        expected_sha256: Expected sha256 hex digest (e.g. file_hash from the task), verified after download
+        suffix: Temp file suffix (helps ffmpeg/librosa detect the format)
+        download_dir: Directory for the temp file (default: system temp dir)
+        chunk_size: Bytes per streamed chunk
+
+    Returns:
+        DownloadedFile pointing at the verified temp file (caller is responsible for cleanup)
+    """
+    if expected_size and expected_size > max_bytes:
+        raise DownloadError(f"File too large: {expected_size} bytes exceeds limit of {max_bytes} bytes")
+
+    hasher = hashlib.sha256()
+    size = 0
+    temp_file = tempfile.NamedTemporaryFile(suffix=suffix, dir=download_dir, delete=False)
+
+    try:
+        async with http_client.stream("GET", url, headers=headers, timeout=timeout) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("content-type", "")
+
+            content_length = response.headers.get("content-length")
+            content_length = int(content_length) if content_length and content_length.isdigit() else None
+            if response.headers.get("content-encoding", "identity") != "identity":
+                # Content-Length is the compressed size - only the decoded stream can be checked
+                content_length = None
+            if content_length is not None and content_length > max_bytes:
+                raise DownloadError(f"File too large: {content_length} bytes exceeds limit of {max_bytes} bytes")
+
+            async for chunk in response.aiter_bytes(chunk_size):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise DownloadError(f"File too large: exceeded limit of {max_bytes} bytes while streaming")
+                hasher.update(chunk)
+                temp_file.write(chunk)
+
+        temp_file.close()
+
+        if content_length is not None and size != content_length:
+            raise DownloadError(f"Truncated download: got {size} of {content_length} bytes")
+        if expected_size and size != expected_size:
+            raise DownloadError(f"Size mismatch: got {size} bytes, expected {expected_size}")
+
+        digest = hasher.hexdigest()
+        if expected_sha256 and digest != expected_sha256.lower():
+            raise DownloadError(f"Hash mismatch: got sha256 {digest[:16]}..., expected {expected_sha256[:16]}...")
+
+        return DownloadedFile(path=temp_file.name, size=size, sha256=digest, content_type=content_type)
+
+    except BaseException:
+        temp_file.close()
+        try:
+            os.unlink(temp_file.name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,203 @@
+"""
+Input Cache for Miner
+Disk-backed, content-addressed LRU cache of downloaded task inputs. Entries are keyed by
+sha256 (the proxy's file_hash) with file_id aliases, so re-assigned or retried tasks and
+tasks sharing a source file don't download the same input again.
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
+import bittensor as bt
+
+try:
+    from file_downloader import DownloadedFile
+except ImportError:
+    from neurons.file_downloader import DownloadedFile
+
+
+class InputCache:
+    """Disk LRU cache for task input files with a byte budget"""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize input cache
+
+        Args:
+            cache_dir: Directory holding cached files
+            max_bytes: Byte budget - least recently used entries are evicted above it
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.links_dir = os.path.join(cache_dir, "links")
+        os.makedirs(self.links_dir, exist_ok=True)
+
+        # sha256 -> {'file': name, 'size': int, 'content_type': str}, in LRU order (oldest first)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # file_id -> sha256
+        self._aliases: Dict[str, str] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+        self._load_index()
+        bt.logging.info(f"✅ InputCache initialized: {len(self._entries)} entries, "
+                        f"{self._total_bytes / (1024 * 1024):.1f}/{max_bytes / (1024 * 1024):.0f} MB in {cache_dir}")
+
+    def _load_index(self):
+        """Restore entries from a previous run, dropping anything missing or stale"""
+        # Hand-out links from a previous run are no longer in use
+        for name in os.listdir(self.links_dir):
+            try:
+                os.unlink(os.path.join(self.links_dir, name))
+            except OSError:
+                pass
+
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+
+        for sha256, entry in index.get('entries', []):
+            path = os.path.join(self.cache_dir, entry.get('file', ''))
+            if os.path.isfile(path) and os.path.getsize(path) == entry.get('size'):
+                self._entries[sha256] = entry
+                self._total_bytes += entry['size']
+        self._aliases = {k: v for k, v in index.get('aliases', {}).items() if v in self._entries}
+
+        # Remove files that are not referenced by the index
+        known = {entry['file'] for entry in self._entries.values()} | {self.INDEX_FILE, "links"}
+        for name in os.listdir(self.cache_dir):
+            if name not in known:
+                try:
+                    os.unlink(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+        self._evict()
+
+    def _save_index(self):
+        """Persist the index (called with the lock held)"""
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        temp_path = index_path + ".tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump({'entries': list(self._entries.items()), 'aliases': self._aliases}, f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            bt.logging.warning(f"⚠️ Failed to save input cache index: {e}")
+
+    def _evict(self):
+        """Evict least recently used entries until within budget (called with the lock held)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            sha256, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry['size']
+            self.evictions += 1
+            try:
+                os.unlink(os.path.join(self.cache_dir, entry['file']))
+            except OSError:
+                pass
+            bt.logging.debug(f"🧹 Evicted cached input {sha256[:16]}... ({entry['size']} bytes)")
+        self._aliases = {k: v for k, v in self._aliases.items() if v in self._entries}
+
+    def _link(self, source: str, suffix: str) -> str:
+        """Hard-link (or copy) a cached file to a private path the caller owns"""
+        fd, target = tempfile.mkstemp(suffix=suffix, dir=self.links_dir)
+        os.close(fd)
+        os.unlink(target)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+        return target
+
+    def get(self, file_hash: Optional[str] = None, file_id: Optional[str] = None) -> Optional[DownloadedFile]:
+        """
+        Look up a cached input by content hash or file_id.
+
+        Returns:
+            DownloadedFile the caller owns (cleanup() removes only the caller's link), or None on miss
+        """
+        with self._lock:
+            # A known content hash is authoritative; otherwise fall back to the file_id alias
+            if file_hash:
+                sha256 = file_hash.lower()
+            else:
+                sha256 = self._aliases.get(file_id) if file_id else None
+            entry = self._entries.get(sha256) if sha256 else None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(sha256)
+            self.hits += 1
+            self.bytes_saved += entry['size']
+            if file_id:
+                self._aliases[file_id] = sha256
+
+            path = self._link(os.path.join(self.cache_dir, entry['file']), os.path.splitext(entry['file'])[1])
+            return DownloadedFile(path=path, size=entry['size'], sha256=sha256,
+                                  content_type=entry.get('content_type', ''))
+
+    def put(self, downloaded: DownloadedFile, file_id: Optional[str] = None):
+        """
+        Add a downloaded file to the cache (the caller keeps its own copy).
+
+        Args:
+            downloaded: Verified download (its sha256 is the cache key)
+            file_id: Proxy file_id to alias to the content hash
+        """
+        if downloaded.size > self.max_bytes:
+            return
+
+        sha256 = downloaded.sha256
+        with self._lock:
+            if sha256 not in self._entries:
+                name = sha256 + re.sub(r'[^A-Za-z0-9.]', '', os.path.splitext(downloaded.path)[1])[:10]
+                target = os.path.join(self.cache_dir, name)
+                try:
+                    os.link(downloaded.path, target)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    shutil.copyfile(downloaded.path, target)
+
+                self._entries[sha256] = {'file': name, 'size': downloaded.size,
+                                         'content_type': downloaded.content_type}
+                self._total_bytes += downloaded.size
+            else:
+                self._entries.move_to_end(sha256)
+
+            if file_id:
+                self._aliases[file_id] = sha256
+
+            self._evict()
+            self._save_index()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'total_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'bytes_saved': self.bytes_saved,
+            'evictions': self.evictions,
+        }
@@ -33,7 +33,21 @@ import threading
 
 # Bittensor Miner Template:
 from template.base.miner import BaseMinerNeuron
-from template.protocol import AudioTask
+from template.protocol import AudioTask, TTSStream
+
+# Import TaskScheduler and ProxyHTTPClient after path setup
+try:
+    from task_scheduler import TaskScheduler, parse_concurrency_limits
+    from proxy_client import ProxyHTTPClient
+    from file_downloader import DownloadedFile, DownloadError, stream_download
+    from input_cache import InputCache
+    from speaker_cache import SpeakerCache
+except ImportError:
+    from neurons.task_scheduler import TaskScheduler, parse_concurrency_limits
+    from neurons.proxy_client import ProxyHTTPClient
+    from neurons.file_downloader import DownloadedFile, DownloadError, stream_download
+    from neurons.input_cache import InputCache
+    from neurons.speaker_cache import SpeakerCache
 
 # Add FastAPI imports for the endpoints
 from fastapi import FastAPI, HTTPException, Request
@@ -74,7 +88,47 @@ class Miner(BaseMinerNeuron):
         # Miner will query proxy server for tasks instead of running its own API server
         self.proxy_server_url = "https://violet-proxy-bl4w.onrender.com"  # Production proxy server URL
         self.last_task_query = 0
-        self.task_query_interval = 10  # Query every 10 seconds
+        self.task_query_interval = 10  # Fallback polling interval when the task feed is unavailable
+        self.task_feed_timeout = 25  # Seconds the proxy holds a task feed request open
+        self.task_feed_supported = True  # Cleared if the proxy has no long-poll endpoint
+        self.task_feed_known = set()  # Task IDs returned by the feed that are still queued or in progress
+        
+        # Shared keep-alive HTTP client for all miner-to-proxy (and R2) traffic
+        proxy_max_retries = getattr(self.config.neuron, 'proxy_max_retries', None)
+        self.http_client = ProxyHTTPClient(
+            max_connections=getattr(self.config.neuron, 'proxy_max_connections', None) or 20,
+            max_retries=3 if proxy_max_retries is None else proxy_max_retries
+        )
+        
+        # Inputs are streamed to disk and rejected above this size
+        self.max_download_bytes = int((getattr(self.config.neuron, 'max_download_mb', None) or 1024) * 1024 * 1024)
+        
+        # Content-addressed disk cache for downloaded inputs (0 MB disables it)
+        self.input_cache = None
+        input_cache_mb = getattr(self.config.neuron, 'input_cache_mb', None)
+        input_cache_mb = 2048 if input_cache_mb is None else input_cache_mb
+        if input_cache_mb > 0:
+            input_cache_dir = getattr(self.config.neuron, 'input_cache_dir', None) or os.path.join(
+                getattr(self.config.neuron, 'full_path', None) or ".", "input_cache"
+            )
+            try:
+                self.input_cache = InputCache(os.path.expanduser(input_cache_dir), int(input_cache_mb * 1024 * 1024))
+            except Exception as e:
+                bt.logging.warning(f"⚠️ Input cache disabled: {e}")
+        
+        # Voice-cloning speaker WAVs + conditioning latents for TTS (0 entries disables it)
+        self.speaker_cache = None
+        speaker_cache_entries = getattr(self.config.neuron, 'speaker_cache_entries', None)
+        speaker_cache_entries = 32 if speaker_cache_entries is None else speaker_cache_entries
+        if speaker_cache_entries > 0:
+            try:
+                self.speaker_cache = SpeakerCache(
+                    os.path.join(getattr(self.config.neuron, 'full_path', None) or ".", "speaker_cache"),
+                    max_entries=speaker_cache_entries,
+                    url_ttl=getattr(self.config.neuron, 'speaker_cache_ttl', None) or 3600.0
+                )
+            except Exception as e:
+                bt.logging.warning(f"⚠️ Speaker cache disabled: {e}")
         
         # Load miner API key from environment variable (like HF_TOKEN)
         self.miner_api_key = os.getenv('MINER_API_KEY')
@@ -95,12 +149,73 @@ class Miner(BaseMinerNeuron):
         # Initialize pipeline manager for dynamic model loading
         # Models will be loaded only when tasks are assigned
         # Import only the class definition, avoiding any module-level execution
-        from template.pipelines.pipeline_manager import PipelineManager
-        # Create a new instance - PipelineManager.__init__ only sets up empty dicts, no model loading
-        self.pipeline_manager = PipelineManager()
+        from template.pipelines.pipeline_manager import get_pipeline_manager
+        # PipelineManager.__init__ only sets up an empty model cache, no model loading.
+        # Registered as the global instance so forked inference workers inherit the memory budget.
+        profile_stages = getattr(self.config.neuron, 'profile_pipeline_stages', False)
+        self.pipeline_manager = get_pipeline_manager(
+            max_memory_mb=getattr(self.config.neuron, 'model_cache_mb', None) or None,
+            pipeline_options={
+                'transcription': {
+                    'batch_size': getattr(self.config.neuron, 'transcription_batch_size', None) or None,
+                    'use_vad': not getattr(self.config.neuron, 'disable_vad', False),
+                    'profile_stages': profile_stages
+                },
+                'summarization': {
+                    'max_depth': getattr(self.config.neuron, 'summarization_max_depth', 2),
+                    'batch_size': getattr(self.config.neuron, 'summarization_batch_size', None) or None,
+                    'profile_stages': profile_stages
+                },
+                'translation': {
+                    'batch_size': getattr(self.config.neuron, 'translation_batch_size', None) or None,
+                    'max_batch_tokens': getattr(self.config.neuron, 'translation_batch_tokens', None) or None,
+                    'memory_entries': getattr(self.config.neuron, 'translation_memory_entries', 10000),
+                    'memory_db': getattr(self.config.neuron, 'translation_memory_db', None) or None,
+                    'profile_stages': profile_stages
+                },
+                'tts': {
+                    'profile_stages': profile_stages
+                }
+            },
+            optimize_cpu=getattr(self.config.neuron, 'optimize_cpu', False),
+            compile_models=getattr(self.config.neuron, 'compile_models', False),
+            optimized_model_dir=getattr(self.config.neuron, 'optimized_model_dir', None) or None,
+            backend=getattr(self.config.neuron, 'inference_backend', None) or "pytorch",
+            onnx_cache_dir=getattr(self.config.neuron, 'onnx_cache_dir', None) or None
+        )
         
         bt.logging.info("✅ Pipeline manager initialized - models will be loaded on-demand when tasks are assigned")
         
+        # Run blocking inference on worker pools so the event loop stays responsive
+        from template.pipelines.inference_executor import InferenceExecutor
+        self.inference_executor = InferenceExecutor(
+            mode=getattr(self.config.neuron, 'inference_mode', None) or "thread",
+            workers=parse_concurrency_limits(getattr(self.config.neuron, 'inference_workers', None)),
+            torch_threads=getattr(self.config.neuron, 'torch_threads', None) or None
+        )
+        
+        # Batch summarization/translation requests that arrive close together into one generate call
+        self.micro_batcher = None
+        micro_batch_wait_ms = getattr(self.config.neuron, 'micro_batch_wait_ms', 20.0)
+        if micro_batch_wait_ms and micro_batch_wait_ms > 0:
+            from template.pipelines.micro_batcher import MicroBatcher
+            self.micro_batcher = MicroBatcher(
+                self.inference_executor, self.pipeline_manager,
+                max_wait_ms=micro_batch_wait_ms,
+                max_batch_size=getattr(self.config.neuron, 'micro_batch_size', None) or 8
+            )
+        
+        # Preload and warm up models in the background; the axon and task feed wait for it
+        from template.pipelines.warmup import DEFAULT_WARMUP_MODELS, ModelWarmup, parse_warmup_models
+        warmup_spec = getattr(self.config.neuron, 'warmup_models', None)
+        self.model_warmup = ModelWarmup(
+            self.pipeline_manager,
+            parse_warmup_models(DEFAULT_WARMUP_MODELS if warmup_spec is None else warmup_spec),
+            run_inference=not getattr(self.config.neuron, 'warmup_skip_inference', False)
+        )
+        self.warmup_timeout = getattr(self.config.neuron, 'warmup_timeout', None) or 600.0
+        threading.Thread(target=self.model_warmup.run, name="model-warmup", daemon=True).start()
+        
         # Log configuration
         bt.logging.info(f"Axon IP: {self.config.axon.ip}")
         bt.logging.info(f"Axon Port: {self.config.axon.port}")
@@ -116,21 +231,36 @@ class Miner(BaseMinerNeuron):
             verify_fn=self.verify
         )
         
+        # Optional streaming TTS endpoint: audio is sent sentence by sentence as it is synthesized
+        if getattr(self.config.neuron, 'tts_streaming', False):
+            bt.logging.info("Attaching streaming TTS function to miner axon.")
+            self.axon.attach(
+                forward_fn=self.forward_tts_stream,
+                blacklist_fn=self.blacklist_tts_stream,
+                priority_fn=self.priority_tts_stream
+            )
+        
         bt.logging.info(f"Axon created: {self.axon}")
         
-        # Start background task to continuously query proxy server for tasks
+        # Initialize duplicate protection (before the task feed starts handing out tasks)
+        self.processed_tasks = set()  # Track processed task IDs
+        self.processing_tasks = set()  # Track currently processing tasks
+        self.max_processed_tasks = 1000  # Maximum tasks to keep in memory
+        self.task_processing_lock = threading.Lock()  # Thread safety for task processing
+        
+        # Concurrent task execution (scheduler is created on the task feed's event loop)
+        self.task_concurrency_limits = parse_concurrency_limits(
+            getattr(self.config.neuron, 'task_concurrency', None)
+        )
+        self.task_scheduler = None
+        
+        # Start background task feed subscribed to the proxy server
         self.start_proxy_query_task()
         
         # Start periodic metrics saving
         self.start_periodic_metrics_saving()
         
         bt.logging.info("✅ Miner initialization complete")
-        
-        # Initialize duplicate protection
-        self.processed_tasks = set()  # Track processed task IDs
-        self.processing_tasks = set()  # Track currently processing tasks
-        self.max_processed_tasks = 1000  # Maximum tasks to keep in memory
-        self.task_processing_lock = threading.Lock()  # Thread safety for task processing
 
     def setup_enhanced_logging(self):
         """Setup enhanced logging with structured logging and response tracking"""
@@ -300,8 +430,9 @@ class Miner(BaseMinerNeuron):
                     "uptime": time.time() - getattr(self, '_start_time', time.time())
                 },
                 "pipeline_status": {
-                    "pipeline_manager": "ready",
+                    "pipeline_manager": self.model_warmup.state,
                     "models_loaded_on_demand": True,
+                    "warmup": self.model_warmup.get_status(),
                     "cache_stats": self.pipeline_manager.get_cache_stats()
                 },
                 "system_info": {
@@ -406,6 +537,23 @@ Report generated automatically by Bittensor Miner
                 'avg_processing_time': getattr(self, 'total_processing_time', 0.0) / max(getattr(self, 'response_count', 1), 1)
             }
             
+            if getattr(self, 'task_scheduler', None) is not None:
+                metrics['task_scheduler'] = self.task_scheduler.get_stats()
+            if hasattr(self, 'inference_executor'):
+                metrics['inference_executor'] = self.inference_executor.get_stats()
+            if getattr(self, 'micro_batcher', None) is not None:
+                metrics['micro_batcher'] = self.micro_batcher.get_stats()
+            if hasattr(self, 'http_client'):
+                metrics['http_client'] = self.http_client.get_stats()
+            if getattr(self, 'input_cache', None) is not None:
+                metrics['input_cache'] = self.input_cache.get_stats()
+            if getattr(self, 'speaker_cache', None) is not None:
+                metrics['speaker_cache'] = self.speaker_cache.get_stats()
+            if hasattr(self, 'model_warmup'):
+                metrics['warmup'] = self.model_warmup.get_status()
+            if getattr(self.config.neuron, 'profile_pipeline_stages', False):
+                metrics['pipeline_stages'] = self.pipeline_manager.get_stage_stats()
+            
             metrics_file = self.metrics_logs_dir / f"metrics_{int(time.time())}.json"
             with open(metrics_file, 'w') as f:
                 json.dump(metrics, f, indent=2, default=str)
@@ -494,23 +642,8 @@ Report generated automatically by Bittensor Miner
         except (ImportError, AttributeError):
             pass  # Ignore anyio initialization errors
         
-        # Create httpx client with explicit timeout and limits to avoid circular import
-        client = None
-        try:
-            client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0, connect=10.0),
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-            )
-        except Exception as client_error:
-            # Fallback: try with minimal configuration
-            bt.logging.warning(f"⚠️ Error creating httpx client with full config: {client_error}")
-            try:
-                client = httpx.AsyncClient(timeout=30.0)
-            except Exception as fallback_error:
-                bt.logging.error(f"❌ Failed to create httpx client: {fallback_error}")
-                bt.logging.error(f"   This may be due to anyio/httpx version conflicts")
-                bt.logging.error(f"   Try: pip install --upgrade httpx anyio")
-                return
+        # Reuse the miner's shared keep-alive client
+        client = self.http_client
         
         try:
             headers = self._get_auth_headers()
@@ -530,44 +663,7 @@ Report generated automatically by Bittensor Miner
                 )
                 
                 if response.status_code == 200:
-                    tasks = response.json()
-                    if tasks and len(tasks) > 0:
-                        bt.logging.info(f"🎯 Found {len(tasks)} assigned tasks for miner {miner_uid}")
-                        
-                        # 🔒 DUPLICATE PROTECTION: Additional filtering before processing
-                        eligible_tasks = []
-                        for task in tasks:
-                            task_id = task.get("task_id")
-                            task_status = task.get("status")
-                            
-                            # Skip if already processed
-                            if task_id in self.processed_tasks:
-                                bt.logging.debug(f"🔄 Skipping already processed task: {task_id}")
-                                continue
-                            
-                            # Skip if currently being processed
-                            if task_id in self.processing_tasks:
-                                bt.logging.debug(f"⏳ Skipping currently processing task: {task_id}")
-                                continue
-                            
-                            # Only accept assigned or pending tasks (exclude processing to reduce logging)
-                            if task_status not in ['assigned', 'pending']:
-                                bt.logging.debug(f"⚠️ Skipping task with invalid status '{task_status}': {task_id}")
-                                continue
-                            
-                            eligible_tasks.append(task)
-                        
-                        # Process eligible tasks after filtering (fixed indentation)
-                        if len(eligible_tasks) > 0:
-                            bt.logging.info(f"✅ {len(eligible_tasks)} assigned tasks eligible for processing")
-                            
-                            # Process each eligible task
-                            for task in eligible_tasks:
-                                await self.process_proxy_task(task)
-                        else:
-                            bt.logging.debug(f"🔄 No eligible tasks after filtering")
-                    else:
-                        bt.logging.debug(f"🔄 No assigned tasks for miner {miner_uid}")
+                    await self._process_assigned_tasks(response.json(), miner_uid)
                 else:
                     bt.logging.warning(f"⚠️ Failed to query assigned tasks: {response.status_code}")
             except Exception as e:
@@ -587,37 +683,190 @@ Report generated automatically by Bittensor Miner
             else:
                 bt.logging.warning(f"⚠️ Error querying proxy for tasks: {e}")
     
-    def start_proxy_query_task(self):
-        """Start background task to continuously query proxy server for tasks"""
-        import threading
-        import time
+    async def _process_assigned_tasks(self, tasks: list, miner_uid: int):
+        """
+        Filter tasks returned by the proxy and process the eligible ones
         
-        def proxy_query_loop():
-            while True:
+        Returns:
+            Number of tasks accepted for processing
+        """
+        if not tasks:
+            bt.logging.debug(f"🔄 No assigned tasks for miner {miner_uid}")
+            return 0
+        
+        bt.logging.info(f"🎯 Found {len(tasks)} assigned tasks for miner {miner_uid}")
+        
+        # 🔒 DUPLICATE PROTECTION: Additional filtering before processing
+        eligible_tasks = []
+        for task in tasks:
+            task_id = task.get("task_id")
+            task_status = task.get("status")
+            
+            # Skip if already processed
+            if task_id in self.processed_tasks:
+                bt.logging.debug(f"🔄 Skipping already processed task: {task_id}")
+                continue
+            
+            # Skip if currently being processed
+            if task_id in self.processing_tasks:
+                bt.logging.debug(f"⏳ Skipping currently processing task: {task_id}")
+                continue
+            
+            # Only accept assigned or pending tasks (exclude processing to reduce logging)
+            if task_status not in ['assigned', 'pending']:
+                bt.logging.debug(f"⚠️ Skipping task with invalid status '{task_status}': {task_id}")
+                continue
+            
+            eligible_tasks.append(task)
+        
+        if len(eligible_tasks) > 0:
+            bt.logging.info(f"✅ {len(eligible_tasks)} assigned tasks eligible for processing")
+            
+            if self.task_scheduler is not None:
+                # Hand tasks to the scheduler so they run concurrently within per-type limits
+                queued = sum(1 for task in eligible_tasks if self.task_scheduler.submit(task))
+                bt.logging.info(f"📥 Queued {queued} tasks, in flight: {self.task_scheduler.get_in_flight()}")
+                return queued
+            
+            # Process each eligible task
+            for task in eligible_tasks:
+                await self.process_proxy_task(task)
+            return len(eligible_tasks)
+        
+        bt.logging.debug(f"🔄 No eligible tasks after filtering")
+        return 0
+    
+    async def wait_for_proxy_tasks(self):
+        """
+        Long-poll the proxy task feed: the request is held open until tasks are
+        assigned to this miner (or the feed timeout expires), then processed.
+        """
+        miner_uid = self.uid if hasattr(self, 'uid') else 0
+        
+        if miner_uid == 0:
+            bt.logging.debug("🔄 Miner UID not available yet, skipping task feed")
+            await asyncio.sleep(self.task_query_interval)
+            return
+        
+        headers = self._get_auth_headers()
+        if not headers.get("X-API-Key"):
+            bt.logging.error("❌ No API key found! Miner cannot authenticate with proxy server.")
+            bt.logging.error("   Set MINER_API_KEY in .env file")
+            await asyncio.sleep(self.task_query_interval)
+            return
+        
+        response = await self.http_client.get(
+            f"{self.proxy_server_url}/api/v1/miners/{miner_uid}/tasks/wait",
+            headers=headers,
+            # Tell the proxy which open tasks we already have so it holds until there is a new one
+            params={"status": "assigned", "timeout": self.task_feed_timeout,
+                    "known": sorted(self.task_feed_known)},
+            # Allow for the server-side hold plus network latency
+            timeout=httpx.Timeout(self.task_feed_timeout + 15.0, connect=10.0)
+        )
+        
+        if response.status_code == 404:
+            # Older proxy without the long-poll endpoint - fall back to periodic polling
+            bt.logging.warning("⚠️ Proxy has no task feed endpoint, falling back to periodic polling")
+            self.task_feed_supported = False
+            return
+        
+        if response.status_code != 200:
+            bt.logging.warning(f"⚠️ Task feed request failed: {response.status_code}")
+            await asyncio.sleep(self.task_query_interval)
+            return
+        
+        tasks = response.json()
+        returned_ids = {task.get("task_id") for task in tasks if task.get("task_id")}
+        already_known = bool(returned_ids) and returned_ids <= self.task_feed_known
+        await self._process_assigned_tasks(tasks, miner_uid)
+        
+        # Keep reporting tasks until they finish; once we respond the proxy leaves them out itself
+        self.task_feed_known = returned_ids | {
+            task_id for task_id in self.task_feed_known if self._is_task_in_flight(task_id)
+        }
+        
+        if already_known:
+            # The proxy ignored the known list - don't spin on the open feed
+            await asyncio.sleep(self.task_query_interval)
+    
+    def _is_task_in_flight(self, task_id: str) -> bool:
+        """Check whether a task is queued in the scheduler or currently processing"""
+        if self.task_scheduler is not None and self.task_scheduler.is_pending(task_id):
+            return True
+        with self.task_processing_lock:
+            return task_id in self.processing_tasks
+    
+    def _is_task_known(self, task_id: str) -> bool:
+        """Check the duplicate protection sets for a task ID"""
+        with self.task_processing_lock:
+            return task_id in self.processing_tasks or task_id in self.processed_tasks
+    
+    def wait_until_ready(self):
+        """Wait for model warm-up to finish (bounded by --neuron.warmup_timeout)"""
+        if self.model_warmup.ready.is_set():
+            return
+        bt.logging.info("⏳ Waiting for model warm-up before accepting requests...")
+        if not self.model_warmup.ready.wait(self.warmup_timeout):
+            bt.logging.warning(f"⚠️ Model warm-up still running after {self.warmup_timeout:.0f}s, continuing without it")
+        else:
+            bt.logging.info(f"✅ Miner ready (warm-up {self.model_warmup.state})")
+    
+    async def run_task_feed(self):
+        """Keep one persistent subscription to the proxy task feed"""
+        # Don't pull tasks until the preloaded models are warm
+        await asyncio.get_running_loop().run_in_executor(None, self.wait_until_ready)
+        
+        self.task_scheduler = TaskScheduler(
+            process_fn=self.process_proxy_task,
+            is_known_fn=self._is_task_known,
+            concurrency_limits=self.task_concurrency_limits
+        )
+        bt.logging.info(f"⚙️ Task scheduler limits: {self.task_scheduler.concurrency_limits}")
+        
+        try:
+            await self._run_task_feed_loop()
+        finally:
+            await self.task_scheduler.shutdown()
+            self.task_scheduler = None
+    
+    async def _run_task_feed_loop(self):
+        """Long-poll the proxy for tasks until the miner exits"""
+        try:
+            while not getattr(self, 'should_exit', False):
                 try:
-                    # Use asyncio.run to call the async method from a separate thread
-                    import asyncio
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        # Query for tasks
-                        loop.run_until_complete(self.query_proxy_for_tasks())
-                        
-                        # 🔒 DUPLICATE PROTECTION: Clean up old processed tasks
-                        self.cleanup_processed_tasks()
-                        
-                    finally:
-                        loop.close()
+                    if self.task_feed_supported:
+                        await self.wait_for_proxy_tasks()
+                    else:
+                        await self.query_proxy_for_tasks()
+                        await asyncio.sleep(self.task_query_interval)
+                    
+                    # 🔒 DUPLICATE PROTECTION: Clean up old processed tasks
+                    self.cleanup_processed_tasks()
+                    
                 except Exception as e:
-                    bt.logging.warning(f"⚠️ Background proxy query error: {e}")
-                
-                # Wait before next query
-                time.sleep(self.task_query_interval)
+                    bt.logging.warning(f"⚠️ Task feed error: {e}")
+                    # Back off before reconnecting so a proxy outage doesn't become a request storm
+                    await asyncio.sleep(self.task_query_interval)
+        finally:
+            await self.http_client.aclose()
+    
+    def start_proxy_query_task(self):
+        """Start background thread running a persistent event loop subscribed to the proxy task feed"""
+        def task_feed_thread():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.run_task_feed())
+            except Exception as e:
+                bt.logging.error(f"❌ Task feed loop stopped: {e}")
+            finally:
+                loop.close()
         
         # Start background thread
-        proxy_thread = threading.Thread(target=proxy_query_loop, daemon=True)
+        proxy_thread = threading.Thread(target=task_feed_thread, daemon=True)
         proxy_thread.start()
-        bt.logging.info(f"🔄 Started background proxy query task (every {self.task_query_interval} seconds)")
+        bt.logging.info(f"🔄 Started background task feed (long-poll, {self.task_feed_timeout}s hold)")
     
     async def test_file_download(self):
         """Test file download capability - only tests if there are actual tasks with files"""
@@ -633,7 +882,7 @@ Report generated automatically by Bittensor Miner
             
             # Query for assigned tasks to find a real file to test with
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
+                async with self.http_client.session(timeout=5.0) as client:
                     headers = self._get_auth_headers()
                     response = await client.get(
                         f"{self.proxy_server_url}/api/v1/miners/{miner_uid}/tasks",
@@ -665,7 +914,7 @@ Report generated automatically by Bittensor Miner
                             test_url = f"{self.proxy_server_url}/api/v1/files/{test_file_id}/download"
                             
                             # Use our download function
-                            downloaded_data = await self.download_file_from_proxy(test_url)
+                            downloaded_data = await self.download_file_from_proxy(test_url, file_id=test_file_id)
                             
                             if downloaded_data is not None:
                                 bt.logging.info(f"✅ File download test PASSED - downloaded {len(downloaded_data)} bytes")
@@ -712,7 +961,7 @@ Report generated automatically by Bittensor Miner
             bt.logging.info(f"🧪 Testing endpoint for miner {miner_uid}")
             
             # Test the endpoint with "assigned" status (tasks assigned to this miner)
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http_client.session(timeout=10.0) as client:
                 headers = self._get_auth_headers()
                 response = await client.get(
                     f"{self.proxy_server_url}/api/v1/miners/{miner_uid}/tasks",
@@ -786,6 +1035,7 @@ Report generated automatically by Bittensor Miner
                 self.processing_tasks.add(task_id)
                 bt.logging.info(f"🔒 Task {task_id} locked for processing")
             
+            downloaded_file = None  # Streamed input on disk, removed once the task finishes
             try:
                 # For summarization tasks, we handle text-based input differently
                 if task_type == "summarization":
@@ -832,7 +1082,7 @@ Report generated automatically by Bittensor Miner
                     if not audio_url:
                         bt.logging.info(f"📡 Fetching audio URL from proxy API for task {task_id}")
                         try:
-                            async with httpx.AsyncClient(timeout=60.0) as client:
+                            async with self.http_client.session(timeout=60.0) as client:
                                 headers = self._get_auth_headers()
                                 response = await client.get(
                                     f"{self.proxy_server_url}/api/v1/miner/transcription/{task_id}",
@@ -855,53 +1105,25 @@ Report generated automatically by Bittensor Miner
                     if audio_url:
                         bt.logging.info(f"🌐 Downloading audio directly from R2 URL for task {task_id}")
                         try:
-                            async with httpx.AsyncClient(timeout=120.0) as client:
-                                response = await client.get(audio_url)
-                                response.raise_for_status()
-                                audio_bytes = response.content
-                                input_size = len(audio_bytes)
-                                
-                                if input_size == 0:
-                                    bt.logging.error(f"❌ Downloaded audio is empty for task {task_id}")
-                                    return
-                                
-                                bt.logging.info(f"✅ Downloaded {input_size} bytes from R2 for task {task_id}")
-                                
-                                # Save to temporary file for processing
-                                temp_wav_path = None
-                                try:
-                                    import librosa
-                                    import soundfile as sf
-                                    import io
-                                    import tempfile
-                                    import os
-                                    
-                                    # Load audio from bytes
-                                    audio_io = io.BytesIO(audio_bytes)
-                                    audio_array, sample_rate = librosa.load(audio_io, sr=None)
-                                    
-                                    # Create temporary WAV file
-                                    with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                                        temp_wav_path = temp_file.name
-                                    
-                                    # Save as WAV
-                                    sf.write(temp_wav_path, audio_array, sample_rate)
-                                    bt.logging.info(f"💾 Saved audio to temporary file: {temp_wav_path} (sr={sample_rate}Hz)")
-                                    
-                                    # Read the temp file as bytes for processing
-                                    with open(temp_wav_path, 'rb') as f:
-                                        input_data = f.read()
-                                    
-                                    bt.logging.info(f"✅ Audio ready for processing: {len(input_data)} bytes")
-                                    
-                                finally:
-                                    # Clean up temporary file after processing
-                                    if temp_wav_path and os.path.exists(temp_wav_path):
-                                        try:
-                                            os.unlink(temp_wav_path)
-                                            bt.logging.debug(f"🧹 Cleaned up temporary file: {temp_wav_path}")
-                                        except Exception as e:
-                                            bt.logging.warning(f"⚠️ Failed to delete temporary file {temp_wav_path}: {e}")
+                            # Stream straight to disk - the pipeline decodes/resamples from the path
+                            input_file = task_data.get('input_file') if isinstance(task_data.get('input_file'), dict) else {}
+                            file_name = input_file.get('file_name') or audio_url.split('?')[0]
+                            downloaded_file = await self._fetch_input_file(
+                                audio_url,
+                                file_id=input_file.get('file_id'),
+                                expected_size=input_file.get('file_size') or None,
+                                expected_sha256=input_file.get('file_hash'),
+                                suffix=os.path.splitext(file_name)[1]
+                            )
+                            input_data = downloaded_file
+                            input_size = downloaded_file.size
+                            
+                            if input_size == 0:
+                                bt.logging.error(f"❌ Downloaded audio is empty for task {task_id}")
+                                return
+                            
+                            bt.logging.info(f"✅ Downloaded {input_size} bytes from R2 for task {task_id}")
+                            bt.logging.info(f"💾 Audio ready for processing: {downloaded_file.path}")
                         except Exception as e:
                             bt.logging.error(f"❌ Failed to download audio from R2 URL: {e}")
                             return
@@ -958,8 +1180,18 @@ Report generated automatically by Bittensor Miner
                     
                     bt.logging.info(f"📥 Downloading input file from proxy: {input_file_id}")
                     
-                    # Download input file from proxy
-                    input_data = await self.download_file_from_proxy(f"{self.proxy_server_url}/api/v1/files/{input_file_id}/download")
+                    # Download input file from proxy (audio/video stay on disk and are passed as a path)
+                    input_file = task_data.get('input_file') if isinstance(task_data.get('input_file'), dict) else {}
+                    input_data = await self.download_file_from_proxy(
+                        f"{self.proxy_server_url}/api/v1/files/{input_file_id}/download",
+                        to_file=task_type in ("transcription", "video_transcription"),
+                        file_id=input_file_id,
+                        expected_size=input_file.get('file_size') or None,
+                        expected_sha256=input_file.get('file_hash'),
+                        suffix=os.path.splitext(input_file.get('file_name') or "")[1]
+                    )
+                    if isinstance(input_data, DownloadedFile):
+                        downloaded_file = input_data
                     
                     if input_data is None:
                         bt.logging.error(f"❌ Failed to download input file for task {task_id}")
@@ -1025,8 +1257,8 @@ Report generated automatically by Bittensor Miner
                     bt.logging.info(f"📥 Downloaded {input_size} bytes for task {task_id}")
                 
                 # Validate input data type
-                if task_type == "transcription" and not isinstance(input_data, bytes):
-                    bt.logging.error(f"❌ Invalid input data type for transcription task {task_id}: expected bytes, got {type(input_data)}")
+                if task_type == "transcription" and not isinstance(input_data, (bytes, DownloadedFile)):
+                    bt.logging.error(f"❌ Invalid input data type for transcription task {task_id}: expected bytes or file, got {type(input_data)}")
                     return
                 
                 # Get miner UID for logging
@@ -1105,6 +1337,10 @@ Report generated automatically by Bittensor Miner
                     return
                 
             finally:
+                # Remove streamed input from disk
+                if downloaded_file is not None:
+                    downloaded_file.cleanup()
+                
                 # 🔒 DUPLICATE PROTECTION: Atomic task completion marking
                 with self.task_processing_lock:
                     self.processing_tasks.discard(task_id)
@@ -1128,54 +1364,103 @@ Report generated automatically by Bittensor Miner
             headers["X-API-Key"] = self.miner_api_key
         return headers
     
-    async def download_file_from_proxy(self, file_url: str):
-        """Download input file from proxy server"""
+    async def _fetch_input_file(self, url: str, headers: Optional[dict] = None, file_id: Optional[str] = None,
+                                expected_size: Optional[int] = None, expected_sha256: Optional[str] = None,
+                                suffix: str = "", timeout: float = 120.0) -> DownloadedFile:
+        """Get an input file from the input cache, or stream it from the given URL and cache it"""
+        if self.input_cache is not None:
+            cached = self.input_cache.get(file_hash=expected_sha256, file_id=file_id)
+            if cached is not None:
+                bt.logging.info(f"♻️ Input cache hit for {file_id or cached.sha256[:16]} ({cached.size} bytes)")
+                return cached
+        
+        downloaded = await stream_download(
+            self.http_client,
+            url,
+            max_bytes=self.max_download_bytes,
+            headers=headers,
+            timeout=timeout,
+            expected_size=expected_size,
+            expected_sha256=expected_sha256,
+            suffix=suffix
+        )
+        
+        if self.input_cache is not None:
+            try:
+                self.input_cache.put(downloaded, file_id=file_id)
+            except Exception as e:
+                bt.logging.warning(f"⚠️ Failed to cache input {file_id}: {e}")
+        
+        return downloaded
+    
+    async def download_file_from_proxy(self, file_url: str, to_file: bool = False,
+                                       file_id: Optional[str] = None,
+                                       expected_size: Optional[int] = None,
+                                       expected_sha256: Optional[str] = None,
+                                       suffix: str = ""):
+        """
+        Download input file from proxy server.
+        
+        The input cache is checked first (by file hash or file_id); otherwise the response
+        is streamed to a temporary file (size-capped and verified) instead of being buffered
+        in memory. With to_file=True binary inputs are returned as a DownloadedFile
+        (path-like, caller cleans up); otherwise bytes/text are returned.
+        """
+        downloaded = None
         try:
             bt.logging.info(f"📥 Downloading file from: {file_url}")
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                headers = self._get_auth_headers()
-                response = await client.get(file_url, headers=headers)
-                response.raise_for_status()
-                
-                # Log response details for debugging
-                content_type = response.headers.get("content-type", "")
-                content_length = response.headers.get("content-length", "unknown")
-                bt.logging.info(f"📥 Response received:")
-                bt.logging.info(f"   Status: {response.status_code}")
-                bt.logging.info(f"   Content-Type: {content_type}")
-                bt.logging.info(f"   Content-Length: {content_length}")
-                bt.logging.info(f"   Response size: {len(response.content)} bytes")
-                
-                # Check if we got any content
-                if len(response.content) == 0:
-                    bt.logging.error(f"❌ Downloaded file is empty (0 bytes)")
-                    return None
-                
-                # For audio files or binary files - be more permissive
-                if (content_type.startswith("audio/") or 
-                    "octet-stream" in content_type or 
-                    "wav" in content_type.lower() or 
-                    "mp3" in content_type.lower() or
-                    "m4a" in content_type.lower() or
-                    "flac" in content_type.lower() or
-                    file_url.lower().endswith(('.wav', '.mp3', '.m4a', '.flac'))):
-                    
-                    bt.logging.info(f"✅ Detected audio file: {len(response.content)} bytes")
-                    return response.content  # Binary audio data
-                
-                # For text files
-                elif content_type.startswith("text/") or "json" in content_type:
-                    bt.logging.info(f"✅ Detected text file: {len(response.content)} bytes")
-                    return response.text
-                
+            downloaded = await self._fetch_input_file(
+                file_url,
+                headers=self._get_auth_headers(),
+                file_id=file_id,
+                expected_size=expected_size,
+                expected_sha256=expected_sha256,
+                suffix=suffix
+            )
+            
+            # Log response details for debugging
+            content_type = downloaded.content_type
+            bt.logging.info(f"📥 Download complete:")
+            bt.logging.info(f"   Content-Type: {content_type}")
+            bt.logging.info(f"   Size: {downloaded.size} bytes")
+            bt.logging.info(f"   SHA256: {downloaded.sha256[:16]}...")
+            
+            # Check if we got any content
+            if downloaded.size == 0:
+                bt.logging.error(f"❌ Downloaded file is empty (0 bytes)")
+                return None
+            
+            # For text files
+            if content_type.startswith("text/") or "json" in content_type:
+                bt.logging.info(f"✅ Detected text file: {downloaded.size} bytes")
+                return downloaded.read_text()
+            
+            # For audio files or binary files - be more permissive
+            if (content_type.startswith("audio/") or 
+                "octet-stream" in content_type or 
+                "wav" in content_type.lower() or 
+                "mp3" in content_type.lower() or
+                "m4a" in content_type.lower() or
+                "flac" in content_type.lower() or
+                file_url.lower().endswith(('.wav', '.mp3', '.m4a', '.flac'))):
+                bt.logging.info(f"✅ Detected audio file: {downloaded.size} bytes")
+            else:
                 # Default case - treat as binary if we have content
-                else:
-                    bt.logging.info(f"⚠️ Unknown content type '{content_type}', treating as binary: {len(response.content)} bytes")
-                    return response.content
+                bt.logging.info(f"⚠️ Unknown content type '{content_type}', treating as binary: {downloaded.size} bytes")
+            
+            if to_file:
+                # Hand ownership of the file to the caller
+                result, downloaded = downloaded, None
+                return result
+            
+            return downloaded.read_bytes()  # Binary data
                 
+        except DownloadError as e:
+            bt.logging.error(f"❌ Rejected download from {file_url}: {e}")
+            return None
         except httpx.HTTPStatusError as e:
-            bt.logging.error(f"❌ HTTP error downloading file: {e.response.status_code} - {e.response.text}")
+            bt.logging.error(f"❌ HTTP error downloading file: {e.response.status_code}")
             return None
         except httpx.TimeoutException:
             bt.logging.error(f"❌ Timeout downloading file from {file_url}")
@@ -1186,6 +1471,9 @@ Report generated automatically by Bittensor Miner
         except Exception as e:
             bt.logging.error(f"❌ Failed to download file from {file_url}: {e}")
             return None
+        finally:
+            if downloaded is not None:
+                downloaded.cleanup()
 
     async def extract_text_data(self, task_data: dict) -> Optional[str]:
         """Extract text data from task data"""
@@ -1242,7 +1530,7 @@ Report generated automatically by Bittensor Miner
             bt.logging.info(f"📡 Fetching summarization task content from proxy API for task {task_id}")
             
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
+                async with self.http_client.session(timeout=10.0) as client:
                     headers = self._get_auth_headers()
                     response = await client.get(f"{self.proxy_server_url}/api/v1/miner/summarization/{task_id}", headers=headers)
                     
@@ -1325,7 +1613,8 @@ Report generated automatically by Bittensor Miner
                         "source_language": source_lang,
                         "detected_language": source_lang,  # Use source language directly
                         "language_confidence": 1.0,  # Always 1.0 since user specified the language
-                        "voice_info": voice_info
+                        "voice_info": voice_info,
+                        "output_format": (task_data.get("user_metadata") or {}).get("output_format", "wav")
                     }
                 else:
                     # No voice_name or speaker_wav_url - fall through to API fetch
@@ -1335,7 +1624,7 @@ Report generated automatically by Bittensor Miner
             bt.logging.info(f"📡 Fetching TTS task content from proxy API for task {task_id}")
             
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with self.http_client.session(timeout=30.0) as client:
                     headers = self._get_auth_headers()
                     response = await client.get(f"{self.proxy_server_url}/api/v1/miner/tts/{task_id}", headers=headers)
                     
@@ -1381,7 +1670,8 @@ Report generated automatically by Bittensor Miner
                                 "detected_language": text_content.get("source_language", "en"),  # Use source language directly
                                 "language_confidence": 1.0,  # Always 1.0 since user specified the language
                                 "voice_info": voice_info,
-                                "task_metadata": task_metadata
+                                "task_metadata": task_metadata,
+                                "output_format": task_metadata.get("output_format", "wav")
                             }
                         else:
                             bt.logging.error(f"❌ Proxy API returned error: {response_data}")
@@ -1398,33 +1688,29 @@ Report generated automatically by Bittensor Miner
             bt.logging.error(f"❌ Error extracting TTS data: {e}")
             return None
     
-    async def process_transcription_task(self, audio_data: bytes, model_id: Optional[str] = None, language: str = "en"):
+    async def process_transcription_task(self, audio_data, model_id: Optional[str] = None, language: str = "en"):
         """Process transcription task using pipeline with specified model and language"""
         try:
-            # Get pipeline with specified model (loads on-demand)
-            bt.logging.info(f"🔄 Loading transcription pipeline with model: {model_id or 'default'}")
-            pipeline = self.pipeline_manager.get_transcription_pipeline(model_id)
-            if pipeline is None:
-                raise Exception("Transcription pipeline not available")
-            
-            # Validate input data
-            if not isinstance(audio_data, bytes):
-                raise Exception(f"Invalid audio data type: expected bytes, got {type(audio_data)}")
+            # Validate input data (raw bytes or a streamed download on disk)
+            if not isinstance(audio_data, (bytes, DownloadedFile)):
+                raise Exception(f"Invalid audio data type: expected bytes or file, got {type(audio_data)}")
             
             if len(audio_data) == 0:
                 raise Exception("Audio data is empty")
             
-            # Validate and normalize language code
+            # Normalize language code (unsupported languages are handled by the pipeline)
             language = language.lower() if language else "en"
-            supported_languages = pipeline.language_codes.keys()
-            if language not in supported_languages:
-                bt.logging.warning(f"⚠️ Language '{language}' may not be fully supported, using anyway")
             
             bt.logging.info(f"🎵 Processing {len(audio_data)} bytes of audio data in language: {language}...")
             
-            # Process audio data with specified language
-            transcribed_text, processing_time = pipeline.transcribe(
-                audio_data, language=language
+            # Files are passed by path so the audio is decoded in the worker without an extra copy
+            audio_input = audio_data.path if isinstance(audio_data, DownloadedFile) else audio_data
+            
+            # Process audio data with specified language (pipeline loads on-demand in the worker)
+            bt.logging.info(f"🔄 Running transcription pipeline with model: {model_id or 'default'}")
+            transcribed_text, processing_time = await self.inference_executor.run_pipeline(
+                self.pipeline_manager, 'transcription', model_id, 'transcribe',
+                audio_input, language=language
             )
             
             bt.logging.info(f"✅ Transcription completed: {len(transcribed_text)} characters in {processing_time:.2f}s")
@@ -1632,12 +1918,6 @@ Report generated automatically by Bittensor Miner
     async def process_summarization_task(self, summarization_data: dict, model_id: Optional[str] = None):
         """Process summarization task using pipeline with specified model (loads on-demand)"""
         try:
-            # Get pipeline with specified model (loads on-demand)
-            bt.logging.info(f"🔄 Loading summarization pipeline with model: {model_id or 'default'}")
-            pipeline = self.pipeline_manager.get_summarization_pipeline(model_id)
-            if pipeline is None:
-                raise Exception("Summarization pipeline not available")
-            
             # Extract text and language information
             text = summarization_data.get("text", "")
             source_language = summarization_data.get("source_language", "en")
@@ -1661,10 +1941,17 @@ Report generated automatically by Bittensor Miner
             # Use the source language directly since user specified it
             processing_language = source_language
             
-            # Process text data with language support
-            summary_text, processing_time = pipeline.summarize(
-                text, language=processing_language
-            )
+            # Process text data with language support (pipeline loads on-demand in the worker)
+            bt.logging.info(f"🔄 Running summarization pipeline with model: {model_id or 'default'}")
+            if self.micro_batcher is not None:
+                summary_text, processing_time = await self.micro_batcher.submit(
+                    'summarization', model_id, text, language=processing_language
+                )
+            else:
+                summary_text, processing_time = await self.inference_executor.run_pipeline(
+                    self.pipeline_manager, 'summarization', model_id, 'summarize',
+                    text, language=processing_language
+                )
             
             return {
                 "summary": summary_text,
@@ -1701,6 +1988,45 @@ Report generated automatically by Bittensor Miner
             }
             return error_result
 
+    async def _synthesize_with_speaker(self, tts, text: str, language: str, speaker_wav_path: str,
+                                       speaker_key: Optional[str], tts_model_id: str, output_path: str):
+        """
+        Synthesize speech cloned from a speaker WAV into output_path.
+        
+        For models exposing conditioning latents (XTTS), the latents are computed once per voice
+        and model and kept in the speaker cache; other models fall back to tts_to_file.
+        """
+        tts_model = getattr(getattr(tts, 'synthesizer', None), 'tts_model', None)
+        if tts_model is None or not hasattr(tts_model, 'get_conditioning_latents') or not hasattr(tts_model, 'inference'):
+            await self.inference_executor.run(
+                'tts', tts.tts_to_file,
+                text=text,
+                file_path=output_path,
+                speaker_wav=speaker_wav_path,
+                language=language
+            )
+            return
+        
+        latents = self.speaker_cache.get_latents(speaker_key, tts_model_id) if speaker_key else None
+        if latents is None:
+            conditioning_start = time.time()
+            latents = await self.inference_executor.run(
+                'tts', tts_model.get_conditioning_latents, audio_path=[speaker_wav_path]
+            )
+            bt.logging.info(f"   Computed speaker conditioning in {time.time() - conditioning_start:.2f}s")
+            if speaker_key:
+                self.speaker_cache.set_latents(speaker_key, tts_model_id, latents)
+        else:
+            bt.logging.info(f"♻️ Using cached speaker conditioning")
+        
+        gpt_cond_latent, speaker_embedding = latents
+        output = await self.inference_executor.run(
+            'tts', tts_model.inference,
+            text, language, gpt_cond_latent, speaker_embedding,
+            enable_text_splitting=True
+        )
+        await self.inference_executor.run('tts', tts.synthesizer.save_wav, output["wav"], output_path)
+    
     async def process_tts_task(self, tts_data: dict, model_id: Optional[str] = None):
         """Process TTS task using new Coqui TTS API with speaker cloning"""
         try:
@@ -1778,6 +2104,7 @@ Report generated automatically by Bittensor Miner
             detected_language = tts_data.get("detected_language", "en")
             language_confidence = tts_data.get("language_confidence", 1.0)
             voice_info = tts_data.get("voice_info", {})
+            output_format = tts_data.get("output_format") or "wav"
             
             # Get model_id from parameter, voice_info, or default fallback
             # Handle None, empty string, or missing values
@@ -1800,6 +2127,7 @@ Report generated automatically by Bittensor Miner
             bt.logging.info(f"   Text length: {len(text) if isinstance(text, str) else 'N/A'}")
             bt.logging.info(f"   Source language: {source_language}")
             bt.logging.info(f"   Model ID: {tts_model_id}")
+            bt.logging.info(f"   Output format: {output_format}")
             bt.logging.info(f"   Speaker WAV URL: {speaker_wav_url if speaker_wav_url else 'None'}")
             
             if not text:
@@ -1811,20 +2139,38 @@ Report generated automatically by Bittensor Miner
             if not speaker_wav_url:
                 raise Exception("No speaker_wav_url provided for voice cloning")
             
-            # Download speaker audio from R2
-            bt.logging.info(f"📥 Downloading speaker audio from: {speaker_wav_url}")
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                speaker_response = await client.get(speaker_wav_url)
-                if speaker_response.status_code != 200:
-                    raise Exception(f"Failed to download speaker audio: HTTP {speaker_response.status_code}")
-                speaker_audio_data = speaker_response.content
-            
-            # Save speaker audio to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as speaker_file:
-                speaker_file.write(speaker_audio_data)
-                speaker_wav_path = speaker_file.name
-            
-            bt.logging.info(f"✅ Speaker audio downloaded: {len(speaker_audio_data)} bytes")
+            # Reuse the cached speaker audio for this voice if we have it
+            voice_name = (voice_info.get("voice_name") if voice_info else None) or tts_data.get("voice_name") or "default"
+            speaker_file = None
+            speaker_key = self.speaker_cache.resolve(voice_name, speaker_wav_url) if self.speaker_cache else None
+            if speaker_key:
+                speaker_wav_path = self.speaker_cache.wav_path(speaker_key)
+                bt.logging.info(f"♻️ Using cached speaker audio for voice '{voice_name}'")
+            else:
+                # Download speaker audio from R2
+                bt.logging.info(f"📥 Downloading speaker audio from: {speaker_wav_url}")
+                # Stream speaker audio straight to a temporary file
+                try:
+                    speaker_file = await stream_download(
+                        self.http_client,
+                        speaker_wav_url,
+                        max_bytes=self.max_download_bytes,
+                        timeout=30.0,
+                        suffix='.wav'
+                    )
+                except httpx.HTTPStatusError as e:
+                    raise Exception(f"Failed to download speaker audio: HTTP {e.response.status_code}")
+                speaker_wav_path = speaker_file.path
+                
+                bt.logging.info(f"✅ Speaker audio downloaded: {speaker_file.size} bytes")
+                
+                if self.speaker_cache:
+                    try:
+                        speaker_key = self.speaker_cache.add(voice_name, speaker_wav_url, speaker_file)
+                        speaker_wav_path = self.speaker_cache.wav_path(speaker_key)
+                        speaker_file = None
+                    except Exception as e:
+                        bt.logging.warning(f"⚠️ Failed to cache speaker audio for voice '{voice_name}': {e}")
             
             # Detect device (GPU or CPU)
             try:
@@ -1851,10 +2197,10 @@ Report generated automatically by Bittensor Miner
                 import inspect
                 sig = inspect.signature(TTS.__init__)
                 if 'device' in sig.parameters:
-                    tts = TTS(tts_model_id, device=device)
+                    tts = await self.inference_executor.run('tts', TTS, tts_model_id, device=device)
                 else:
                     # Fallback to gpu parameter if device not available
-                    tts = TTS(tts_model_id, gpu=(device == "cuda"))
+                    tts = await self.inference_executor.run('tts', TTS, tts_model_id, gpu=(device == "cuda"))
             except ImportError as import_error:
                 # Handle import errors (like LogitsWarper)
                 error_msg = str(import_error)
@@ -1891,7 +2237,7 @@ Report generated automatically by Bittensor Miner
                     raise Exception(f"Python 3.12 compatibility error: {error_msg}. Consider using Python 3.11.")
                 bt.logging.warning(f"⚠️ Could not use device parameter, using gpu: {e}")
                 try:
-                    tts = TTS(tts_model_id, gpu=(device == "cuda"))
+                    tts = await self.inference_executor.run('tts', TTS, tts_model_id, gpu=(device == "cuda"))
                 except Exception as e2:
                     error_msg2 = str(e2)
                     if "ForwardRef._evaluate()" in error_msg2 or "recursive_guard" in error_msg2:
@@ -1917,19 +2263,17 @@ Report generated automatically by Bittensor Miner
                 
                 bt.logging.info(f"🔊 Generating speech with voice cloning...")
                 synthesis_start = time.time()
-                tts.tts_to_file(
-                    text=text,
-                    file_path=output_path,
-                    speaker_wav=speaker_wav_path,
-                    language=source_language
+                await self._synthesize_with_speaker(
+                    tts, text, source_language, speaker_wav_path, speaker_key, tts_model_id, output_path
                 )
                 processing_time = time.time() - synthesis_start
                 
-                # Read generated audio
-                with open(output_path, 'rb') as f:
-                    audio_data = f.read()
+                # Encode the generated WAV on its own worker so synthesis of the next task isn't held up
+                from template.pipelines.audio_encoding import encode_audio_file
+                encoded = await self.inference_executor.run('audio_encoding', encode_audio_file, output_path, output_format)
+                audio_data = encoded.data
                 
-                bt.logging.info(f"✅ Speech generated: {len(audio_data)} bytes in {processing_time:.2f}s")
+                bt.logging.info(f"✅ Speech generated: {len(audio_data)} bytes ({encoded.output_format}) in {processing_time:.2f}s")
             finally:
                 # Critical: Clean up TTS object and free memory to prevent memory corruption
                 try:
@@ -1954,10 +2298,10 @@ Report generated automatically by Bittensor Miner
                 except Exception as cleanup_error:
                     bt.logging.warning(f"⚠️ Error during TTS cleanup: {cleanup_error}")
             
-            # Cleanup temporary files
+            # Cleanup temporary files (cached speaker audio is kept)
             try:
-                if speaker_wav_path and os.path.exists(speaker_wav_path):
-                    os.unlink(speaker_wav_path)
+                if speaker_file is not None:
+                    speaker_file.cleanup()
                 if output_path and os.path.exists(output_path):
                     os.unlink(output_path)
             except Exception as file_cleanup_error:
@@ -1965,7 +2309,7 @@ Report generated automatically by Bittensor Miner
             
             # Generate unique filename for the audio
             import uuid
-            audio_filename = f"{uuid.uuid4().hex[:8]}.wav"
+            audio_filename = f"{uuid.uuid4().hex[:8]}{encoded.extension}"
             
             # Store audio in Firebase Cloud Storage instead of local storage
             try:
@@ -1986,7 +2330,7 @@ Report generated automatically by Bittensor Miner
                 file_id = await file_manager.upload_file(
                     audio_data,
                     audio_filename,
-                    "audio/wav",
+                    encoded.content_type,
                     file_type="tts"
                 )
                 
@@ -2006,7 +2350,7 @@ Report generated automatically by Bittensor Miner
                         "file_id": file_id,
                         "filename": audio_filename,
                         "file_size": len(audio_data),
-                        "file_type": "audio/wav",
+                        "file_type": encoded.content_type,
                         "public_url": public_url,  # R2 public URL
                         "storage_location": "r2"
                     },
@@ -2019,8 +2363,9 @@ Report generated automatically by Bittensor Miner
                     "word_count": len(text.split()),
                     "model_id": tts_model_id,
                     "voice_name": voice_info.get("voice_name"),
+                    "output_format": encoded.output_format,
                     "audio_duration": 0.0,  # Will be calculated by validator
-                    "sample_rate": 22050,   # Default, will be verified by validator
+                    "sample_rate": encoded.sample_rate,
                     "bit_depth": 16,        # Default, will be verified by validator
                     "channels": 1           # Default, will be verified by validator
                 }
@@ -2042,7 +2387,7 @@ Report generated automatically by Bittensor Miner
                         "filename": audio_filename,
                         "local_path": audio_path,
                         "file_size": len(audio_data),
-                        "file_type": "audio/wav"
+                        "file_type": encoded.content_type
                     },
                     "processing_time": processing_time,
                     "text_length": len(text),
@@ -2051,8 +2396,9 @@ Report generated automatically by Bittensor Miner
                     "language_confidence": language_confidence,
                     "processing_language": processing_language,
                     "word_count": len(text.split()),
+                    "output_format": encoded.output_format,
                     "audio_duration": 0.0,  # Will be calculated by validator
-                    "sample_rate": 22050,   # Default, will be verified by validator
+                    "sample_rate": encoded.sample_rate,
                     "bit_depth": 16,        # Default, will be verified by validator
                     "channels": 1           # Default, will be verified by validator
                 }
@@ -2085,19 +2431,13 @@ Report generated automatically by Bittensor Miner
                 "error": error_msg
             }
     
-    async def process_video_transcription_task(self, video_data: bytes, task_data: dict, model_id: Optional[str] = None):
+    async def process_video_transcription_task(self, video_data, task_data: dict, model_id: Optional[str] = None, language: Optional[str] = None):
         """Process video transcription task - extract audio and transcribe"""
         try:
             # Get model_id from task_data if not provided
             if model_id is None:
                 model_id = task_data.get("model_id")
             
-            # Get pipeline with specified model (loads on-demand)
-            bt.logging.info(f"🔄 Loading transcription pipeline with model: {model_id or 'default'} for video transcription")
-            pipeline = self.pipeline_manager.get_transcription_pipeline(model_id)
-            if pipeline is None:
-                raise Exception("Transcription pipeline not available")
-            
             # Import video processing utilities
             try:
                 from template.pipelines.video_utils import video_processor
@@ -2106,34 +2446,71 @@ Report generated automatically by Bittensor Miner
             
             # Get task information
             task_id = task_data.get("task_id", "unknown")
-            source_language = task_data.get("source_language", "en")
+            source_language = task_data.get("source_language") or language or "en"
             filename = task_data.get("input_file", {}).get("file_name", "unknown_video")
             
+            # Streamed downloads are passed to ffmpeg by path instead of being copied to a temp file,
+            # and their sha256 (computed while downloading) keys the probe cache
+            video_input = video_data.path if isinstance(video_data, DownloadedFile) else video_data
+            video_hash = video_data.sha256 if isinstance(video_data, DownloadedFile) else None
+            
             bt.logging.info(f"🎬 Processing video transcription task {task_id}")
             bt.logging.info(f"   Video filename: {filename}")
             bt.logging.info(f"   Video size: {len(video_data)} bytes")
             bt.logging.info(f"   Source language: {source_language}")
             
-            # Extract audio from video
-            bt.logging.info(f"🔧 Extracting audio from video...")
-            audio_bytes, temp_audio_path = video_processor.extract_audio_from_video(
-                video_data, 
-                filename,
-                output_format="wav",
-                sample_rate=16000  # Whisper requirement
+            # Probe the input once (cached by content hash) - duration and streams are reused below
+            media_info = await self.inference_executor.run(
+                'video', video_processor.probe, video_input, filename, content_hash=video_hash
+            )
+            video_info = await self.inference_executor.run(
+                'video', video_processor.get_video_info, video_input, filename, media_info=media_info
             )
-            
-            bt.logging.info(f"✅ Audio extraction successful: {len(audio_bytes)} bytes")
-            
-            # Get video information for metadata
-            video_info = video_processor.get_video_info(video_data, filename)
             bt.logging.info(f"📊 Video info: {video_info}")
             
-            # Transcribe the extracted audio
-            bt.logging.info(f"🎵 Transcribing extracted audio...")
-            transcribed_text, processing_time = pipeline.transcribe(
-                audio_bytes, language=source_language
-            )
+            if self.inference_executor.mode == "thread":
+                # Stream PCM out of ffmpeg and transcribe it as it arrives
+                bt.logging.info(f"🔧 Streaming audio out of video into {model_id or 'default'} transcription...")
+                audio_stream = await self.inference_executor.run(
+                    'video', video_processor.stream_audio,
+                    video_input,
+                    filename,
+                    sample_rate=16000,  # Whisper requirement
+                    media_info=media_info
+                )
+                try:
+                    result = await self.inference_executor.run_pipeline(
+                        self.pipeline_manager, 'transcription', model_id, 'transcribe_stream',
+                        audio_stream, language=source_language, sample_rate=16000,
+                        expected_duration=media_info.duration if media_info else None
+                    )
+                finally:
+                    await self.inference_executor.run('video', audio_stream.close)
+                transcribed_text, processing_time = result.full_text, result.processing_time
+                if result.metadata.get('stages'):
+                    bt.logging.info("⏱️ Transcription stages: " + ", ".join(
+                        f"{name} {stage['time']:.2f}s" for name, stage in result.metadata['stages'].items()
+                    ))
+                audio_size_bytes = audio_stream.samples_read * 2  # 16-bit PCM
+            else:
+                # Worker processes can't consume the stream - extract first, then transcribe
+                bt.logging.info(f"🔧 Extracting audio from video...")
+                audio_bytes, _ = await self.inference_executor.run(
+                    'video', video_processor.extract_audio_from_video,
+                    video_input, 
+                    filename,
+                    output_format="wav",
+                    sample_rate=16000,  # Whisper requirement
+                    media_info=media_info
+                )
+                bt.logging.info(f"✅ Audio extraction successful: {len(audio_bytes)} bytes")
+                
+                bt.logging.info(f"🎵 Transcribing extracted audio with model: {model_id or 'default'}...")
+                transcribed_text, processing_time = await self.inference_executor.run_pipeline(
+                    self.pipeline_manager, 'transcription', model_id, 'transcribe',
+                    audio_bytes, language=source_language
+                )
+                audio_size_bytes = len(audio_bytes)
             
             bt.logging.info(f"✅ Transcription completed: {len(transcribed_text)} characters in {processing_time:.2f}s")
             
@@ -2147,7 +2524,7 @@ Report generated automatically by Bittensor Miner
                 "language": source_language,
                 "video_info": video_info,
                 "audio_extraction_success": True,
-                "audio_size_bytes": len(audio_bytes),
+                "audio_size_bytes": audio_size_bytes,
                 "transcript_length": len(transcribed_text),
                 "word_count": len(transcribed_text.split()),
                 "source_language": source_language
@@ -2238,7 +2615,11 @@ Report generated automatically by Bittensor Miner
                     return
                 
                 # Download the document file from proxy
-                input_data = await self.download_file_from_proxy(f"{self.proxy_server_url}/api/v1/files/{file_id}/download")
+                input_data = await self.download_file_from_proxy(
+                    f"{self.proxy_server_url}/api/v1/files/{file_id}/download",
+                    file_id=file_id,
+                    expected_sha256=input_file.get('file_hash')
+                )
                 
                 if input_data is None:
                     bt.logging.error(f"❌ Failed to download document file for task {task_id}")
@@ -2326,7 +2707,7 @@ Report generated automatically by Bittensor Miner
             # If not in task_data, try to fetch from proxy API
             bt.logging.info(f"🔍 Fetching text translation data from proxy API for task {task_id}")
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self.http_client.session(timeout=30.0) as client:
                 headers = self._get_auth_headers()
                 response = await client.get(f"{self.proxy_server_url}/api/v1/miner/text-translation/{task_id}", headers=headers)
                 
@@ -2369,7 +2750,7 @@ Report generated automatically by Bittensor Miner
             # If not in task_data, try to fetch from proxy API
             bt.logging.info(f"🔍 Fetching document translation data from proxy API for task {task_id}")
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self.http_client.session(timeout=30.0) as client:
                 headers = self._get_auth_headers()
                 response = await client.get(f"{self.proxy_server_url}/api/v1/miner/document-translation/{task_id}", headers=headers)
                 
@@ -2397,12 +2778,6 @@ Report generated automatically by Bittensor Miner
     async def process_text_translation(self, translation_data: dict, model_id: Optional[str] = None) -> dict:
         """Process text translation using translation pipeline with specified model or default"""
         try:
-            # Get pipeline with specified model (loads on-demand)
-            bt.logging.info(f"🔄 Loading translation pipeline with model: {model_id or 'default'} for text translation")
-            pipeline = self.pipeline_manager.get_translation_pipeline(model_id)
-            if pipeline is None:
-                raise Exception("Translation pipeline not available")
-            
             # Extract translation parameters
             text = translation_data.get("text", "")
             source_language = translation_data.get("source_language", "en")
@@ -2415,10 +2790,18 @@ Report generated automatically by Bittensor Miner
             if not text:
                 raise Exception("No text provided for translation")
             
-            # Process text translation
-            translated_text, processing_time = pipeline.translate_text(
-                text, source_language, target_language
-            )
+            # Process text translation (pipeline loads on-demand in the worker)
+            bt.logging.info(f"🔄 Running translation pipeline with model: {model_id or 'default'} for text translation")
+            if self.micro_batcher is not None:
+                translated_text, processing_time = await self.micro_batcher.submit(
+                    'translation', model_id, text,
+                    source_language=source_language, target_language=target_language
+                )
+            else:
+                translated_text, processing_time = await self.inference_executor.run_pipeline(
+                    self.pipeline_manager, 'translation', model_id, 'translate_text',
+                    text, source_language, target_language
+                )
             
             return {
                 "translated_text": translated_text,
@@ -2448,12 +2831,6 @@ Report generated automatically by Bittensor Miner
     async def process_document_translation(self, document_data, translation_data: dict, model_id: Optional[str] = None) -> dict:
         """Process document translation using translation pipeline with specified model or default"""
         try:
-            # Get pipeline with specified model (loads on-demand)
-            bt.logging.info(f"🔄 Loading translation pipeline with model: {model_id or 'default'} for document translation")
-            pipeline = self.pipeline_manager.get_translation_pipeline(model_id)
-            if pipeline is None:
-                raise Exception("Translation pipeline not available")
-            
             # Extract translation parameters
             filename = translation_data.get("filename", "unknown")
             source_language = translation_data.get("source_language", "en")
@@ -2467,8 +2844,10 @@ Report generated automatically by Bittensor Miner
             if not document_data:
                 raise Exception("No document data provided for translation")
             
-            # Process document translation
-            translated_text, processing_time, metadata = pipeline.translate_document(
+            # Process document translation (pipeline loads on-demand in the worker)
+            bt.logging.info(f"🔄 Running translation pipeline with model: {model_id or 'default'} for document translation")
+            translated_text, processing_time, metadata = await self.inference_executor.run_pipeline(
+                self.pipeline_manager, 'translation', model_id, 'translate_document',
                 document_data, filename, source_language, target_language
             )
             
@@ -2517,7 +2896,7 @@ Report generated automatically by Bittensor Miner
             
             bt.logging.info(f"📤 Submitting text translation result to proxy server for task {task_id}")
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http_client.session(timeout=10.0) as client:
                 headers = self._get_auth_headers()
                 response = await client.post(callback_url, headers=headers, data=form_data)
                 
@@ -2550,7 +2929,7 @@ Report generated automatically by Bittensor Miner
             
             bt.logging.info(f"📤 Submitting document translation result to proxy server for task {task_id}")
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http_client.session(timeout=10.0) as client:
                 headers = self._get_auth_headers()
                 response = await client.post(callback_url, headers=headers, data=form_data)
                 
@@ -2596,7 +2975,7 @@ Report generated automatically by Bittensor Miner
             bt.logging.info(f"   Accuracy Score: {response_payload['accuracy_score']:.2f}")
             bt.logging.info(f"   Speed Score: {response_payload['speed_score']:.2f}")
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self.http_client.session(timeout=10.0) as client:
                 headers = self._get_auth_headers()
                 # Convert to Form data as expected by proxy
                 form_data = {
@@ -2717,13 +3096,7 @@ Report generated automatically by Bittensor Miner
         except Exception as e:
             bt.logging.debug(f"⚠️ Error logging query info: {e}")
         
-        # ALWAYS process proxy tasks when any request comes in (background task)
-        if hasattr(self, 'uid') and self.uid > 0:
-            try:
-                # Don't await - let it run in background so we can respond quickly
-                asyncio.create_task(self.query_proxy_for_tasks())
-            except Exception as e:
-                bt.logging.debug(f"⚠️ Failed to query proxy for tasks: {e}")
+        # Proxy tasks arrive through the background task feed, so no polling is needed here
         
         # Check if this is a handshake/connectivity test
         # Handshake uses summarization task with small test text
@@ -2849,6 +3222,67 @@ Report generated automatically by Bittensor Miner
             synapse.pipeline_model = "error"
             return synapse
 
+    async def forward_tts_stream(self, synapse: TTSStream) -> TTSStream:
+        """
+        Handle streaming TTS queries: synthesize sentence by sentence and stream the audio
+        (a WAV header, then 16-bit PCM blocks) while the rest of the text is still rendering.
+        
+        The first sentence is synthesized before the response starts, so a failure before any
+        audio exists is raised as an error response rather than streamed as an empty WAV.
+        
+        Args:
+            synapse (TTSStream): The streaming synapse with the text to synthesize.
+        
+        Returns:
+            TTSStream: The streaming response.
+        """
+        from template.pipelines.tts_pipeline import streaming_wav_header
+        
+        bt.logging.info(f"🎵 Streaming TTS query: {len(synapse.text)} characters, language={synapse.language}")
+        start_time = time.time()
+        
+        # The generator is advanced on the TTS pool so synthesis never blocks the axon's event loop
+        tts = await self.inference_executor.run('tts', self.pipeline_manager.get_tts_pipeline, synapse.pipeline_model)
+        if tts is None:
+            raise Exception("TTS pipeline not available")
+        blocks = tts.synthesize_stream(synapse.text, language=synapse.language, speaker=synapse.speaker)
+        first_block = await self.inference_executor.run('tts', next, blocks, None)
+        if first_block is None:
+            raise Exception("TTS produced no audio")
+        bt.logging.info(f"🎵 First audio block ready after {time.time() - start_time:.2f}s")
+        
+        async def _stream(send):
+            await send({"type": "http.response.body", "body": streaming_wav_header(tts.sample_rate), "more_body": True})
+            await send({"type": "http.response.body", "body": first_block, "more_body": True})
+            block_count = 1
+            try:
+                while True:
+                    block = await self.inference_executor.run('tts', next, blocks, None)
+                    if block is None:
+                        break
+                    block_count += 1
+                    await send({"type": "http.response.body", "body": block, "more_body": True})
+            except Exception as e:
+                bt.logging.error(f"❌ Streaming TTS failed after {block_count} audio blocks: {e}")
+                # Abort the response instead of ending it, so a truncated WAV isn't taken as complete
+                raise
+            bt.logging.info(f"✅ Streamed {block_count} audio blocks in {time.time() - start_time:.2f}s")
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        
+        return synapse.create_streaming_response(_stream)
+    
+    async def blacklist_tts_stream(
+        self, synapse: TTSStream
+    ) -> typing.Tuple[bool, str]:
+        """Blacklist check for streaming TTS queries (same policy as blacklist)"""
+        return await self.blacklist(synapse)
+    
+    async def priority_tts_stream(
+        self, synapse: TTSStream
+    ) -> float:
+        """Priority for streaming TTS queries (same policy as priority)"""
+        return await self.priority(synapse)
+    
     async def blacklist(
         self, synapse: AudioTask
     ) -> typing.Tuple[bool, str]:
@@ -2970,10 +3404,10 @@ Report generated automatically by Bittensor Miner
             bt.logging.info(f"   File size: {len(audio_content)} bytes")
             
             # Prepare form data for TTS upload
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self.http_client.session(timeout=30.0) as client:
                 # Prepare form data
                 files = {
-                    'audio_file': (audio_file.get('filename'), audio_content, 'audio/wav')
+                    'audio_file': (audio_file.get('filename'), audio_content, audio_file.get('file_type') or 'audio/wav')
                 }
                 
                 data = {
@@ -3066,9 +3500,6 @@ Report generated automatically by Bittensor Miner
 # This is the main function, which runs the miner.
 if __name__ == "__main__":
     with Miner() as miner:
-        last_task_check = 0
-        task_check_interval = 10  # Check for tasks every 10 seconds
-        
         # Run initial tests (optional - will skip gracefully if no data available)
         try:
             import asyncio
@@ -3086,24 +3517,10 @@ if __name__ == "__main__":
             # Don't log as warning - tests are optional and failures are expected
             bt.logging.debug(f"Initial tests skipped: {e}")
         
+        # Proxy tasks are handled by the background task feed started in Miner.__init__
         while True:
             current_time = time.time()
             
-            # Check for proxy tasks periodically
-            if current_time - last_task_check >= task_check_interval:
-                try:
-                    # Create a new event loop for task processing
-                    import asyncio
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        loop.run_until_complete(miner.query_proxy_for_tasks())
-                    finally:
-                        loop.close()
-                    last_task_check = current_time
-                except Exception as e:
-                    bt.logging.warning(f"⚠️ Main loop task check error: {e}")
-            
             # Log less frequently to reduce console spam
             if int(current_time) % 60 == 0:  # Only log every minute
                 bt.logging.info(f"Miner running... {current_time}")
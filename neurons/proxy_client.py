@@ -0,0 +1,217 @@
+"""
+Proxy HTTP Client for Miner
+One long-lived, pooled (HTTP/2 when available) httpx client per miner with retry/backoff,
+so miner-to-proxy requests reuse connections instead of paying a TCP+TLS handshake each time.
+"""
+
+import asyncio
+import random
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+import httpx
+import bittensor as bt
+
+
+def _http2_available() -> bool:
+    """HTTP/2 support in httpx requires the optional h2 package"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class ProxyHTTPClient:
+    """Shared keep-alive HTTP client with retry/backoff for miner-to-proxy traffic"""
+
+    # Status codes worth retrying (proxy restarting / overloaded / behind a load balancer)
+    RETRY_STATUS_CODES = {502, 503, 504}
+
+    # Methods that are safe to retry after the request may have reached the server
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    # Errors raised before the request was sent - safe to retry for any method
+    CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 8.0,
+        default_timeout: float = 30.0,
+    ):
+        """
+        Initialize proxy HTTP client
+
+        Args:
+            max_connections: Maximum open connections per event loop
+            max_keepalive_connections: Idle connections kept alive for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Use HTTP/2 if the h2 package is installed
+            max_retries: Retries after the first attempt
+            backoff_factor: Base delay for exponential backoff (seconds)
+            max_backoff: Upper bound for a single backoff delay (seconds)
+            default_timeout: Default request timeout (seconds)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _http2_available()
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.default_timeout = default_timeout
+
+        # httpx clients are bound to the event loop they were first used on,
+        # so keep one client per loop (in practice the task feed loop owns almost all traffic)
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.requests_sent = 0
+        self.retries = 0
+        self.failures = 0
+        self.clients_created = 0
+
+        if http2 and not self.http2:
+            bt.logging.info("ℹ️ h2 package not installed, proxy client using HTTP/1.1 keep-alive")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the client for the running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                # Drop clients whose loops are gone
+                for stale_loop in [lp for lp in self._clients if lp.is_closed()]:
+                    del self._clients[stale_loop]
+
+                client = httpx.AsyncClient(
+                    http2=self.http2,
+                    limits=self.limits,
+                    timeout=httpx.Timeout(self.default_timeout, connect=10.0),
+                )
+                self._clients[loop] = client
+                self.clients_created += 1
+            return client
+
+    def _backoff_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Exponential backoff with jitter, honoring a numeric Retry-After header"""
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        delay = self.backoff_factor * (2 ** attempt)
+        return min(delay, self.max_backoff) + random.uniform(0, self.backoff_factor)
+
+    async def request(self, method: str, url: str, *, retries: Optional[int] = None, **kwargs) -> httpx.Response:
+        """
+        Send a request with retry/backoff.
+
+        Idempotent methods are retried on transport errors and 502/503/504 responses;
+        other methods only when the connection could not be established.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            retries: Override max_retries for this request
+            **kwargs: Passed through to httpx (headers, params, data, files, timeout, ...)
+
+        Returns:
+            httpx.Response of the last attempt
+        """
+        method = method.upper()
+        max_retries = self.max_retries if retries is None else retries
+        idempotent = method in self.IDEMPOTENT_METHODS
+        client = self._get_client()
+
+        for attempt in range(max_retries + 1):
+            self.requests_sent += 1
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                retryable = isinstance(e, self.CONNECT_ERRORS) or idempotent
+                if not retryable or attempt >= max_retries:
+                    self.failures += 1
+                    raise
+                delay = self._backoff_delay(attempt)
+                bt.logging.debug(f"🔁 {method} {url} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or not idempotent or attempt >= max_retries:
+                    return response
+                delay = self._backoff_delay(attempt, response)
+                bt.logging.debug(f"🔁 {method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        """Stream a response body over the shared connection pool (no retries)"""
+        self.requests_sent += 1
+        async with self._get_client().stream(method, url, **kwargs) as response:
+            yield response
+
+    @asynccontextmanager
+    async def session(self, timeout: Optional[float] = None):
+        """
+        Drop-in replacement for `async with httpx.AsyncClient(timeout=...) as client`
+        that reuses the shared pool instead of opening new connections.
+        """
+        yield _ProxySession(self, timeout)
+
+    async def aclose(self):
+        """Close the client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client statistics"""
+        return {
+            'http2': self.http2,
+            'open_clients': len(self._clients),
+            'clients_created': self.clients_created,
+            'requests_sent': self.requests_sent,
+            'retries': self.retries,
+            'failures': self.failures,
+            'max_connections': self.limits.max_connections,
+            'max_keepalive_connections': self.limits.max_keepalive_connections,
+        }
+
+
+class _ProxySession:
+    """Per-call view of ProxyHTTPClient with a default timeout"""
+
+    def __init__(self, client: ProxyHTTPClient, timeout: Optional[float]):
+        self._client = client
+        self._timeout = timeout
+
+    def _with_timeout(self, kwargs: dict) -> dict:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        return kwargs
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self._client.get(url, **self._with_timeout(kwargs))
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self._client.post(url, **self._with_timeout(kwargs))
+
+    def stream(self, method: str, url: str, **kwargs):
+        return self._client.stream(method, url, **self._with_timeout(kwargs))
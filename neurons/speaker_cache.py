@@ -0,0 +1,193 @@
+"""
+Speaker Cache for Miner TTS
+Keeps voice-cloning reference WAVs on disk and the TTS model's speaker conditioning
+(GPT conditioning latents + speaker embedding) in memory, so repeat requests for a voice
+skip both the download and the conditioning step.
+"""
+
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import bittensor as bt
+
+try:
+    from file_downloader import DownloadedFile
+except ImportError:
+    from neurons.file_downloader import DownloadedFile
+
+
+class SpeakerCache:
+    """LRU cache of speaker WAVs and conditioning latents keyed by voice name + content hash"""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str, max_entries: int = 32, url_ttl: float = 3600.0):
+        """
+        Initialize speaker cache
+
+        Args:
+            cache_dir: Directory holding cached speaker WAVs
+            max_entries: Maximum number of cached voices (least recently used are evicted)
+            url_ttl: Seconds a speaker_wav_url is trusted to map to the same content before
+                     it is downloaded and hashed again (catches re-uploaded voices)
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.url_ttl = url_ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # "voice_name:sha256" -> {'voice_name', 'sha256', 'file', 'size'}, in LRU order (oldest first)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # (voice_name, speaker_wav_url) -> (key, resolved_at)
+        self._urls: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        # key -> {model_id: conditioning latents} (in memory only - they depend on the loaded model)
+        self._latents: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.download_hits = 0
+        self.download_misses = 0
+        self.latent_hits = 0
+        self.latent_misses = 0
+        self.evictions = 0
+
+        self._load_index()
+        bt.logging.info(f"✅ SpeakerCache initialized: {len(self._entries)}/{max_entries} voices in {cache_dir}")
+
+    @staticmethod
+    def make_key(voice_name: str, sha256: str) -> str:
+        return f"{voice_name}:{sha256}"
+
+    def _load_index(self):
+        """Restore cached WAVs from a previous run (URL mappings are re-validated on first use)"""
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+
+        for key, entry in index.get('entries', []):
+            path = os.path.join(self.cache_dir, entry.get('file', ''))
+            if os.path.isfile(path) and os.path.getsize(path) == entry.get('size'):
+                self._entries[key] = entry
+
+        known = {entry['file'] for entry in self._entries.values()} | {self.INDEX_FILE}
+        for name in os.listdir(self.cache_dir):
+            if name not in known:
+                try:
+                    os.unlink(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+        self._evict()
+
+    def _save_index(self):
+        """Persist the index (called with the lock held)"""
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        temp_path = index_path + ".tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump({'entries': list(self._entries.items())}, f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            bt.logging.warning(f"⚠️ Failed to save speaker cache index: {e}")
+
+    def _evict(self):
+        """Evict least recently used voices until within max_entries (called with the lock held)"""
+        while len(self._entries) > self.max_entries:
+            key, entry = self._entries.popitem(last=False)
+            self._latents.pop(key, None)
+            self.evictions += 1
+            try:
+                os.unlink(os.path.join(self.cache_dir, entry['file']))
+            except OSError:
+                pass
+            bt.logging.debug(f"🧹 Evicted cached voice {entry['voice_name']}")
+        self._urls = {k: v for k, v in self._urls.items() if v[0] in self._entries}
+
+    def resolve(self, voice_name: str, speaker_wav_url: str) -> Optional[str]:
+        """
+        Look up a voice by name and URL.
+
+        Returns:
+            Cache key if the WAV is cached and the URL mapping is still fresh, None otherwise
+        """
+        with self._lock:
+            mapping = self._urls.get((voice_name, speaker_wav_url))
+            if mapping is None or time.time() - mapping[1] > self.url_ttl or mapping[0] not in self._entries:
+                self.download_misses += 1
+                return None
+
+            self._entries.move_to_end(mapping[0])
+            self.download_hits += 1
+            return mapping[0]
+
+    def add(self, voice_name: str, speaker_wav_url: str, downloaded: DownloadedFile) -> str:
+        """
+        Move a downloaded speaker WAV into the cache.
+
+        If the same content is already cached, the download is deleted and the existing
+        entry (with its conditioning latents) is reused.
+
+        Returns:
+            Cache key for the voice
+        """
+        key = self.make_key(voice_name, downloaded.sha256)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                downloaded.cleanup()
+            else:
+                safe_name = re.sub(r'[^A-Za-z0-9_-]', '_', voice_name)[:40]
+                name = f"{safe_name}-{downloaded.sha256[:32]}.wav"
+                shutil.move(downloaded.path, os.path.join(self.cache_dir, name))
+                self._entries[key] = {'voice_name': voice_name, 'sha256': downloaded.sha256,
+                                      'file': name, 'size': downloaded.size}
+
+            self._urls[(voice_name, speaker_wav_url)] = (key, time.time())
+            self._evict()
+            self._save_index()
+        return key
+
+    def wav_path(self, key: str) -> Optional[str]:
+        """Path of a cached speaker WAV (owned by the cache - do not delete)"""
+        entry = self._entries.get(key)
+        return os.path.join(self.cache_dir, entry['file']) if entry else None
+
+    def get_latents(self, key: str, model_id: str) -> Optional[Any]:
+        """Get cached conditioning latents computed by a TTS model for a voice"""
+        with self._lock:
+            latents = self._latents.get(key, {}).get(model_id)
+            if latents is None:
+                self.latent_misses += 1
+            else:
+                self.latent_hits += 1
+            return latents
+
+    def set_latents(self, key: str, model_id: str, latents: Any):
+        """Store conditioning latents computed by a TTS model for a cached voice"""
+        with self._lock:
+            if key in self._entries:
+                self._latents.setdefault(key, {})[model_id] = latents
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        downloads = self.download_hits + self.download_misses
+        latents = self.latent_hits + self.latent_misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'entries_with_latents': len(self._latents),
+            'download_hits': self.download_hits,
+            'download_misses': self.download_misses,
+            'download_hit_rate': self.download_hits / downloads if downloads else 0.0,
+            'latent_hits': self.latent_hits,
+            'latent_misses': self.latent_misses,
+            'latent_hit_rate': self.latent_hits / latents if latents else 0.0,
+            'evictions': self.evictions,
+        }
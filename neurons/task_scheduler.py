@@ -0,0 +1,187 @@
+"""
+Task Scheduler for Miner
+Runs proxy tasks concurrently with a bounded number of in-flight tasks per task type,
+so I/O-bound downloads and CPU-bound inference from one batch no longer run strictly in sequence.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Set, Any
+import bittensor as bt
+
+
+# Default per-type concurrency limits (TTS is the heaviest model, translation the lightest)
+DEFAULT_CONCURRENCY_LIMITS = {
+    "tts": 1,
+    "transcription": 2,
+    "video_transcription": 1,
+    "summarization": 2,
+    "text_translation": 4,
+    "document_translation": 2,
+}
+
+
+class TaskScheduler:
+    """Per-miner async work queue with per-task-type concurrency limits"""
+
+    def __init__(
+        self,
+        process_fn: Callable[[dict], Awaitable[Any]],
+        is_known_fn: Optional[Callable[[str], bool]] = None,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        default_limit: int = 1,
+    ):
+        """
+        Initialize task scheduler
+
+        Args:
+            process_fn: Coroutine function that processes a single task
+            is_known_fn: Returns True if a task ID is already processing or processed
+                (the miner's duplicate protection sets)
+            concurrency_limits: Maximum in-flight tasks per task type
+            default_limit: Limit used for task types without an explicit entry
+        """
+        self.process_fn = process_fn
+        self.is_known_fn = is_known_fn
+        self.concurrency_limits = dict(DEFAULT_CONCURRENCY_LIMITS)
+        if concurrency_limits:
+            self.concurrency_limits.update(concurrency_limits)
+        self.default_limit = max(1, default_limit)
+
+        # Per-type queues and workers (created lazily on the running event loop)
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, list] = {}
+
+        # Task IDs accepted but not yet finished (prevents re-queueing from repeated feed results)
+        self._pending: Set[str] = set()
+        self._in_flight: Dict[str, int] = {}
+
+        # Statistics
+        self.tasks_submitted = 0
+        self.tasks_rejected = 0
+        self.tasks_completed = 0
+        self.tasks_failed = 0
+        self.total_queue_wait = 0.0
+
+    def get_limit(self, task_type: str) -> int:
+        """Get the concurrency limit for a task type"""
+        return max(1, int(self.concurrency_limits.get(task_type, self.default_limit)))
+
+    def _ensure_workers(self, task_type: str) -> asyncio.Queue:
+        """Create the queue and worker coroutines for a task type on first use"""
+        queue = self._queues.get(task_type)
+        if queue is None:
+            queue = asyncio.Queue()
+            self._queues[task_type] = queue
+            self._in_flight[task_type] = 0
+            self._workers[task_type] = [
+                asyncio.create_task(self._worker(task_type, queue))
+                for _ in range(self.get_limit(task_type))
+            ]
+        return queue
+
+    def submit(self, task_data: dict) -> bool:
+        """
+        Queue a task for processing. Must be called from the scheduler's event loop.
+
+        Args:
+            task_data: Task dictionary from the proxy server
+
+        Returns:
+            True if the task was queued, False if it is a duplicate
+        """
+        task_id = task_data.get("task_id")
+        task_type = task_data.get("task_type") or "unknown"
+
+        if task_id in self._pending or (self.is_known_fn and self.is_known_fn(task_id)):
+            self.tasks_rejected += 1
+            return False
+
+        self._pending.add(task_id)
+        self.tasks_submitted += 1
+        self._ensure_workers(task_type).put_nowait((time.time(), task_data))
+        return True
+
+    async def _worker(self, task_type: str, queue: asyncio.Queue):
+        """Process tasks of one type, one at a time"""
+        while True:
+            queued_at, task_data = await queue.get()
+            task_id = task_data.get("task_id")
+            self.total_queue_wait += time.time() - queued_at
+            self._in_flight[task_type] += 1
+            try:
+                await self.process_fn(task_data)
+                self.tasks_completed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.tasks_failed += 1
+                bt.logging.error(f"❌ Scheduled task {task_id} failed: {e}")
+            finally:
+                self._in_flight[task_type] -= 1
+                self._pending.discard(task_id)
+                queue.task_done()
+
+    async def join(self):
+        """Wait until every queued task has finished"""
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def shutdown(self):
+        """Cancel all workers"""
+        workers = [w for ws in self._workers.values() for w in ws]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queues.clear()
+        self._workers.clear()
+
+    def is_pending(self, task_id: str) -> bool:
+        """Check whether a task is queued or running"""
+        return task_id in self._pending
+
+    def get_in_flight(self) -> Dict[str, int]:
+        """Get the number of tasks currently running per task type"""
+        return dict(self._in_flight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics"""
+        started = self.tasks_completed + self.tasks_failed + sum(self._in_flight.values())
+        return {
+            'concurrency_limits': {t: self.get_limit(t) for t in set(self.concurrency_limits) | set(self._queues)},
+            'in_flight': self.get_in_flight(),
+            'queued': {t: q.qsize() for t, q in self._queues.items()},
+            'pending_task_ids': len(self._pending),
+            'tasks_submitted': self.tasks_submitted,
+            'tasks_rejected': self.tasks_rejected,
+            'tasks_completed': self.tasks_completed,
+            'tasks_failed': self.tasks_failed,
+            'average_queue_wait': self.total_queue_wait / started if started else 0.0,
+        }
+
+
+def parse_concurrency_limits(spec: Optional[str]) -> Dict[str, int]:
+    """
+    Parse a concurrency spec such as "tts=1,transcription=2,text_translation=4"
+
+    Args:
+        spec: Comma-separated task_type=limit pairs
+
+    Returns:
+        Dictionary of task type to limit (invalid entries are skipped)
+    """
+    limits = {}
+    if not spec:
+        return limits
+
+    for entry in spec.split(","):
+        if "=" not in entry:
+            continue
+        task_type, value = entry.split("=", 1)
+        try:
+            limit = int(value.strip())
+        except ValueError:
+            continue
+        if task_type.strip() and limit > 0:
+            limits[task_type.strip()] = limit
+    return limits
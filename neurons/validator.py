@@ -184,7 +184,7 @@ class Validator(BaseValidatorNeuron):
             
             # Verify no models were loaded
             cache_stats = self.pipeline_manager.get_cache_stats()
-            if any(count > 0 for count in cache_stats.values()):
+            if any(cache_stats.get(pipeline_type, 0) > 0 for pipeline_type in ('transcription', 'summarization', 'translation', 'tts')):
                 bt.logging.warning(f"⚠️ Models were loaded during initialization! Cache stats: {cache_stats}")
             else:
                 bt.logging.info("✅ Pipeline manager initialized - models will be loaded on-demand when tasks are assigned")
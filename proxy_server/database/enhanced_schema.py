@@ -239,6 +239,15 @@ class DatabaseOperations:
         from database.postgresql_adapter import PostgreSQLAdapter
         return isinstance(db, PostgreSQLAdapter)
     
+    @staticmethod
+    def _notify_assigned_miners(miner_uids: List[int]):
+        """Wake miners long-polling the task feed after a successful assignment"""
+        try:
+            from managers.task_notifier import task_notifier
+            task_notifier.notify(miner_uids)
+        except Exception as e:
+            print(f"⚠️ Error notifying miners {miner_uids} of assignment: {e}")
+    
     @staticmethod
     def create_task(db, task_data: Dict[str, Any]) -> str:
         """Create a new task in the database"""
@@ -373,7 +382,10 @@ class DatabaseOperations:
         if DatabaseOperations._is_postgresql_adapter(db):
             # For PostgreSQL, we need to enhance the adapter method to handle min/max and capacity checks
             # For now, use the adapter's method and enhance it later if needed
-            return db.assign_task_to_miners(task_id, miner_uids, min_count, max_count)
+            success = db.assign_task_to_miners(task_id, miner_uids, min_count, max_count)
+            if success:
+                DatabaseOperations._notify_assigned_miners(miner_uids)
+            return success
         
         # Firestore (legacy)
         try:
@@ -478,6 +490,7 @@ class DatabaseOperations:
             else:
                 print(f"   ℹ️ Can assign {max_count - final_count} more miner(s) to reach maximum")
             
+            DatabaseOperations._notify_assigned_miners(available_miner_uids)
             return True
         except Exception as e:
             print(f"❌ Error assigning task to miners: {e}")
@@ -463,7 +463,8 @@ class PostgreSQLAdapter:
                     'file_size': file_obj.file_size,
                     'storage_location': file_obj.storage_location,
                     'r2_key': file_obj.r2_key,
-                    'public_url': file_obj.public_url
+                    'public_url': file_obj.public_url,
+                    'file_hash': file_obj.file_hash
                 }
         
         return task_dict
@@ -10,7 +10,8 @@ import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, File, UploadFile, Form, Request, Security
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, File, UploadFile, Form, Request, Security, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from pydantic import BaseModel, Field, validator, ConfigDict
@@ -315,6 +316,22 @@ miner_metrics_api = None
 leaderboard_api = None
 miner_response_handler = None
 
+# TTS output formats: format -> (file extension, content type)
+TTS_AUDIO_FORMATS = {
+    'wav': ('.wav', 'audio/wav'),
+    'flac': ('.flac', 'audio/flac'),
+    'opus': ('.opus', 'audio/ogg'),
+    'mp3': ('.mp3', 'audio/mpeg'),
+}
+
+def tts_audio_format_from_filename(filename: str) -> Optional[str]:
+    """TTS output format of an uploaded audio file, from its extension"""
+    extension = os.path.splitext(filename or "")[1].lower()
+    for output_format, (format_extension, _) in TTS_AUDIO_FORMATS.items():
+        if extension == format_extension:
+            return output_format
+    return None
+
 # Pydantic models for API requests
 class TranscriptionRequest(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
@@ -337,6 +354,7 @@ class TTSRequest(BaseModel):
     source_language: str = Field(..., description="Source language code (e.g., 'en', 'es', 'fr')")
     priority: TaskPriority = Field(..., description="Task priority level")
     callback_url: Optional[str] = Field(None, description="Optional webhook URL for task completion notification")
+    output_format: str = Field("wav", description="Audio encoding of the result: 'wav', 'flac', 'opus' or 'mp3'")
     
     @validator('text')
     def validate_text(cls, v):
@@ -346,6 +364,12 @@ class TTSRequest(BaseModel):
             raise ValueError('Text too long (max 10,000 characters)')
         return v.strip()
     
+    @validator('output_format')
+    def validate_output_format(cls, v):
+        if v.lower() not in TTS_AUDIO_FORMATS:
+            raise ValueError(f'Output format must be one of: {", ".join(TTS_AUDIO_FORMATS)}')
+        return v.lower()
+    
     @validator('source_language')
     def validate_language(cls, v):
         valid_languages = ['en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh', 'ar', 'hi']
@@ -877,6 +901,7 @@ async def submit_tts_task(
     priority: str = Form("normal"),
     model_id: Optional[str] = Form(None),
     voice_name: Optional[str] = Form(None),
+    output_format: str = Form("wav"),
     user_info: dict = Depends(require_client_auth)
 ):
     """Submit text-to-speech task with text stored directly in database - accepts form data"""
@@ -887,6 +912,14 @@ async def submit_tts_task(
         if not text or len(text.strip()) < 10:
             raise HTTPException(status_code=400, detail="Text too short for TTS (min 10 characters)")
         
+        # Validate output audio format
+        output_format = (output_format or "wav").lower()
+        if output_format not in TTS_AUDIO_FORMATS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported output_format '{output_format}'. Use one of: {', '.join(TTS_AUDIO_FORMATS)}"
+            )
+        
         # Validate and get voice information - voice_name is REQUIRED for TTS
         speaker_wav_url = None
         voice_data = None
@@ -965,6 +998,7 @@ async def submit_tts_task(
             'model_id': model_id or "tts_models/multilingual/multi-dataset/xtts_v2",  # Default TTS model
             'voice_name': voice_name,  # Selected voice name
             'speaker_wav_url': speaker_wav_url,  # URL to speaker audio file
+            'user_metadata': {'output_format': output_format},  # Audio encoding the miner returns
             'required_miner_count': 3
         }
         
@@ -1008,6 +1042,7 @@ async def submit_tts_task(
             "success": True,
             "task_id": task_id,
             "model_id": task_data.get('model_id'),  # Include model_id in response
+            "output_format": output_format,
             "detected_language": detected_language,
             "language_confidence": language_confidence,
             "text_length": len(text),
@@ -1584,7 +1619,8 @@ async def get_tts_task_content(task_id: str):
                 "priority": task.get("priority"),
                 "source_language": task.get("source_language", "en"),
                 "required_miner_count": task.get("required_miner_count", 1),
-                "model_id": task.get("model_id", "tts_models/multilingual/multi-dataset/xtts_v2")
+                "model_id": task.get("model_id", "tts_models/multilingual/multi-dataset/xtts_v2"),
+                "output_format": (task.get("user_metadata") or {}).get("output_format", "wav")
             }
         }
         
@@ -1827,8 +1863,13 @@ async def upload_tts_audio(
             raise HTTPException(status_code=400, detail="Invalid miner_uid provided")
         
         # Validate audio file
-        if not audio_file.filename or not audio_file.filename.endswith('.wav'):
-            raise HTTPException(status_code=400, detail="Audio file must be a .wav file")
+        output_format = tts_audio_format_from_filename(audio_file.filename)
+        if not output_format:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Audio file must be one of: {', '.join(ext for ext, _ in TTS_AUDIO_FORMATS.values())}"
+            )
+        extension, content_type = TTS_AUDIO_FORMATS[output_format]
         
         # Read audio file content
         audio_content = await audio_file.read()
@@ -1837,13 +1878,13 @@ async def upload_tts_audio(
         
         # Generate unique filename
         import uuid
-        audio_filename = f"{task_id}_{miner_uid}_{uuid.uuid4().hex[:8]}.wav"
+        audio_filename = f"{task_id}_{miner_uid}_{uuid.uuid4().hex[:8]}{extension}"
         
-        # Store audio file in Firebase Cloud Storage
+        # Store audio file in Firebase Cloud Storage (content_type is kept in the File record)
         file_id = await file_manager.upload_file(
             audio_content,
             audio_filename,
-            "audio/wav",
+            content_type,
             file_type="tts"
         )
         
@@ -1854,7 +1895,7 @@ async def upload_tts_audio(
         file_reference = {
             'file_id': file_id,
             'file_name': audio_filename,
-            'file_type': 'audio/wav',
+            'file_type': content_type,
             'file_size': len(audio_content),
             'local_path': file_metadata.get('cloud_path', f"tts_audio/{file_id}") if file_metadata else f"tts_audio/{file_id}",
             'file_url': f"/api/v1/tts/audio/{file_id}",
@@ -1868,6 +1909,7 @@ async def upload_tts_audio(
         response_data = {
             'output_data': {
                 'audio_file': file_reference,
+                'format': output_format,
                 'audio_duration': 0.0,  # Will be calculated by validator
                 'sample_rate': 22050,   # Default, will be verified by validator
                 'bit_depth': 16,        # Default, will be verified by validator
@@ -1939,7 +1981,7 @@ async def get_tts_audio(file_id: str):
         # Return audio file as streaming response
         return StreamingResponse(
             iter([file_content]),
-            media_type="audio/wav",
+            media_type=file_metadata.get('content_type') or "audio/wav",
             headers={
                 "Content-Disposition": f"attachment; filename*=UTF-8''{safe_filename}",
                 "Cache-Control": "no-cache"
@@ -2369,9 +2411,14 @@ async def upload_tts_audio(
         if not audio_file or audio_file.filename == "":
             raise HTTPException(status_code=400, detail="No audio file provided")
         
-        # Check file type (should be .wav)
-        if not audio_file.filename.lower().endswith('.wav'):
-            raise HTTPException(status_code=400, detail="Audio file must be .wav format")
+        # Check file type (.wav, .flac, .opus or .mp3)
+        output_format = tts_audio_format_from_filename(audio_file.filename)
+        if not output_format:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Audio file must be one of: {', '.join(ext for ext, _ in TTS_AUDIO_FORMATS.values())}"
+            )
+        extension, content_type = TTS_AUDIO_FORMATS[output_format]
         
         # Read audio file content
         audio_content = await audio_file.read()
@@ -2380,13 +2427,13 @@ async def upload_tts_audio(
         
         # Generate unique filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{task_id}_{miner_uid}_{timestamp}.wav"
+        filename = f"{task_id}_{miner_uid}_{timestamp}{extension}"
         
-        # Store audio file in Firebase Cloud Storage
+        # Store audio file in Firebase Cloud Storage (content_type is kept in the File record)
         file_id = await file_manager.upload_file(
             audio_content,
             filename,
-            "audio/wav",
+            content_type,
             file_type="tts"
         )
         
@@ -2397,7 +2444,7 @@ async def upload_tts_audio(
         file_reference = {
             'file_id': file_id,
             'file_name': filename,
-            'file_type': "audio/wav",
+            'file_type': content_type,
             'file_size': len(audio_content),
             'local_path': file_metadata.get('cloud_path', f"tts_audio/{file_id}") if file_metadata else f"tts_audio/{file_id}",
             'file_url': f"/api/v1/tts/audio/{file_id}",
@@ -2412,7 +2459,7 @@ async def upload_tts_audio(
                 'audio_file': file_reference,
                 'duration': 0.0,  # Will be calculated by validator
                 'sample_rate': 22050,  # Default sample rate
-                'format': 'wav'
+                'format': output_format
             },
             'processing_time': processing_time,
             'accuracy_score': accuracy_score,
@@ -3852,6 +3899,29 @@ async def get_miner_performance():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get miner performance: {str(e)}")
 
+def _get_open_miner_tasks(miner_uid: int, status: str) -> List[Dict[str, Any]]:
+    """Fetch a miner's tasks and drop any that are already finished"""
+    # Use enhanced database operations with proper filtering
+    tasks = DatabaseOperations.get_miner_tasks(db_manager, miner_uid, status)
+    
+    # Additional validation: ensure we're not returning completed tasks to miners
+    filtered_tasks = []
+    for task in tasks:
+        # Ensure task_id is present (should be added by get_miner_tasks, but double-check)
+        if 'task_id' not in task:
+            task['task_id'] = task.get('id', 'unknown')
+        
+        task_status = task.get('status', 'unknown')
+        if task_status in ['completed', 'failed', 'cancelled', 'approved']:
+            print(f"⚠️ Filtering out {task_status} task {task.get('task_id')} for miner {miner_uid}")
+            continue
+        filtered_tasks.append(task)
+    
+    if len(filtered_tasks) != len(tasks):
+        print(f"🔍 Filtered {len(tasks) - len(filtered_tasks)} completed/failed tasks from miner {miner_uid} results")
+    
+    return filtered_tasks
+
 @app.get("/api/v1/miners/{miner_uid}/tasks")
 async def get_miner_tasks(
     miner_uid: int,
@@ -3868,27 +3938,10 @@ async def get_miner_tasks(
             print(f"⚠️ Invalid status '{status}' requested by miner {miner_uid}. Allowing but logging warning.")
             # Still allow the request but log the warning
         
-        # Use enhanced database operations with proper filtering
-        tasks = DatabaseOperations.get_miner_tasks(db_manager, miner_uid, status)
+        filtered_tasks = _get_open_miner_tasks(miner_uid, status)
         
         # Log what we found
-        print(f"📋 Found {len(tasks)} tasks for miner {miner_uid} with status '{status}'")
-        
-        # Additional validation: ensure we're not returning completed tasks to miners
-        filtered_tasks = []
-        for task in tasks:
-            # Ensure task_id is present (should be added by get_miner_tasks, but double-check)
-            if 'task_id' not in task:
-                task['task_id'] = task.get('id', 'unknown')
-            
-            task_status = task.get('status', 'unknown')
-            if task_status in ['completed', 'failed', 'cancelled', 'approved']:
-                print(f"⚠️ Filtering out {task_status} task {task.get('task_id')} for miner {miner_uid}")
-                continue
-            filtered_tasks.append(task)
-        
-        if len(filtered_tasks) != len(tasks):
-            print(f"🔍 Filtered {len(tasks) - len(filtered_tasks)} completed/failed tasks from miner {miner_uid} results")
+        print(f"📋 Found {len(filtered_tasks)} tasks for miner {miner_uid} with status '{status}'")
         
         # Log task IDs for debugging
         if filtered_tasks:
@@ -3901,6 +3954,38 @@ async def get_miner_tasks(
         print(f"❌ Error getting tasks for miner {miner_uid}: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting miner tasks: {str(e)}")
 
+@app.get("/api/v1/miners/{miner_uid}/tasks/wait")
+async def wait_for_miner_tasks(
+    miner_uid: int,
+    status: str = "assigned",
+    timeout: float = 25.0,
+    known: Optional[List[str]] = Query(None),
+    user_info: dict = Depends(require_miner_auth)
+):
+    """
+    Long-poll variant of the miner task feed.
+    Holds the request open until the miner has tasks it has not seen yet or the timeout expires,
+    then returns them in the same format as /api/v1/miners/{miner_uid}/tasks (empty on timeout).
+    Tasks the miner already responded to, or lists in `known` (queued/in progress), are left out.
+    """
+    from managers.task_notifier import task_notifier, filter_unseen_tasks
+    
+    async def fetch_unseen_tasks() -> List[Dict[str, Any]]:
+        # The database client is synchronous - keep it off the event loop
+        tasks = await run_in_threadpool(_get_open_miner_tasks, miner_uid, status)
+        return filter_unseen_tasks(tasks, miner_uid, known)
+    
+    try:
+        filtered_tasks = await task_notifier.wait_for_tasks(miner_uid, fetch_unseen_tasks, timeout)
+        if filtered_tasks:
+            task_ids = [t.get('task_id', 'no_id') for t in filtered_tasks]
+            print(f"📋 Task feed: returning {len(filtered_tasks)} tasks to miner {miner_uid}: {task_ids}")
+        return filtered_tasks
+        
+    except Exception as e:
+        print(f"❌ Error waiting for tasks for miner {miner_uid}: {e}")
+        raise HTTPException(status_code=500, detail=f"Error waiting for miner tasks: {str(e)}")
+
 @app.get("/api/v1/task/{task_id}/responses")
 async def get_task_responses(task_id: str):
     """Get task information including best response and input details (filtered for client use)"""
@@ -4377,6 +4462,18 @@ async def get_system_metrics_json():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get metrics: {str(e)}")
 
+@app.get("/api/v1/task-feed/stats")
+async def get_task_feed_stats():
+    """Get statistics about miners long-polling the task feed"""
+    try:
+        from managers.task_notifier import task_notifier
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "task_feed": task_notifier.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get task feed stats: {str(e)}")
+
 @app.get("/api/v1/duplicate-protection/stats")
 async def get_duplicate_protection_stats():
     """Get detailed duplicate protection statistics from all levels"""
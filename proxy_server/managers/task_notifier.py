@@ -0,0 +1,189 @@
+"""
+Task Assignment Notifier for Enhanced Proxy Server
+Wakes long-polling miners as soon as new tasks are assigned to them
+"""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Iterable, Any
+
+
+# Keep the hold below typical load balancer idle timeouts
+MAX_WAIT_TIMEOUT = 55.0
+# Re-check the database periodically in case the assignment happened in another worker
+RECHECK_INTERVAL = 5.0
+
+
+def clamp_wait_timeout(timeout: float) -> float:
+    """Clamp a requested long-poll hold to [0, MAX_WAIT_TIMEOUT] seconds"""
+    return max(0.0, min(float(timeout), MAX_WAIT_TIMEOUT))
+
+
+def filter_unseen_tasks(tasks: List[Dict[str, Any]], miner_uid: int,
+                        known_task_ids: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Drop tasks the miner has already seen.
+    A task stays assigned until every required miner has responded, so without this
+    the feed would keep returning tasks this miner already finished or queued.
+
+    Args:
+        tasks: Open tasks assigned to the miner
+        miner_uid: Miner UID
+        known_task_ids: Task IDs the miner reports as already queued or in progress
+
+    Returns:
+        Tasks the miner has neither responded to nor reported as known
+    """
+    known = set(known_task_ids or [])
+    unseen = []
+    for task in tasks:
+        if task.get('task_id') in known:
+            continue
+        responded = False
+        for response in task.get('miner_responses') or []:
+            try:
+                responded = int(response.get('miner_uid')) == int(miner_uid)
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if responded:
+                break
+        if not responded:
+            unseen.append(task)
+    return unseen
+
+
+class TaskAssignmentNotifier:
+    """Tracks miners waiting on the task feed and wakes them on assignment"""
+
+    def __init__(self):
+        # miner_uid -> list of (event loop, event) pairs for each waiting request
+        self._waiters: Dict[int, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.notifications_sent = 0
+        self.waits_started = 0
+        self.waits_woken = 0
+        self.waits_timed_out = 0
+
+    def notify(self, miner_uids: Iterable[int]):
+        """
+        Wake every request currently waiting for the given miners.
+        Safe to call from any thread (assignment may happen outside the server loop).
+
+        Args:
+            miner_uids: UIDs of miners that just received new tasks
+        """
+        for miner_uid in miner_uids:
+            with self._lock:
+                waiters = self._waiters.pop(int(miner_uid), [])
+
+            for loop, event in waiters:
+                try:
+                    loop.call_soon_threadsafe(event.set)
+                    self.notifications_sent += 1
+                except RuntimeError:
+                    # Loop already closed - the waiting request is gone
+                    continue
+
+    def _add_waiter(self, miner_uid: int) -> Tuple[asyncio.AbstractEventLoop, asyncio.Event]:
+        """Register a waiter for the miner on the running event loop"""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.setdefault(miner_uid, []).append(waiter)
+        return waiter
+
+    def _remove_waiter(self, miner_uid: int, waiter: Tuple[asyncio.AbstractEventLoop, asyncio.Event]):
+        """Unregister a waiter (no-op if notify() already popped it)"""
+        with self._lock:
+            waiters = self._waiters.get(miner_uid)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[miner_uid]
+
+    async def _wait(self, waiter: Tuple[asyncio.AbstractEventLoop, asyncio.Event], timeout: float) -> bool:
+        """Wait on a registered waiter's event"""
+        self.waits_started += 1
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout=timeout)
+            self.waits_woken += 1
+            return True
+        except asyncio.TimeoutError:
+            self.waits_timed_out += 1
+            return False
+
+    async def wait_for_assignment(self, miner_uid: int, timeout: float) -> bool:
+        """
+        Wait until a task is assigned to the miner or the timeout expires.
+
+        Args:
+            miner_uid: Miner UID to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if woken by an assignment, False on timeout
+        """
+        waiter = self._add_waiter(miner_uid)
+        try:
+            return await self._wait(waiter, timeout)
+        finally:
+            self._remove_waiter(miner_uid, waiter)
+
+    async def wait_for_tasks(
+        self,
+        miner_uid: int,
+        fetch_tasks: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        timeout: float,
+        recheck_interval: float = RECHECK_INTERVAL
+    ) -> List[Dict[str, Any]]:
+        """
+        Hold until fetch_tasks returns tasks for the miner or the timeout expires.
+        The waiter is registered before each fetch, so an assignment that lands
+        while the database is being queried still wakes the request.
+
+        Args:
+            miner_uid: Miner UID to wait for
+            fetch_tasks: Coroutine function returning the miner's unseen open tasks
+            timeout: Maximum seconds to hold (clamped to MAX_WAIT_TIMEOUT)
+            recheck_interval: Seconds between database re-checks without a notification
+
+        Returns:
+            The fetched tasks, or an empty list on timeout
+        """
+        deadline = time.monotonic() + clamp_wait_timeout(timeout)
+
+        while True:
+            waiter = self._add_waiter(miner_uid)
+            try:
+                tasks = await fetch_tasks()
+                if tasks:
+                    return tasks
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+
+                await self._wait(waiter, min(remaining, recheck_interval))
+            finally:
+                self._remove_waiter(miner_uid, waiter)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the task feed"""
+        with self._lock:
+            waiting_miners = len(self._waiters)
+            waiting_requests = sum(len(w) for w in self._waiters.values())
+
+        return {
+            'waiting_miners': waiting_miners,
+            'waiting_requests': waiting_requests,
+            'notifications_sent': self.notifications_sent,
+            'waits_started': self.waits_started,
+            'waits_woken': self.waits_woken,
+            'waits_timed_out': self.waits_timed_out
+        }
+
+
+# Global instance
+task_notifier = TaskAssignmentNotifier()
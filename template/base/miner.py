@@ -81,6 +81,13 @@ class BaseMinerNeuron(BaseNeuron):
         self.thread: Union[threading.Thread, None] = None
         self.lock = asyncio.Lock()
 
+    def wait_until_ready(self):
+        """
+        Blocks until the miner is ready to serve requests. Override to wait for startup work
+        such as model warm-up; the default miner is ready immediately.
+        """
+        pass
+
     def run(self):
         """
         Initiates and manages the main loop for the miner on the Bittensor network. The main loop handles graceful shutdown on keyboard interrupts and logs unforeseen errors.
@@ -169,6 +176,9 @@ class BaseMinerNeuron(BaseNeuron):
                 bt.logging.error(f"❌ Failed to serve axon: {error_str[:200]}")
                 # Don't exit - continue anyway as axon might still work
 
+        # Don't take requests until startup work (e.g. model warm-up) has finished.
+        self.wait_until_ready()
+
         # Start  starts the miner's axon, making it active on the network.
         self.axon.start()
         
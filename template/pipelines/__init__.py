@@ -6,6 +6,12 @@
 # Import transcription pipeline (always available)
 from .transcription_pipeline import TranscriptionPipeline
 
+# Import inference executor (no model dependencies)
+from .inference_executor import InferenceExecutor, get_inference_executor
+
+# Import model warm-up (no model dependencies)
+from .warmup import ModelWarmup, parse_warmup_models
+
 # Import TTS pipeline if available
 try:
     from .tts_pipeline import TTSPipeline
@@ -26,6 +32,10 @@ __all__ = [
     "TranscriptionPipeline",
     "TTSPipeline", 
     "SummarizationPipeline",
+    "InferenceExecutor",
+    "get_inference_executor",
+    "ModelWarmup",
+    "parse_warmup_models",
     "TTS_AVAILABLE",
     "SUMMARIZATION_AVAILABLE"
 ]
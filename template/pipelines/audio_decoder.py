@@ -0,0 +1,165 @@
+"""
+Audio Decoder for Pipelines
+Sniffs the container and decodes WAV/FLAC/OGG/AIFF straight through soundfile in float32
+blocks, resampling with a polyphase filter only when the rate differs from the target.
+Other containers (MP3, MP4, WebM, ...) fall back to librosa.
+"""
+
+import io
+import logging
+import os
+from math import gcd
+from typing import BinaryIO, Optional, Tuple, Union
+
+import numpy as np
+
+from template.pipelines.profiling import span
+
+logger = logging.getLogger(__name__)
+
+# Containers libsndfile decodes natively
+SOUNDFILE_CONTAINERS = {"wav", "flac", "ogg", "aiff"}
+
+AudioSource = Union[bytes, bytearray, str, os.PathLike]
+
+
+def sniff_container(header: bytes) -> str:
+    """Identify an audio container from its first bytes"""
+    if header[:4] in (b"RIFF", b"RF64", b"BW64") and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:4] == b"fLaC":
+        return "flac"
+    if header[:4] == b"OggS":
+        return "ogg"
+    if header[:4] == b"FORM" and header[8:12] in (b"AIFF", b"AIFC"):
+        return "aiff"
+    if header[:3] == b"ID3" or (len(header) > 1 and header[0] == 0xFF and (header[1] & 0xE0) == 0xE0):
+        return "mp3"
+    if header[4:8] == b"ftyp":
+        return "mp4"
+    if header[:4] == b"\x1a\x45\xdf\xa3":
+        return "webm"
+    return "unknown"
+
+
+def _read_header(source: AudioSource, size: int = 12) -> bytes:
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source[:size])
+    with open(source, "rb") as f:
+        return f.read(size)
+
+
+def _open_source(source: AudioSource) -> Union[str, BinaryIO]:
+    """Paths are read from disk directly; bytes are wrapped without copying"""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return os.fspath(source)
+
+
+class PolyphaseResampler:
+    """
+    Block-wise polyphase resampler.
+
+    Blocks are resampled with enough neighbouring context that the output matches resampling
+    the whole signal at once, so long files can be converted one block at a time.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int):
+        divisor = gcd(orig_sr, target_sr)
+        self.up = target_sr // divisor
+        self.down = orig_sr // divisor
+        # resample_poly's filter spans 10 * max(up, down) taps at the upsampled rate on each side
+        half_width = int(np.ceil(10 * max(self.up, self.down) / self.up)) + 1
+        self.context = int(np.ceil(half_width / self.down)) * self.down
+
+        try:
+            from scipy.signal import resample_poly
+            self._resample = lambda x: resample_poly(x, self.up, self.down)
+        except ImportError:
+            import librosa
+            self._resample = lambda x: librosa.resample(x, orig_sr=orig_sr, target_sr=target_sr, res_type="polyphase")
+
+    def output_length(self, input_length: int) -> int:
+        return -(-input_length * self.up // self.down)
+
+    def resample_block(self, signal: np.ndarray, start: int, end: int) -> np.ndarray:
+        """Resample signal[start:end] (start must be a multiple of down) using surrounding context"""
+        left = max(0, start - self.context)
+        right = min(len(signal), end + self.context)
+        resampled = self._resample(signal[left:right])
+        offset = (start - left) * self.up // self.down
+        return resampled[offset:offset + self.output_length(end - start)].astype(np.float32, copy=False)
+
+
+def _decode_soundfile(source: AudioSource, target_sr: Optional[int], block_seconds: float) -> Tuple[np.ndarray, int]:
+    """Decode with soundfile into a preallocated float32 mono buffer, block by block"""
+    import soundfile as sf
+
+    with span("decode"), sf.SoundFile(_open_source(source)) as audio_file:
+        orig_sr = audio_file.samplerate
+        frames = audio_file.frames
+        block_frames = max(1, int(block_seconds * orig_sr))
+
+        mono = np.empty(frames, dtype=np.float32)
+        position = 0
+        for block in audio_file.blocks(blocksize=block_frames, dtype="float32", always_2d=True):
+            count = len(block)
+            if block.shape[1] == 1:
+                mono[position:position + count] = block[:, 0]
+            else:
+                np.mean(block, axis=1, out=mono[position:position + count])
+            position += count
+        mono = mono[:position]
+
+    if not target_sr or target_sr == orig_sr:
+        return mono, orig_sr
+
+    with span("resample"):
+        resampler = PolyphaseResampler(orig_sr, target_sr)
+        # Block boundaries must be multiples of `down` so the output stays sample-aligned
+        block_frames = max(resampler.down, block_frames // resampler.down * resampler.down)
+        output = np.empty(resampler.output_length(len(mono)), dtype=np.float32)
+        written = 0
+        for start in range(0, len(mono), block_frames):
+            block = resampler.resample_block(mono, start, min(start + block_frames, len(mono)))
+            output[written:written + len(block)] = block
+            written += len(block)
+    return output[:written], target_sr
+
+
+def load_audio(source: AudioSource, target_sr: Optional[int] = 16000, normalize: bool = True,
+               block_seconds: float = 30.0) -> Tuple[np.ndarray, int]:
+    """
+    Decode audio to a float32 mono array.
+
+    Args:
+        source: Raw audio bytes or a path to an audio file
+        target_sr: Output sample rate (None keeps the native rate)
+        normalize: Peak-normalize to [-1, 1] in place
+        block_seconds: Decode/resample block length for soundfile-supported containers
+
+    Returns:
+        Tuple of (audio_array, sample_rate)
+    """
+    container = sniff_container(_read_header(source))
+
+    audio = None
+    if container in SOUNDFILE_CONTAINERS:
+        try:
+            audio, sample_rate = _decode_soundfile(source, target_sr, block_seconds)
+        except Exception as e:
+            logger.warning(f"⚠️ soundfile could not decode {container} audio, falling back to librosa: {e}")
+
+    if audio is None:
+        import librosa
+        # librosa decodes and resamples in one call
+        with span("decode"):
+            audio, sample_rate = librosa.load(_open_source(source), sr=target_sr, mono=True, dtype=np.float32)
+
+    if normalize and len(audio):
+        with span("normalize"):
+            peak = float(np.max(np.abs(audio)))
+            if peak > 0:
+                audio /= peak
+
+    return audio, sample_rate
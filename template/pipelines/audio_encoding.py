@@ -0,0 +1,119 @@
+"""
+Audio Encoding for TTS Output
+Encodes synthesized audio as WAV, FLAC, Ogg Opus or MP3 with libsndfile (via soundfile).
+Compressed formats cut upload, storage and download size several times over uncompressed WAV.
+Formats the installed libsndfile cannot write fall back to WAV.
+"""
+
+import io
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+# Output format -> (libsndfile format, subtype, file extension, content type)
+AUDIO_FORMATS = {
+    'wav': ('WAV', 'PCM_16', '.wav', 'audio/wav'),
+    'flac': ('FLAC', 'PCM_16', '.flac', 'audio/flac'),
+    'opus': ('OGG', 'OPUS', '.opus', 'audio/ogg'),
+    'mp3': ('MP3', 'MPEG_LAYER_III', '.mp3', 'audio/mpeg'),
+}
+
+DEFAULT_AUDIO_FORMAT = 'wav'
+
+# Opus only encodes at these sample rates
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+@dataclass
+class EncodedAudio:
+    """Encoded audio with the metadata needed to upload and serve it"""
+    data: bytes
+    output_format: str
+    content_type: str
+    extension: str
+    sample_rate: int
+
+
+def normalize_audio_format(output_format: Optional[str]) -> str:
+    """Lower-case a requested format, mapping unknown or missing values to WAV"""
+    output_format = (output_format or DEFAULT_AUDIO_FORMAT).strip().lower()
+    if output_format not in AUDIO_FORMATS:
+        logger.warning(f"⚠️ Unknown audio format '{output_format}', using {DEFAULT_AUDIO_FORMAT}")
+        return DEFAULT_AUDIO_FORMAT
+    return output_format
+
+
+def _resample(audio: np.ndarray, sample_rate: int, target_rate: int) -> np.ndarray:
+    """Resample audio with a polyphase filter"""
+    from math import gcd
+    from scipy.signal import resample_poly
+    divisor = gcd(sample_rate, target_rate)
+    return resample_poly(audio, target_rate // divisor, sample_rate // divisor, axis=0).astype(np.float32)
+
+
+def encode_audio(audio, sample_rate: int, output_format: Optional[str] = DEFAULT_AUDIO_FORMAT) -> EncodedAudio:
+    """
+    Encode float audio in [-1, 1] into the requested format.
+
+    Opus audio is resampled to the nearest rate Opus supports (at or above the input rate).
+
+    Args:
+        audio: Samples as a 1-D (mono) or 2-D (frames x channels) array
+        sample_rate: Sample rate of audio
+        output_format: "wav", "flac", "opus" or "mp3"
+
+    Returns:
+        EncodedAudio (in WAV if the requested format cannot be written)
+    """
+    output_format = normalize_audio_format(output_format)
+    audio = np.clip(np.asarray(audio, dtype=np.float32), -1.0, 1.0)
+
+    if output_format != DEFAULT_AUDIO_FORMAT:
+        container, subtype, extension, content_type = AUDIO_FORMATS[output_format]
+        target_rate = sample_rate
+        try:
+            if not sf.check_format(container, subtype):
+                raise ValueError(f"libsndfile {sf.__libsndfile_version__} cannot write {container}/{subtype}")
+            if output_format == 'opus' and sample_rate not in OPUS_SAMPLE_RATES:
+                target_rate = next((rate for rate in OPUS_SAMPLE_RATES if rate >= sample_rate), OPUS_SAMPLE_RATES[-1])
+                audio = _resample(audio, sample_rate, target_rate)
+            buffer = io.BytesIO()
+            sf.write(buffer, audio, target_rate, format=container, subtype=subtype)
+            return EncodedAudio(buffer.getvalue(), output_format, content_type, extension, target_rate)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not encode audio as {output_format}, falling back to WAV: {e}")
+            if target_rate != sample_rate:
+                audio = _resample(audio, target_rate, sample_rate)
+
+    container, subtype, extension, content_type = AUDIO_FORMATS[DEFAULT_AUDIO_FORMAT]
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format=container, subtype=subtype)
+    return EncodedAudio(buffer.getvalue(), DEFAULT_AUDIO_FORMAT, content_type, extension, sample_rate)
+
+
+def encode_audio_file(path: str, output_format: Optional[str] = DEFAULT_AUDIO_FORMAT) -> EncodedAudio:
+    """
+    Encode an audio file (e.g. a WAV written by Coqui TTS) into the requested format.
+    WAV output returns the file's bytes unchanged.
+
+    Args:
+        path: Audio file readable by libsndfile
+        output_format: "wav", "flac", "opus" or "mp3"
+
+    Returns:
+        EncodedAudio
+    """
+    output_format = normalize_audio_format(output_format)
+    if output_format == DEFAULT_AUDIO_FORMAT:
+        with open(path, 'rb') as f:
+            data = f.read()
+        _, _, extension, content_type = AUDIO_FORMATS[DEFAULT_AUDIO_FORMAT]
+        return EncodedAudio(data, DEFAULT_AUDIO_FORMAT, content_type, extension, sf.info(path).samplerate)
+
+    audio, sample_rate = sf.read(path, dtype='float32')
+    return encode_audio(audio, sample_rate, output_format)
@@ -0,0 +1,113 @@
+"""
+Inference Backends for Pipelines
+Loads the seq2seq models behind the transcription (Whisper), summarization (BART) and
+translation (T5/Marian/mBART) pipelines either as eager PyTorch models or as ONNX Runtime
+sessions exported through optimum. ONNX exports are cached on disk per model_name.
+"""
+
+import logging
+import os
+import re
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("pytorch", "onnx")
+
+DEFAULT_ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "violet", "onnx")
+
+# Check if ONNX Runtime export/inference through optimum is available
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTModelForSpeechSeq2Seq
+    ONNX_AVAILABLE = True
+except ImportError:
+    onnxruntime = None
+    ORTModelForSeq2SeqLM = None
+    ORTModelForSpeechSeq2Seq = None
+    ONNX_AVAILABLE = False
+
+# Model kinds: "speech-seq2seq" (Whisper) or "seq2seq-lm" (BART, T5, Marian, mBART)
+MODEL_KINDS = ("speech-seq2seq", "seq2seq-lm")
+
+
+def resolve_backend(backend: Optional[str]) -> str:
+    """Validate a backend name, falling back to PyTorch if ONNX Runtime is not installed"""
+    backend = (backend or "pytorch").lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Invalid inference backend: {backend} (expected one of {', '.join(BACKENDS)})")
+    if backend == "onnx" and not ONNX_AVAILABLE:
+        logger.warning("⚠️ ONNX backend requested but onnxruntime/optimum are not installed, using PyTorch")
+        return "pytorch"
+    return backend
+
+
+def onnx_export_path(model_name: str, cache_dir: Optional[str] = None) -> str:
+    """Directory holding the cached ONNX export of a model"""
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+    return os.path.join(cache_dir or DEFAULT_ONNX_CACHE_DIR, safe_name)
+
+
+def _session_options():
+    """ORT session options with all graph optimizations enabled"""
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return options
+
+
+def _load_onnx_model(model_name: str, kind: str, device: str, cache_dir: Optional[str], hf_token_kwargs: dict):
+    """Load a cached ONNX export, exporting the HF checkpoint on first use"""
+    model_class = ORTModelForSpeechSeq2Seq if kind == "speech-seq2seq" else ORTModelForSeq2SeqLM
+    provider = "CUDAExecutionProvider" if device == "cuda" else "CPUExecutionProvider"
+    export_path = onnx_export_path(model_name, cache_dir)
+
+    if os.path.isfile(os.path.join(export_path, "config.json")):
+        logger.info(f"📦 Loading cached ONNX export of {model_name} from {export_path}")
+        return model_class.from_pretrained(export_path, provider=provider, session_options=_session_options())
+
+    logger.info(f"🔄 Exporting {model_name} to ONNX (one-time, cached in {export_path})")
+    model = model_class.from_pretrained(model_name, export=True, provider=provider,
+                                        session_options=_session_options(), **hf_token_kwargs)
+    try:
+        model.save_pretrained(export_path)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to cache ONNX export of {model_name}: {e}")
+    return model
+
+
+def load_seq2seq_model(model_name: str, kind: str, backend: str = "pytorch", device: str = "cpu",
+                       cache_dir: Optional[str] = None, hf_token_kwargs: Optional[dict] = None):
+    """
+    Load a seq2seq model on the requested backend.
+
+    Both backends return a model with a HF-compatible generate(), so pipelines can use either.
+
+    Args:
+        model_name: HuggingFace model name
+        kind: "speech-seq2seq" (Whisper) or "seq2seq-lm" (BART, T5, ...)
+        backend: "pytorch" or "onnx"
+        device: "cpu" or "cuda"
+        cache_dir: ONNX export cache directory (default: ~/.cache/violet/onnx)
+        hf_token_kwargs: HF auth kwargs passed to from_pretrained
+
+    Returns:
+        Tuple of (model, backend actually used)
+    """
+    if kind not in MODEL_KINDS:
+        raise ValueError(f"Invalid model kind: {kind}")
+    hf_token_kwargs = hf_token_kwargs or {}
+    backend = resolve_backend(backend)
+
+    if backend == "onnx":
+        try:
+            return _load_onnx_model(model_name, kind, device, cache_dir, hf_token_kwargs), "onnx"
+        except Exception as e:
+            logger.warning(f"⚠️ ONNX Runtime load failed for {model_name}, falling back to PyTorch: {e}")
+
+    if kind == "speech-seq2seq":
+        from transformers import AutoModelForSpeechSeq2Seq as model_class
+    else:
+        from transformers import AutoModelForSeq2SeqLM as model_class
+    model = model_class.from_pretrained(model_name, **hf_token_kwargs)
+    model.to(device)
+    return model, "pytorch"
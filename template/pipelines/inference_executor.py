@@ -0,0 +1,258 @@
+"""
+Inference Executor for Pipelines
+Runs blocking model inference on worker pools so async callers (the miner's event loop)
+stay responsive while transcription, summarization, translation or TTS is running.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default number of workers per pipeline type
+DEFAULT_PIPELINE_WORKERS = {
+    'transcription': 2,
+    'summarization': 1,
+    'translation': 2,
+    'tts': 1,
+    'video': 2,
+}
+
+# Pipeline manager getters used by run_pipeline
+PIPELINE_GETTERS = {
+    'transcription': 'get_transcription_pipeline',
+    'summarization': 'get_summarization_pipeline',
+    'translation': 'get_translation_pipeline',
+    'tts': 'get_tts_pipeline',
+}
+
+# Pools that run torch models (video and audio_encoding pools only drive ffmpeg/soundfile)
+TORCH_PIPELINES = frozenset(PIPELINE_GETTERS)
+
+
+def _set_torch_threads(num_threads: int):
+    """Limit torch intra-op threads (no-op if torch is not installed)"""
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.warning(f"⚠️ Could not set torch threads to {num_threads}: {e}")
+
+
+def _init_process_worker(num_threads: int):
+    """Initializer for forked worker processes"""
+    os.environ['OMP_NUM_THREADS'] = str(num_threads)
+    _set_torch_threads(num_threads)
+
+
+def _get_pipeline(pipeline_manager, pipeline_type: str, model_name: Optional[str]):
+    """Get a pipeline instance from a pipeline manager"""
+    getter_name = PIPELINE_GETTERS.get(pipeline_type)
+    if getter_name is None:
+        raise ValueError(f"Unknown pipeline type: {pipeline_type}")
+
+    pipeline = getattr(pipeline_manager, getter_name)(model_name)
+    if pipeline is None:
+        raise Exception(f"{pipeline_type.capitalize()} pipeline not available")
+    return pipeline
+
+
+def _call_pipeline(pipeline_manager, pipeline_type: str, model_name: Optional[str],
+                   method_name: str, args: tuple, kwargs: dict):
+    """Load (or reuse) a pipeline and call one of its methods"""
+    pipeline = _get_pipeline(pipeline_manager, pipeline_type, model_name)
+    return getattr(pipeline, method_name)(*args, **kwargs)
+
+
+def _call_pipeline_in_worker(pipeline_type: str, model_name: Optional[str],
+                             method_name: str, args: tuple, kwargs: dict):
+    """Process pool entry point - each worker process keeps its own pipeline manager"""
+    from template.pipelines.pipeline_manager import get_pipeline_manager
+    return _call_pipeline(get_pipeline_manager(), pipeline_type, model_name, method_name, args, kwargs)
+
+
+class InferenceExecutor:
+    """
+    Dispatches blocking pipeline calls to per-pipeline worker pools.
+
+    In "thread" mode all workers share the caller's pipelines and torch's process-wide thread
+    pool; it is only resized when a torch thread budget is given explicitly. In "process" mode
+    each pipeline type gets a forked process pool and the budget (default: CPU count) is divided
+    between the torch workers; workers load their own pipelines, so run_pipeline must be used
+    for those calls.
+    """
+
+    def __init__(self, mode: str = "thread", workers: Optional[Dict[str, int]] = None,
+                 torch_threads: Optional[int] = None):
+        """
+        Initialize the inference executor.
+
+        Args:
+            mode: "thread" or "process"
+            workers: Number of workers per pipeline type (overrides the defaults)
+            torch_threads: Torch thread budget divided between the torch workers (default: leave
+                torch's setting alone in thread mode, CPU count in process mode)
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Invalid inference executor mode: {mode}")
+
+        self.mode = mode
+        self.workers = dict(DEFAULT_PIPELINE_WORKERS)
+        if workers:
+            self.workers.update({k: max(1, int(v)) for k, v in workers.items()})
+
+        # Only workers that run torch models compete for intra-op threads
+        torch_workers = sum(n for pipeline_type, n in self.workers.items() if pipeline_type in TORCH_PIPELINES)
+        if mode == "process":
+            self.torch_threads = torch_threads or os.cpu_count() or 1
+        else:
+            self.torch_threads = torch_threads or None
+        self.threads_per_worker = (
+            max(1, self.torch_threads // max(1, torch_workers)) if self.torch_threads else None
+        )
+
+        self._pools: Dict[str, Executor] = {}
+        self._thread_pools: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+        if mode == "thread" and self.threads_per_worker:
+            # Threads share one torch thread pool - opt-in split so concurrent workers don't oversubscribe
+            _set_torch_threads(self.threads_per_worker)
+
+        threads_desc = self.threads_per_worker or "default"
+        logger.info(f"✅ Inference executor initialized ({mode} mode, "
+                    f"{threads_desc} torch threads per worker, workers: {self.workers})")
+
+    def _get_thread_pool(self, pipeline_type: str) -> ThreadPoolExecutor:
+        """Get (or create) the thread pool for a pipeline type"""
+        with self._lock:
+            pool = self._thread_pools.get(pipeline_type)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=self.workers.get(pipeline_type, 1),
+                    thread_name_prefix=f"inference-{pipeline_type}"
+                )
+                self._thread_pools[pipeline_type] = pool
+            return pool
+
+    def _get_process_pool(self, pipeline_type: str) -> ProcessPoolExecutor:
+        """Get (or create) the forked process pool for a pipeline type"""
+        with self._lock:
+            pool = self._pools.get(pipeline_type)
+            if pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=self.workers.get(pipeline_type, 1),
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=_init_process_worker,
+                    initargs=(self.threads_per_worker,)
+                )
+                self._pools[pipeline_type] = pool
+            return pool
+
+    async def _dispatch(self, pipeline_type: str, pool: Executor, fn: Callable, *args):
+        """Run a callable on a pool and record timing statistics"""
+        stats = self.stats.setdefault(pipeline_type, {
+            'calls': 0, 'failures': 0, 'in_flight': 0, 'total_time': 0.0
+        })
+        stats['calls'] += 1
+        stats['in_flight'] += 1
+        start_time = time.time()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, fn, *args)
+        except Exception:
+            stats['failures'] += 1
+            raise
+        finally:
+            stats['in_flight'] -= 1
+            stats['total_time'] += time.time() - start_time
+
+    async def run(self, pipeline_type: str, fn: Callable, *args, **kwargs):
+        """
+        Run a blocking callable on the thread pool for a pipeline type.
+        Used for callables bound to in-process objects (e.g. a Coqui TTS instance, ffmpeg helpers).
+
+        Args:
+            pipeline_type: Pool to run on (e.g. "tts", "video")
+            fn: Blocking callable
+
+        Returns:
+            The callable's return value
+        """
+        call = lambda: fn(*args, **kwargs)
+        return await self._dispatch(pipeline_type, self._get_thread_pool(pipeline_type), call)
+
+    async def run_pipeline(self, pipeline_manager, pipeline_type: str, model_name: Optional[str],
+                           method_name: str, *args, **kwargs):
+        """
+        Call a pipeline method (e.g. "transcribe") off the event loop.
+        The pipeline is loaded inside the worker, so first-time model loading doesn't block either.
+
+        Args:
+            pipeline_manager: PipelineManager used in thread mode
+            pipeline_type: "transcription", "summarization", "translation" or "tts"
+            model_name: Model to use (None for the default model)
+            method_name: Pipeline method to call
+
+        Returns:
+            The pipeline method's return value
+        """
+        if self.mode == "process":
+            return await self._dispatch(
+                pipeline_type, self._get_process_pool(pipeline_type), _call_pipeline_in_worker,
+                pipeline_type, model_name, method_name, args, kwargs
+            )
+
+        return await self._dispatch(
+            pipeline_type, self._get_thread_pool(pipeline_type), _call_pipeline,
+            pipeline_manager, pipeline_type, model_name, method_name, args, kwargs
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics"""
+        return {
+            'mode': self.mode,
+            'workers': dict(self.workers),
+            'torch_threads': self.torch_threads,
+            'threads_per_worker': self.threads_per_worker,
+            'pipelines': {
+                pipeline_type: {
+                    **stats,
+                    'average_time': stats['total_time'] / stats['calls'] if stats['calls'] else 0.0
+                }
+                for pipeline_type, stats in self.stats.items()
+            }
+        }
+
+    def shutdown(self, wait: bool = False):
+        """Shut down all worker pools"""
+        with self._lock:
+            pools = list(self._pools.values()) + list(self._thread_pools.values())
+            self._pools.clear()
+            self._thread_pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=wait)
+        logger.info("🧹 Inference executor shut down")
+
+
+# Global inference executor instance (lazy initialization)
+_inference_executor_instance = None
+
+
+def get_inference_executor(**kwargs) -> InferenceExecutor:
+    """Get or create the global inference executor (kwargs only apply on first creation)"""
+    global _inference_executor_instance
+    if _inference_executor_instance is None:
+        _inference_executor_instance = InferenceExecutor(**kwargs)
+    return _inference_executor_instance
@@ -0,0 +1,177 @@
+"""
+Micro-Batcher for Text Pipelines
+Collects summarization and translation requests that arrive close together (from any
+event loop or thread), groups them by model and generation parameters, and runs each group
+as one padded batch on the inference executor. Results are fanned back out to the callers.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pipeline methods: (batch method taking a list of texts, single-text method used as fallback)
+BATCH_METHODS = {
+    'summarization': ('summarize_batch', 'summarize'),
+    'translation': ('translate_batch', 'translate_text'),
+}
+
+
+class MicroBatcher:
+    """
+    Cross-request dynamic batching in front of the text pipelines.
+
+    A group is flushed when it reaches max_batch_size items or when its oldest item has
+    waited max_wait_ms. The batcher runs its own event loop thread, so callers on different
+    loops (axon handlers, the task feed) are batched together.
+    """
+
+    def __init__(self, inference_executor, pipeline_manager, max_wait_ms: float = 20.0, max_batch_size: int = 8):
+        """
+        Initialize the micro-batcher.
+
+        Args:
+            inference_executor: InferenceExecutor the batches run on
+            pipeline_manager: PipelineManager passed to run_pipeline
+            max_wait_ms: Longest time a request waits for companions
+            max_batch_size: Maximum requests per batch
+        """
+        self.inference_executor = inference_executor
+        self.pipeline_manager = pipeline_manager
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.max_batch_size = max(1, int(max_batch_size))
+
+        # group key -> [(text, enqueue time, future)]
+        self._pending: Dict[Tuple, List[Tuple[str, float, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple, asyncio.TimerHandle] = {}
+
+        # Statistics
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+        logger.info(f"✅ Micro-batcher initialized (max wait {max_wait_ms:.0f}ms, max batch {self.max_batch_size})")
+
+    async def submit(self, pipeline_type: str, model_name: Optional[str], text: str, **params):
+        """
+        Submit one text and wait for its result.
+
+        Args:
+            pipeline_type: "summarization" or "translation"
+            model_name: Model to use (None for the default model)
+            text: Input text
+            **params: Keyword arguments of the pipeline method (e.g. language, source_language)
+
+        Returns:
+            The single-text method's return value, e.g. (summary_text, processing_time)
+        """
+        if pipeline_type not in BATCH_METHODS:
+            raise ValueError(f"Micro-batching is not supported for {pipeline_type}")
+        future = asyncio.run_coroutine_threadsafe(self._enqueue(pipeline_type, model_name, text, params), self._loop)
+        return await asyncio.wrap_future(future)
+
+    async def _enqueue(self, pipeline_type: str, model_name: Optional[str], text: str, params: Dict[str, Any]):
+        """Add a request to its group (runs on the batcher loop)"""
+        key = (pipeline_type, model_name, tuple(sorted(params.items())))
+        future = self._loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((text, time.time(), future))
+
+        if len(group) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = self._loop.call_later(self.max_wait, self._flush, key)
+        return await future
+
+    def _flush(self, key: Tuple):
+        """Start a batch for a group (runs on the batcher loop)"""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._pending.pop(key, None)
+        if group:
+            self._loop.create_task(self._run_batch(key, group))
+
+    async def _run_batch(self, key: Tuple, group: List[Tuple[str, float, asyncio.Future]]):
+        """Run one batch and fan the results out"""
+        pipeline_type, model_name, param_items = key
+        params = dict(param_items)
+        batch_method, single_method = BATCH_METHODS[pipeline_type]
+        texts = [text for text, _, _ in group]
+        futures = [future for _, _, future in group]
+
+        start_time = time.time()
+        stats = self.stats.setdefault(pipeline_type, {
+            'batches': 0, 'requests': 0, 'max_batch_size': 0, 'total_queue_wait': 0.0,
+            'max_queue_wait': 0.0, 'total_batch_time': 0.0, 'fallbacks': 0
+        })
+        queue_waits = [start_time - enqueued for _, enqueued, _ in group]
+        stats['batches'] += 1
+        stats['requests'] += len(group)
+        stats['max_batch_size'] = max(stats['max_batch_size'], len(group))
+        stats['total_queue_wait'] += sum(queue_waits)
+        stats['max_queue_wait'] = max(stats['max_queue_wait'], max(queue_waits))
+
+        try:
+            if len(group) == 1:
+                results = [await self.inference_executor.run_pipeline(
+                    self.pipeline_manager, pipeline_type, model_name, single_method, texts[0], **params
+                )]
+            else:
+                logger.info(f"📦 Running {pipeline_type} batch of {len(group)} requests "
+                            f"(model: {model_name or 'default'})")
+                results = await self.inference_executor.run_pipeline(
+                    self.pipeline_manager, pipeline_type, model_name, batch_method, texts, **params
+                )
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            if len(group) == 1:
+                if not futures[0].done():
+                    futures[0].set_exception(e)
+            else:
+                # Retry one by one so a single bad input doesn't fail its neighbours
+                logger.warning(f"⚠️ {pipeline_type} batch of {len(group)} failed, running requests individually: {e}")
+                stats['fallbacks'] += 1
+                await asyncio.gather(*(self._run_single(pipeline_type, model_name, single_method, text, params, future)
+                                       for text, future in zip(texts, futures)))
+        finally:
+            stats['total_batch_time'] += time.time() - start_time
+
+    async def _run_single(self, pipeline_type: str, model_name: Optional[str], method_name: str,
+                          text: str, params: Dict[str, Any], future: asyncio.Future):
+        """Run one request outside a batch"""
+        try:
+            result = await self.inference_executor.run_pipeline(
+                self.pipeline_manager, pipeline_type, model_name, method_name, text, **params
+            )
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics"""
+        return {
+            'max_wait_ms': self.max_wait * 1000.0,
+            'max_batch_size': self.max_batch_size,
+            'pipelines': {
+                pipeline_type: {
+                    **stats,
+                    'average_batch_size': stats['requests'] / stats['batches'] if stats['batches'] else 0.0,
+                    'average_queue_wait': stats['total_queue_wait'] / stats['requests'] if stats['requests'] else 0.0,
+                }
+                for pipeline_type, stats in self.stats.items()
+            }
+        }
+
+    def shutdown(self):
+        """Stop the batcher loop"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
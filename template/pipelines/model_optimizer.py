@@ -0,0 +1,150 @@
+"""
+CPU Model Optimizer for Pipelines
+Optional "optimized CPU" mode: int8 dynamic quantization of Linear layers and optional
+torch.compile. Quantized weights are cached on disk so the conversion is paid once per model.
+"""
+
+import logging
+import os
+import re
+import time
+from typing import List, Optional
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OPTIMIZED_MODEL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "violet", "optimized_models")
+
+
+def _cache_path(cache_dir: str, model_name: str) -> str:
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+    return os.path.join(cache_dir, f"{safe_name}.int8-dynamic.pt")
+
+
+def _linear_module_names(model: torch.nn.Module) -> List[str]:
+    """Names of the modules quantize_dynamic converts (exact nn.Linear type, like its qconfig lookup)"""
+    return [name for name, module in model.named_modules() if type(module) is torch.nn.Linear]
+
+
+def _swap_linear_modules(model: torch.nn.Module, names: List[str]):
+    """Replace Linear modules with empty dynamic int8 Linear modules (weights come from a state dict)"""
+    try:
+        from torch.ao.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+    except ImportError:
+        from torch.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+
+    for name in names:
+        parent_name, _, child_name = name.rpartition(".")
+        parent = model.get_submodule(parent_name) if parent_name else model
+        linear = getattr(parent, child_name)
+        setattr(parent, child_name, DynamicQuantizedLinear(
+            linear.in_features, linear.out_features, bias_=linear.bias is not None, dtype=torch.qint8
+        ))
+
+
+def quantize_model(model: torch.nn.Module, model_name: str, cache_dir: Optional[str] = None) -> torch.nn.Module:
+    """
+    Apply int8 dynamic quantization to a model's Linear layers.
+
+    The quantized state dict is cached under cache_dir. Later loads swap in empty quantized
+    modules and load the cached int8 weights, skipping the quantization itself.
+
+    Args:
+        model: fp32 model on CPU
+        model_name: Model name used as the cache key
+        cache_dir: Directory for cached quantized weights (None disables the disk cache)
+
+    Returns:
+        Quantized model
+    """
+    start_time = time.time()
+    model.eval()
+    linear_names = _linear_module_names(model)
+    path = _cache_path(cache_dir, model_name) if cache_dir else None
+
+    if path and os.path.exists(path):
+        try:
+            cached = torch.load(path, map_location="cpu", weights_only=False)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read cached int8 weights for {model_name}: {e}")
+            cached = {}
+        if (cached.get('torch_version') == torch.__version__ and cached.get('model_name') == model_name
+                and cached.get('linear_modules') == linear_names):
+            _swap_linear_modules(model, linear_names)
+            try:
+                model.load_state_dict(cached['state_dict'])
+            except Exception:
+                # The model is already partially converted - drop the bad cache entry and fail the load
+                os.unlink(path)
+                raise
+            logger.info(f"⚡ Loaded cached int8 weights for {model_name} in {time.time() - start_time:.2f}s")
+            return model
+        logger.info(f"🔄 Cached int8 weights for {model_name} are stale, re-quantizing")
+
+    # In place, so the fp32 weights aren't held twice during conversion
+    quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    logger.info(f"⚡ Quantized {len(linear_names)} Linear layers of {model_name} to int8 in {time.time() - start_time:.2f}s")
+
+    if path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_path = path + ".tmp"
+            torch.save({
+                'torch_version': torch.__version__,
+                'model_name': model_name,
+                'linear_modules': linear_names,
+                'state_dict': quantized.state_dict(),
+            }, temp_path)
+            os.replace(temp_path, path)
+            logger.info(f"💾 Cached int8 weights for {model_name} to {path}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to cache int8 weights for {model_name}: {e}")
+
+    return quantized
+
+
+def compile_model(model: torch.nn.Module, model_name: str) -> torch.nn.Module:
+    """Compile a model's forward with torch.compile (generate() keeps working), if available"""
+    if not hasattr(torch, "compile"):
+        logger.warning(f"⚠️ torch.compile not available in torch {torch.__version__}, skipping for {model_name}")
+        return model
+    try:
+        model.forward = torch.compile(model.forward, dynamic=True)
+        logger.info(f"⚡ Compiled forward of {model_name} (first calls will be slower while compiling)")
+    except Exception as e:
+        logger.warning(f"⚠️ torch.compile failed for {model_name}, running eagerly: {e}")
+    return model
+
+
+def optimize_pipeline(pipeline, quantize: bool = True, compile: bool = False,
+                      cache_dir: Optional[str] = DEFAULT_OPTIMIZED_MODEL_DIR):
+    """
+    Optimize a loaded HF pipeline (transcription, summarization or translation) for CPU inference.
+
+    Only pipelines running on CPU are changed. HF pipelines wrapped by the pipeline
+    (e.g. TranslationPipeline.translation_pipeline) are pointed at the optimized model.
+
+    Returns:
+        The same pipeline instance
+    """
+    model = getattr(pipeline, 'model', None)
+    model_name = getattr(pipeline, 'model_name', None) or type(model).__name__
+    if not isinstance(model, torch.nn.Module):
+        return pipeline
+    if getattr(pipeline, 'device', 'cpu') != 'cpu':
+        logger.info(f"ℹ️ Skipping CPU optimization for {model_name} on {pipeline.device}")
+        return pipeline
+
+    if quantize:
+        model = quantize_model(model, model_name, cache_dir)
+    if compile:
+        model = compile_model(model, model_name)
+    pipeline.model = model
+
+    hf_pipeline = getattr(pipeline, 'translation_pipeline', None)
+    if hf_pipeline is not None and hasattr(hf_pipeline, 'model'):
+        hf_pipeline.model = model
+
+    pipeline.optimization = {'quantized': quantize, 'compiled': compile}
+    return pipeline
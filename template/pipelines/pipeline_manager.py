@@ -3,24 +3,284 @@ Pipeline Manager for Dynamic Model Loading
 Manages pipeline instances with different models and caches them for reuse
 """
 
+import gc
 import logging
-from typing import Dict, Optional
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
 # Lazy import - don't import hf_token at module level to avoid side effects
 # from template.utils.hf_token import get_hf_token_dict
 
 logger = logging.getLogger(__name__)
 
+
+def estimate_pipeline_size(pipeline) -> int:
+    """
+    Estimate the memory held by a pipeline's models in bytes.
+    Sums the parameters and buffers of every torch module attribute (and HF pipelines' .model),
+    counting tensors shared between modules once. ONNX Runtime models are counted by the
+    size of their exported .onnx files.
+    """
+    modules = []
+    onnx_dirs = set()
+    for value in getattr(pipeline, '__dict__', {}).values():
+        for candidate in (value, getattr(value, 'model', None)):
+            if candidate is not None and callable(getattr(candidate, 'parameters', None)):
+                modules.append(candidate)
+            elif getattr(candidate, 'model_save_dir', None):
+                onnx_dirs.add(str(candidate.model_save_dir))
+
+    seen = set()
+    total = 0
+    for module in modules:
+        try:
+            tensors = list(module.parameters())
+            if callable(getattr(module, 'buffers', None)):
+                tensors += list(module.buffers())
+        except Exception:
+            continue
+        for tensor in tensors:
+            if id(tensor) in seen:
+                continue
+            seen.add(id(tensor))
+            try:
+                total += tensor.numel() * tensor.element_size()
+            except Exception:
+                pass
+
+    for onnx_dir in onnx_dirs:
+        try:
+            total += sum(os.path.getsize(os.path.join(onnx_dir, name))
+                         for name in os.listdir(onnx_dir) if name.endswith(('.onnx', '.onnx_data')))
+        except OSError:
+            pass
+    return total
+
+
+def _stage_stats(pipeline: Any) -> Optional[Dict[str, Any]]:
+    """Aggregated stage timings of a pipeline, if it profiles its calls"""
+    profiler = getattr(pipeline, 'profiler', None)
+    if profiler is None or not profiler.enabled:
+        return None
+    return profiler.get_stats()
+
+
+class ModelCache:
+    """
+    Unified LRU cache of loaded pipelines with a memory budget.
+    
+    Pipelines are keyed by (pipeline_type, model_name). Loads are single-flight: concurrent
+    requests for a model that is being loaded wait for that load instead of starting another.
+    Pinned entries (default models) are never evicted.
+    """
+    
+    def __init__(self, max_bytes: Optional[int] = None, size_fn: Callable[[Any], int] = estimate_pipeline_size):
+        """
+        Initialize model cache.
+        
+        Args:
+            max_bytes: Memory budget in bytes (None or 0 for no limit)
+            size_fn: Function estimating the memory held by a loaded pipeline
+        """
+        self.max_bytes = max_bytes or None
+        self.size_fn = size_fn
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._loading: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.load_waits = 0
+        self.load_failures = 0
+        self.evictions = 0
+    
+    def get(self, key: Tuple[str, str]) -> Optional[Any]:
+        """Get a cached pipeline without loading it"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry['pipeline']
+    
+    def get_or_load(self, key: Tuple[str, str], loader: Callable[[], Any], pinned: bool = False) -> Any:
+        """
+        Get a cached pipeline, loading it with loader() on a miss.
+        
+        Args:
+            key: (pipeline_type, model_name)
+            loader: Callable creating the pipeline
+            pinned: Never evict this entry
+            
+        Returns:
+            The pipeline instance
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry['uses'] += 1
+                self.hits += 1
+                return entry['pipeline']
+            
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._loading[key] = future
+                self.misses += 1
+            else:
+                self.load_waits += 1
+        
+        if not owner:
+            logger.info(f"⏳ Waiting for in-flight load of {key[0]} pipeline: {key[1]}")
+            return future.result()
+        
+        try:
+            start_time = time.time()
+            pipeline = loader()
+            load_time = time.time() - start_time
+            size = self.size_fn(pipeline)
+        except BaseException as e:
+            with self._lock:
+                self._loading.pop(key, None)
+                self.load_failures += 1
+            future.set_exception(e)
+            raise
+        
+        with self._lock:
+            self._entries[key] = {
+                'pipeline': pipeline,
+                'size': size,
+                'pinned': pinned,
+                'load_time': load_time,
+                'uses': 1,
+            }
+            self._total_bytes += size
+            self._loading.pop(key, None)
+            evicted = self._evict(keep=key)
+        
+        future.set_result(pipeline)
+        logger.info(f"📦 Cached {key[0]} pipeline {key[1]} ({size / (1024 * 1024):.0f} MB, loaded in {load_time:.1f}s)")
+        if evicted:
+            self._release_memory()
+        return pipeline
+    
+    def _evict(self, keep: Optional[Tuple[str, str]] = None) -> int:
+        """Evict least recently used unpinned entries until within budget (called with the lock held)"""
+        evicted = 0
+        while self.max_bytes is not None and self._total_bytes > self.max_bytes:
+            victim = next((k for k, e in self._entries.items() if not e['pinned'] and k != keep), None)
+            if victim is None:
+                logger.warning(f"⚠️ Model cache over budget ({self._total_bytes / (1024 * 1024):.0f} MB > "
+                               f"{self.max_bytes / (1024 * 1024):.0f} MB) but nothing left to evict")
+                break
+            entry = self._entries.pop(victim)
+            self._total_bytes -= entry['size']
+            self.evictions += 1
+            evicted += 1
+            logger.info(f"🧹 Evicted {victim[0]} pipeline {victim[1]} ({entry['size'] / (1024 * 1024):.0f} MB)")
+        return evicted
+    
+    @staticmethod
+    def _release_memory():
+        """Free memory held by evicted models (in-flight users keep their own references)"""
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+    
+    def set_max_bytes(self, max_bytes: Optional[int]):
+        """Change the memory budget, evicting if needed"""
+        with self._lock:
+            self.max_bytes = max_bytes or None
+            evicted = self._evict()
+        if evicted:
+            self._release_memory()
+    
+    def clear(self, pipeline_type: Optional[str] = None):
+        """Remove cached pipelines of one type (or all), including pinned ones"""
+        with self._lock:
+            for key in [k for k in self._entries if pipeline_type is None or k[0] == pipeline_type]:
+                self._total_bytes -= self._entries.pop(key)['size']
+        self._release_memory()
+    
+    def count(self, pipeline_type: str) -> int:
+        """Number of cached pipelines of a type"""
+        with self._lock:
+            return sum(1 for k in self._entries if k[0] == pipeline_type)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'load_waits': self.load_waits,
+                'load_failures': self.load_failures,
+                'evictions': self.evictions,
+                'loading': [f"{k[0]}:{k[1]}" for k in self._loading],
+                'models': [
+                    {
+                        'pipeline_type': k[0],
+                        'model_name': k[1],
+                        'size_bytes': e['size'],
+                        'pinned': e['pinned'],
+                        'load_time': e['load_time'],
+                        'uses': e['uses'],
+                        'stages': _stage_stats(e['pipeline']),
+                    }
+                    for k, e in self._entries.items()
+                ],
+            }
+
+
 class PipelineManager:
     """
     Manages pipeline instances with different models.
-    Caches pipelines by model_name to avoid reloading the same model.
+    Caches pipelines by model_name in a memory-budgeted LRU cache to avoid reloading the same model.
     """
     
-    def __init__(self):
-        self._transcription_pipelines: Dict[str, any] = {}
-        self._summarization_pipelines: Dict[str, any] = {}
-        self._translation_pipelines: Dict[str, any] = {}
-        self._tts_pipelines: Dict[str, any] = {}
+    # Pipeline types backed by HF seq2seq models that the optimized CPU mode applies to
+    CPU_OPTIMIZABLE_TYPES = ('transcription', 'summarization', 'translation')
+    
+    def __init__(self, max_memory_mb: Optional[float] = None, pipeline_options: Optional[Dict[str, Dict]] = None,
+                 optimize_cpu: bool = False, compile_models: bool = False,
+                 optimized_model_dir: Optional[str] = None, backend: str = "pytorch",
+                 onnx_cache_dir: Optional[str] = None):
+        """
+        Initialize pipeline manager.
+        
+        Args:
+            max_memory_mb: Memory budget for loaded models (None or 0 for no limit).
+                           Default models are pinned and never evicted.
+            pipeline_options: Extra constructor kwargs per pipeline type,
+                              e.g. {'transcription': {'batch_size': 4, 'use_vad': True, 'profile_stages': True}}
+            optimize_cpu: Int8 dynamic quantization for CPU transcription/summarization/translation models
+            compile_models: Also torch.compile those models' forward
+            optimized_model_dir: Disk cache for quantized weights (default: ~/.cache/violet/optimized_models)
+            backend: Inference backend for transcription/summarization/translation ("pytorch" or "onnx")
+            onnx_cache_dir: Disk cache for ONNX exports (default: ~/.cache/violet/onnx)
+        """
+        self.model_cache = ModelCache(int(max_memory_mb * 1024 * 1024) if max_memory_mb else None)
+        self.pipeline_options = pipeline_options or {}
+        self.optimize_cpu = optimize_cpu
+        self.compile_models = compile_models
+        self.optimized_model_dir = optimized_model_dir
+        self.backend = backend
+        self.onnx_cache_dir = onnx_cache_dir
         
         # Default models for each pipeline type
         self.default_models = {
@@ -30,6 +290,34 @@ class PipelineManager:
             'tts': 'tts_models/multilingual/multi-dataset/your_tts'
         }
     
+    def _pipeline_kwargs(self, pipeline_type: str) -> Dict[str, Any]:
+        """Constructor kwargs for a pipeline type (backend selection plus pipeline_options)"""
+        kwargs = {}
+        if pipeline_type in self.CPU_OPTIMIZABLE_TYPES:
+            kwargs = {'backend': self.backend, 'onnx_cache_dir': self.onnx_cache_dir}
+        kwargs.update(self.pipeline_options.get(pipeline_type, {}))
+        return kwargs
+
+    def _get_pipeline(self, pipeline_type: str, label: str, model_name: str, factory: Callable[[str], Any]):
+        """Get a pipeline from the model cache, creating it on a miss (single-flight)"""
+        key = (pipeline_type, model_name)
+        if self.model_cache.get(key) is not None:
+            logger.info(f"✅ Using cached {label} pipeline: {model_name}")
+        
+        def load():
+            logger.info(f"🔄 Creating new {label} pipeline with model: {model_name}")
+            pipeline = factory(model_name)
+            if (self.optimize_cpu or self.compile_models) and pipeline_type in self.CPU_OPTIMIZABLE_TYPES:
+                from template.pipelines.model_optimizer import DEFAULT_OPTIMIZED_MODEL_DIR, optimize_pipeline
+                optimize_pipeline(pipeline, quantize=self.optimize_cpu, compile=self.compile_models,
+                                  cache_dir=self.optimized_model_dir or DEFAULT_OPTIMIZED_MODEL_DIR)
+            logger.info(f"✅ {label[0].upper() + label[1:]} pipeline created and cached: {model_name}")
+            return pipeline
+        
+        return self.model_cache.get_or_load(
+            key, load, pinned=(model_name == self.default_models[pipeline_type])
+        )
+    
     def get_transcription_pipeline(self, model_name: Optional[str] = None):
         """Get transcription pipeline with specified model, or default if not specified"""
         import traceback
@@ -44,18 +332,9 @@ class PipelineManager:
         # Use default model if not specified
         model_name = model_name or self.default_models['transcription']
         
-        # Return cached pipeline if exists
-        if model_name in self._transcription_pipelines:
-            logger.info(f"✅ Using cached transcription pipeline: {model_name}")
-            return self._transcription_pipelines[model_name]
-        
-        # Create new pipeline with specified model
-        logger.info(f"🔄 Creating new transcription pipeline with model: {model_name}")
         try:
-            pipeline = TranscriptionPipeline(model_name=model_name)
-            self._transcription_pipelines[model_name] = pipeline
-            logger.info(f"✅ Transcription pipeline created and cached: {model_name}")
-            return pipeline
+            return self._get_pipeline('transcription', 'transcription', model_name,
+                                      lambda name: TranscriptionPipeline(model_name=name, **self._pipeline_kwargs('transcription')))
         except Exception as e:
             logger.error(f"❌ Failed to create transcription pipeline with model {model_name}: {e}")
             # Fallback to default model if specified model fails
@@ -71,18 +350,9 @@ class PipelineManager:
         # Use default model if not specified
         model_name = model_name or self.default_models['summarization']
         
-        # Return cached pipeline if exists
-        if model_name in self._summarization_pipelines:
-            logger.info(f"✅ Using cached summarization pipeline: {model_name}")
-            return self._summarization_pipelines[model_name]
-        
-        # Create new pipeline with specified model
-        logger.info(f"🔄 Creating new summarization pipeline with model: {model_name}")
         try:
-            pipeline = SummarizationPipeline(model_name=model_name)
-            self._summarization_pipelines[model_name] = pipeline
-            logger.info(f"✅ Summarization pipeline created and cached: {model_name}")
-            return pipeline
+            return self._get_pipeline('summarization', 'summarization', model_name,
+                                      lambda name: SummarizationPipeline(model_name=name, **self._pipeline_kwargs('summarization')))
         except Exception as e:
             logger.error(f"❌ Failed to create summarization pipeline with model {model_name}: {e}")
             # Fallback to default model if specified model fails
@@ -98,18 +368,9 @@ class PipelineManager:
         # Use default model if not specified
         model_name = model_name or self.default_models['translation']
         
-        # Return cached pipeline if exists
-        if model_name in self._translation_pipelines:
-            logger.info(f"✅ Using cached translation pipeline: {model_name}")
-            return self._translation_pipelines[model_name]
-        
-        # Create new pipeline with specified model
-        logger.info(f"🔄 Creating new translation pipeline with model: {model_name}")
         try:
-            pipeline = TranslationPipeline(model_name=model_name)
-            self._translation_pipelines[model_name] = pipeline
-            logger.info(f"✅ Translation pipeline created and cached: {model_name}")
-            return pipeline
+            return self._get_pipeline('translation', 'translation', model_name,
+                                      lambda name: TranslationPipeline(model_name=name, **self._pipeline_kwargs('translation')))
         except Exception as e:
             logger.error(f"❌ Failed to create translation pipeline with model {model_name}: {e}")
             # Fallback to default model if specified model fails
@@ -129,18 +390,9 @@ class PipelineManager:
         # Use default model if not specified
         model_name = model_name or self.default_models['tts']
         
-        # Return cached pipeline if exists
-        if model_name in self._tts_pipelines:
-            logger.info(f"✅ Using cached TTS pipeline: {model_name}")
-            return self._tts_pipelines[model_name]
-        
-        # Create new pipeline with specified model
-        logger.info(f"🔄 Creating new TTS pipeline with model: {model_name}")
         try:
-            pipeline = TTSPipeline(model_name=model_name)
-            self._tts_pipelines[model_name] = pipeline
-            logger.info(f"✅ TTS pipeline created and cached: {model_name}")
-            return pipeline
+            return self._get_pipeline('tts', 'TTS', model_name,
+                                      lambda name: TTSPipeline(model_name=name, **self._pipeline_kwargs('tts')))
         except Exception as e:
             logger.error(f"❌ Failed to create TTS pipeline with model {model_name}: {e}")
             # Fallback to default model if specified model fails
@@ -151,34 +403,40 @@ class PipelineManager:
     
     def clear_cache(self, pipeline_type: Optional[str] = None):
         """Clear pipeline cache for a specific type or all types"""
-        if pipeline_type == 'transcription' or pipeline_type is None:
-            self._transcription_pipelines.clear()
-        if pipeline_type == 'summarization' or pipeline_type is None:
-            self._summarization_pipelines.clear()
-        if pipeline_type == 'translation' or pipeline_type is None:
-            self._translation_pipelines.clear()
-        if pipeline_type == 'tts' or pipeline_type is None:
-            self._tts_pipelines.clear()
+        self.model_cache.clear(pipeline_type)
         logger.info(f"🧹 Pipeline cache cleared for: {pipeline_type or 'all'}")
     
-    def get_cache_stats(self) -> Dict[str, int]:
-        """Get statistics about cached pipelines"""
+    def set_memory_budget(self, max_memory_mb: Optional[float]):
+        """Change the model memory budget (None or 0 for no limit)"""
+        self.model_cache.set_max_bytes(int(max_memory_mb * 1024 * 1024) if max_memory_mb else None)
+    
+    def get_stage_stats(self) -> Dict[str, Any]:
+        """Aggregated stage timings of cached pipelines that profile their calls, keyed by type:model"""
+        return {
+            f"{model['pipeline_type']}:{model['model_name']}": model['stages']
+            for model in self.model_cache.get_stats()['models']
+            if model['stages'] is not None
+        }
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get statistics about cached pipelines (counts per type plus model cache details)"""
         return {
-            'transcription': len(self._transcription_pipelines),
-            'summarization': len(self._summarization_pipelines),
-            'translation': len(self._translation_pipelines),
-            'tts': len(self._tts_pipelines)
+            'transcription': self.model_cache.count('transcription'),
+            'summarization': self.model_cache.count('summarization'),
+            'translation': self.model_cache.count('translation'),
+            'tts': self.model_cache.count('tts'),
+            'model_cache': self.model_cache.get_stats()
         }
 
 # Global pipeline manager instance (lazy initialization)
 # Only created when explicitly accessed to avoid model loading during import
 _pipeline_manager_instance = None
 
-def get_pipeline_manager():
-    """Get or create the global pipeline manager instance (lazy)"""
+def get_pipeline_manager(**kwargs):
+    """Get or create the global pipeline manager instance (lazy, kwargs only apply on first creation)"""
     global _pipeline_manager_instance
     if _pipeline_manager_instance is None:
-        _pipeline_manager_instance = PipelineManager()
+        _pipeline_manager_instance = PipelineManager(**kwargs)
     return _pipeline_manager_instance
 
 # For backward compatibility - but creating new instances is preferred
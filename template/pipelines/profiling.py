@@ -0,0 +1,197 @@
+"""
+Per-Stage Profiling for Pipelines
+Times the stages of a pipeline call (decode, resample, feature extraction, generate, ...)
+and the memory each stage allocated, so a slow request can be attributed to a stage.
+
+A pipeline opens a trace around each public call with StageProfiler.trace(); code anywhere
+below it on the same thread marks stages with span(name), without the profiler being passed
+down. With profiling disabled no trace is opened and span() returns a shared no-op context.
+"""
+
+import functools
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+_NULL_SPAN = nullcontext()
+_END = object()
+_local = threading.local()
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size of this process (None without psutil)"""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def _cuda_bytes() -> Optional[int]:
+    """CUDA memory allocated by torch (None unless CUDA is in use)"""
+    torch = sys.modules.get("torch")
+    if torch is None or not torch.cuda.is_available() or not torch.cuda.is_initialized():
+        return None
+    return torch.cuda.memory_allocated()
+
+
+class StageTrace:
+    """Stage timings and memory deltas of a single pipeline call"""
+
+    def __init__(self, track_memory: bool = True):
+        self.track_memory = track_memory
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def span(self, name: str):
+        """Time a stage; repeated stages (e.g. one generate per batch) accumulate"""
+        rss_before = _rss_bytes() if self.track_memory else None
+        cuda_before = _cuda_bytes() if self.track_memory else None
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = {'calls': 0, 'time': 0.0}
+            stage['calls'] += 1
+            stage['time'] += elapsed
+            if rss_before is not None:
+                stage['rss_delta_mb'] = stage.get('rss_delta_mb', 0.0) + (_rss_bytes() - rss_before) / (1024 * 1024)
+            if cuda_before is not None:
+                stage['cuda_delta_mb'] = stage.get('cuda_delta_mb', 0.0) + (_cuda_bytes() - cuda_before) / (1024 * 1024)
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage calls, time (seconds) and memory deltas (MB)"""
+        return {name: dict(stage) for name, stage in self.stages.items()}
+
+
+def span(name: str):
+    """Mark a stage of the pipeline call traced on this thread (no-op outside a trace)"""
+    trace = getattr(_local, 'trace', None)
+    if trace is None:
+        return _NULL_SPAN
+    return trace.span(name)
+
+
+def timed_iter(iterable: Iterable, name: str) -> Iterator:
+    """Iterate, counting the time spent waiting for each item (e.g. a stream) as a stage"""
+    iterator = iter(iterable)
+    while True:
+        with span(name):
+            item = next(iterator, _END)
+        if item is _END:
+            return
+        yield item
+
+
+def traced(method):
+    """Run a pipeline method inside the pipeline's profiler trace (self.profiler)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = getattr(self, 'profiler', None)
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        with profiler.trace():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class StageProfiler:
+    """
+    Records stage traces of a pipeline's calls and aggregates them.
+
+    Usage:
+        with self.profiler.trace() as trace:
+            with span("generate"):
+                ...
+        if trace is not None:
+            metadata['stages'] = trace.to_dict()
+    """
+
+    def __init__(self, enabled: bool = False, track_memory: bool = True):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Record traces (otherwise trace() yields None and spans cost nothing)
+            track_memory: Record RSS (and CUDA) deltas per stage
+        """
+        self.enabled = enabled
+        self.track_memory = track_memory
+        self._lock = threading.Lock()
+        self._traces = 0
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def trace(self):
+        """
+        Trace a pipeline call on this thread.
+
+        Calls nested inside a traced call (e.g. summarize() from summarize_batch()) join the
+        outer trace, so their stages are counted once.
+
+        Yields:
+            StageTrace, or None when profiling is disabled
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        outer = getattr(_local, 'trace', None)
+        if outer is not None:
+            yield outer
+            return
+
+        trace = StageTrace(self.track_memory)
+        _local.trace = trace
+        try:
+            yield trace
+        finally:
+            _local.trace = None
+            self._record(trace)
+
+    def _record(self, trace: StageTrace):
+        """Add a finished trace to the totals"""
+        with self._lock:
+            self._traces += 1
+            for name, stage in trace.stages.items():
+                total = self._stages.get(name)
+                if total is None:
+                    total = self._stages[name] = {'calls': 0, 'total_time': 0.0, 'max_time': 0.0}
+                total['calls'] += stage['calls']
+                total['total_time'] += stage['time']
+                total['max_time'] = max(total['max_time'], stage['time'])
+                for key in ('rss_delta_mb', 'cuda_delta_mb'):
+                    if key in stage:
+                        total[key] = total.get(key, 0.0) + stage[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Aggregated stage statistics.
+
+        Returns:
+            Dict with the number of traced calls and, per stage, the total/average/maximum time
+            per traced call and the summed memory deltas
+        """
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'traced_calls': self._traces,
+                'stages': {
+                    name: {
+                        **total,
+                        'average_time': total['total_time'] / self._traces if self._traces else 0.0,
+                    }
+                    for name, total in self._stages.items()
+                },
+            }
+
+    def reset(self):
+        """Clear the aggregated statistics"""
+        with self._lock:
+            self._traces = 0
+            self._stages.clear()
@@ -3,11 +3,16 @@
 # TODO(developer): Set your name
 # Copyright © 2023 <your name>
 
+import hashlib
+import threading
 import time
 import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from template.utils.hf_token import get_hf_token_dict
+from template.pipelines.backends import load_seq2seq_model
+from template.pipelines.profiling import StageProfiler, span, traced
+from template.pipelines.text_chunker import chunk_text, get_tokenizer, plan_token_batches, token_counter
 
 
 class SummarizationPipeline:
@@ -16,12 +21,23 @@ class SummarizationPipeline:
     Supports multiple languages and model sizes.
     """
     
-    def __init__(self, model_name: str = "facebook/bart-large-cnn"):
+    def __init__(self, model_name: str = "facebook/bart-large-cnn", backend: str = "pytorch",
+                 onnx_cache_dir: Optional[str] = None, max_depth: int = 2, batch_size: Optional[int] = None,
+                 max_batch_tokens: Optional[int] = None, chunk_overlap: int = 64, cache_entries: int = 1024,
+                 profile_stages: bool = False):
         """
         Initialize the summarization pipeline.
         
         Args:
             model_name: HuggingFace model name for summarization
+            backend: "pytorch" or "onnx" (ONNX Runtime, export cached per model_name)
+            onnx_cache_dir: ONNX export cache directory
+            max_depth: Map-reduce rounds for inputs longer than the model input (0 = truncate instead)
+            batch_size: Maximum chunks summarized per generate call (default: 4)
+            max_batch_tokens: Padded input token budget per generate call (default: 4096)
+            chunk_overlap: Tokens of trailing context repeated between document chunks
+            cache_entries: Chunk summaries kept in the in-process cache (0 disables it)
+            profile_stages: Record per-stage timings (get_performance_stats)
         """
         import time
         start_time = time.time()
@@ -37,14 +53,16 @@ class SummarizationPipeline:
             
             # Load tokenizer first (faster)
             print(f"   Loading tokenizer...")
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name, **hf_token_kwargs)
+            self.tokenizer = get_tokenizer(model_name)
             print(f"   ✅ Tokenizer loaded")
             
             # Load model (slower, may download if not cached)
             print(f"   Loading model (this may take a while on first run)...")
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name, **hf_token_kwargs)
-            self.model.to(self.device)
-            print(f"   ✅ Model loaded and moved to {self.device}")
+            self.model, self.backend = load_seq2seq_model(
+                model_name, "seq2seq-lm", backend=backend, device=self.device,
+                cache_dir=onnx_cache_dir, hf_token_kwargs=hf_token_kwargs
+            )
+            print(f"   ✅ Model loaded on {self.device} ({self.backend} backend)")
             
             load_time = time.time() - start_time
             print(f"✅ Summarization pipeline initialized in {load_time:.2f}s")
@@ -67,11 +85,32 @@ class SummarizationPipeline:
             "ko": "korean",
             "zh": "chinese"
         }
+        
+        # Long-document (map-reduce) settings
+        self.max_depth = max(0, int(max_depth))
+        self.batch_size = max(1, int(batch_size)) if batch_size else 4
+        self.max_batch_tokens = max(1, int(max_batch_tokens)) if max_batch_tokens else 4096
+        self.chunk_overlap = max(0, int(chunk_overlap))
+        
+        # Chunk summaries by chunk hash, so resubmitted documents skip the map stage
+        self.cache_entries = max(0, int(cache_entries))
+        self._summary_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Per-stage timings (chunk, tokenize, generate, ...) when enabled
+        self.profiler = StageProfiler(enabled=profile_stages)
     
+    @traced
     def summarize(self, text: str, max_length: int = 130, min_length: int = 30, language: str = "en") -> Tuple[str, float]:
         """
         Summarize text.
         
+        Inputs longer than the model input are summarized map-reduce style: the document is
+        split into sentence-aligned chunks, the chunks are summarized in batches, and the
+        joined partial summaries are summarized again (up to max_depth rounds).
+        
         Args:
             text: Input text to summarize
             max_length: Maximum length of summary
@@ -84,35 +123,144 @@ class SummarizationPipeline:
         start_time = time.time()
         
         try:
-            # Tokenize input text
+            max_chunk_tokens = self._max_input_tokens() - self.tokenizer.num_special_tokens_to_add()
+            count_tokens = token_counter(self.tokenizer)
+            with span("chunk"):
+                chunks = chunk_text(text, max_chunk_tokens, count_tokens, overlap_tokens=self.chunk_overlap) or [text]
+            
+            # Map: summarize the chunks, then the joined partial summaries, until they fit one input
+            depth = 0
+            while len(chunks) > 1 and depth < self.max_depth:
+                depth += 1
+                print(f"📚 Summarizing {len(chunks)} chunks (round {depth}/{self.max_depth})")
+                partial_summaries = self._summarize_chunks(chunks, max_length, min_length)
+                chunks = chunk_text(" ".join(partial_summaries), max_chunk_tokens, count_tokens) or [""]
+            
+            if len(chunks) > 1:
+                # Cut the rest at a sentence boundary rather than mid-sentence
+                print(f"⚠️ Input still exceeds the model input after {depth} rounds, "
+                      f"summarizing the first {len(chunks[0])} characters")
+            
+            # Reduce: final summary
+            summary = self._summarize_chunks(chunks[:1], max_length, min_length)[0]
+            
+            processing_time = time.time() - start_time
+            
+            return summary.strip(), processing_time
+            
+        except Exception as e:
+            processing_time = time.time() - start_time
+            raise Exception(f"Summarization failed: {str(e)}")
+    
+    @traced
+    def summarize_batch(self, texts: List[str], max_length: int = 130, min_length: int = 30,
+                        language: str = "en") -> List[Tuple[str, float]]:
+        """
+        Summarize several independent texts together (used by the micro-batcher).
+        
+        Texts that fit the model input share padded generate calls; longer texts go through
+        the map-reduce path of summarize().
+        
+        Returns:
+            List of (summary_text, processing_time), in input order
+        """
+        start_time = time.time()
+        
+        try:
+            max_chunk_tokens = self._max_input_tokens() - self.tokenizer.num_special_tokens_to_add()
+            count_tokens = token_counter(self.tokenizer)
+            
+            summaries = [None] * len(texts)
+            single_chunk = {}
+            for i, text in enumerate(texts):
+                chunks = chunk_text(text, max_chunk_tokens, count_tokens) or [text]
+                if len(chunks) == 1:
+                    single_chunk[i] = chunks[0]
+                else:
+                    summaries[i] = self.summarize(text, max_length, min_length, language)[0]
+            
+            if single_chunk:
+                batch_summaries = self._summarize_chunks(list(single_chunk.values()), max_length, min_length)
+                for i, summary in zip(single_chunk, batch_summaries):
+                    summaries[i] = summary
+            
+            processing_time = time.time() - start_time
+            return [(summary.strip(), processing_time) for summary in summaries]
+            
+        except Exception as e:
+            raise Exception(f"Summarization failed: {str(e)}")
+    
+    def _max_input_tokens(self) -> int:
+        """Model input length in tokens"""
+        return min(self.tokenizer.model_max_length, 1024)
+    
+    def _cache_key(self, chunk: str, max_length: int, min_length: int) -> str:
+        """Cache key for a chunk summary"""
+        normalized = " ".join(chunk.split())
+        return hashlib.sha256(f"{self.model_name}\x00{max_length}\x00{min_length}\x00{normalized}".encode("utf-8")).hexdigest()
+    
+    def _summarize_chunks(self, chunks: List[str], max_length: int, min_length: int) -> List[str]:
+        """Summarize chunks in token-budgeted batches, serving repeated chunks from the cache"""
+        keys = [self._cache_key(chunk, max_length, min_length) for chunk in chunks]
+        summaries = {}
+        with self._cache_lock:
+            for key in keys:
+                if key in self._summary_cache:
+                    self._summary_cache.move_to_end(key)
+                    summaries[key] = self._summary_cache[key]
+                    self.cache_hits += 1
+        
+        missing = {}
+        for key, chunk in zip(keys, chunks):
+            if key not in summaries:
+                missing.setdefault(key, chunk)
+        
+        if missing:
+            missing_keys = list(missing)
+            texts = list(missing.values())
+            lengths = [len(ids) for ids in self.tokenizer(texts, max_length=self._max_input_tokens(), truncation=True)["input_ids"]]
+            for batch in plan_token_batches(lengths, self.max_batch_tokens, self.batch_size):
+                batch_summaries = self._generate([texts[i] for i in batch], max_length, min_length)
+                for i, summary in zip(batch, batch_summaries):
+                    summaries[missing_keys[i]] = summary
+            
+            with self._cache_lock:
+                self.cache_misses += len(missing_keys)
+                if self.cache_entries:
+                    for key in missing_keys:
+                        self._summary_cache[key] = summaries[key]
+                        self._summary_cache.move_to_end(key)
+                    while len(self._summary_cache) > self.cache_entries:
+                        self._summary_cache.popitem(last=False)
+        
+        return [summaries[key] for key in keys]
+    
+    def _generate(self, texts: List[str], max_length: int, min_length: int) -> List[str]:
+        """Summarize several texts in one padded generate call"""
+        # Tokenize input text
+        with span("tokenize"):
             inputs = self.tokenizer(
-                text, 
+                texts, 
                 return_tensors="pt", 
-                max_length=1024, 
+                max_length=self._max_input_tokens(), 
                 truncation=True,
                 padding=True
             ).to(self.device)
-            
-            # Generate summary
+        
+        # Generate summary
+        with span("generate"), torch.no_grad():
             summary_ids = self.model.generate(
-                inputs["input_ids"],
+                **inputs,
                 max_length=max_length,
                 min_length=min_length,
                 length_penalty=2.0,
                 num_beams=4,
                 early_stopping=True
             )
-            
-            # Decode summary
-            summary = self.tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-            
-            processing_time = time.time() - start_time
-            
-            return summary.strip(), processing_time
-            
-        except Exception as e:
-            processing_time = time.time() - start_time
-            raise Exception(f"Summarization failed: {str(e)}")
+        
+        # Decode summary
+        with span("postprocess"):
+            return [summary.strip() for summary in self.tokenizer.batch_decode(summary_ids, skip_special_tokens=True)]
     
     def get_supported_languages(self) -> list:
         """Get list of supported language codes."""
@@ -127,5 +275,19 @@ class SummarizationPipeline:
         return {
             "model_name": self.model_name,
             "max_input_length": self.tokenizer.model_max_length,
-            "vocab_size": self.tokenizer.vocab_size
+            "vocab_size": self.tokenizer.vocab_size,
+            "max_depth": self.max_depth,
+            "batch_size": self.batch_size,
+            "summary_cache": {
+                "entries": len(self._summary_cache),
+                "hits": self.cache_hits,
+                "misses": self.cache_misses
+            }
+        }
+    
+    def get_performance_stats(self) -> dict:
+        """Get performance statistics (per-stage timings when profile_stages is enabled)"""
+        return {
+            "model_info": self.get_model_info(),
+            "stages": self.profiler.get_stats()
         }
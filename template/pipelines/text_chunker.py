@@ -0,0 +1,153 @@
+"""
+Sentence-Aware Text Chunker for Pipelines
+Splits text on sentence boundaries and packs sentences into chunks up to a token budget.
+Shared by the translation, summarization and TTS pipelines. Token counts come from the
+model's tokenizer (cached per model name) or any counting function, e.g. len for characters.
+Chunks are grouped into padded generate batches by token budget with plan_token_batches.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sentence ends: terminal punctuation (with any closing quotes/brackets) before whitespace,
+# CJK terminal punctuation, or a paragraph break
+_SENTENCE_END = re.compile(r'[.!?…]+["\'”’)\]]*(?=\s|$)|[。！？]|\n\s*\n')
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences (paragraph breaks always end a sentence)"""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        sentence = text[start:match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    if text[start:].strip():
+        sentences.append(text[start:].strip())
+    return sentences
+
+
+@lru_cache(maxsize=8)
+def get_tokenizer(model_name: str):
+    """Load a HuggingFace tokenizer once per model name"""
+    from transformers import AutoTokenizer
+    from template.utils.hf_token import get_hf_token_dict
+    return AutoTokenizer.from_pretrained(model_name, **get_hf_token_dict())
+
+
+def token_counter(tokenizer) -> Callable[[str], int]:
+    """Token counting function for a tokenizer (special tokens excluded)"""
+    def count_tokens(text: str) -> int:
+        return len(tokenizer(text, add_special_tokens=False)["input_ids"])
+    return count_tokens
+
+
+def _split_words(sentence: str, max_tokens: int, count_tokens: Callable[[str], int]) -> List[str]:
+    """Split a sentence longer than the budget at word boundaries"""
+    pieces = []
+    current = []
+    current_tokens = 0
+    for word in sentence.split():
+        tokens = count_tokens(word)
+        if current and current_tokens + tokens + 1 > max_tokens:
+            pieces.append(" ".join(current))
+            current = []
+            current_tokens = 0
+        current.append(word)
+        current_tokens += tokens + (1 if len(current) > 1 else 0)
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def chunk_text(
+    text: str,
+    max_tokens: int,
+    count_tokens: Optional[Callable[[str], int]] = None,
+    overlap_tokens: int = 0
+) -> List[str]:
+    """
+    Split text into chunks of whole sentences, each at most max_tokens long.
+
+    Sentences are packed greedily; a sentence longer than the budget is split at word
+    boundaries. With overlap_tokens, each chunk starts with the trailing sentences of the
+    previous chunk (up to that many tokens) for context.
+
+    Args:
+        text: Input text
+        max_tokens: Budget per chunk, measured by count_tokens
+        count_tokens: Token counting function (default: characters)
+        overlap_tokens: Tokens of trailing context repeated from the previous chunk
+
+    Returns:
+        List of chunks (empty for blank text)
+    """
+    count_tokens = count_tokens or len
+    max_tokens = max(1, int(max_tokens))
+
+    segments = []
+    for sentence in split_sentences(text):
+        tokens = count_tokens(sentence)
+        if tokens > max_tokens:
+            segments.extend((piece, count_tokens(piece)) for piece in _split_words(sentence, max_tokens, count_tokens))
+        else:
+            segments.append((sentence, tokens))
+
+    chunks = []
+    current = []
+    current_tokens = 0
+    for segment, tokens in segments:
+        # +1 approximates the joining space
+        if current and current_tokens + tokens + 1 > max_tokens:
+            chunks.append(" ".join(s for s, _ in current))
+
+            # Carry trailing sentences over as context, keeping room for the next segment
+            carried = []
+            carried_tokens = 0
+            for previous, previous_tokens in reversed(current):
+                if carried_tokens + previous_tokens + 1 > min(overlap_tokens, max_tokens - tokens - 1):
+                    break
+                carried.insert(0, (previous, previous_tokens))
+                carried_tokens += previous_tokens + 1
+            current = carried
+            current_tokens = carried_tokens
+
+        current.append((segment, tokens))
+        current_tokens += tokens + (1 if len(current) > 1 else 0)
+
+    if current:
+        chunks.append(" ".join(s for s, _ in current))
+    return chunks
+
+
+def plan_token_batches(lengths: List[int], max_tokens: int, max_items: int) -> List[List[int]]:
+    """
+    Group items into batches whose padded size stays within a token budget.
+
+    Items are sorted by length (longest first) so each batch holds similar lengths and
+    wastes little padding. A batch costs (longest item) x (number of items) tokens; an item
+    longer than the budget gets a batch of its own.
+
+    Args:
+        lengths: Token count of each item
+        max_tokens: Padded token budget per batch
+        max_items: Maximum items per batch
+
+    Returns:
+        Batches as lists of indices into lengths
+    """
+    batches = []
+    current = []
+    for index in sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True):
+        if current and (len(current) >= max_items or lengths[current[0]] * (len(current) + 1) > max_tokens):
+            batches.append(current)
+            current = []
+        current.append(index)
+    if current:
+        batches.append(current)
+    return batches
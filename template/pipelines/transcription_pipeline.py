@@ -5,15 +5,18 @@
 import time
 import torch
 import numpy as np
-from transformers import WhisperProcessor, WhisperForConditionalGeneration
-import librosa
-import io
+from transformers import WhisperProcessor
 import soundfile as sf
-from typing import Optional, Tuple, List, Dict, Union
+from typing import Optional, Tuple, List, Dict, Iterable, Union
 import gc
+import os
 import logging
 from dataclasses import dataclass
 from template.utils.hf_token import get_hf_token_dict
+from template.pipelines.vad import segment_speech
+from template.pipelines.audio_decoder import load_audio
+from template.pipelines.backends import load_seq2seq_model
+from template.pipelines.profiling import StageProfiler, span, timed_iter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -45,25 +48,38 @@ class TranscriptionPipeline:
     Supports timestamped chunks and is compatible with existing miner code.
     """
     
-    def __init__(self, model_name: str = "openai/whisper-tiny", chunk_duration: float = 30.0):
+    def __init__(self, model_name: str = "openai/whisper-tiny", chunk_duration: float = 30.0,
+                 batch_size: Optional[int] = None, use_vad: bool = True,
+                 backend: str = "pytorch", onnx_cache_dir: Optional[str] = None,
+                 profile_stages: bool = False):
         """
         Initialize the transcription pipeline.
         
         Args:
             model_name: HuggingFace model name for Whisper
-            chunk_duration: Duration of each audio chunk in seconds
+            chunk_duration: Maximum duration of each audio chunk in seconds
+            batch_size: Number of chunks decoded per generate call (default: 8 on GPU, 4 on CPU)
+            use_vad: Segment long audio at pauses and skip silence instead of fixed slices
+            backend: "pytorch" or "onnx" (ONNX Runtime, export cached per model_name)
+            onnx_cache_dir: ONNX export cache directory
+            profile_stages: Record per-stage timings (metadata['stages'] and get_performance_stats)
         """
         self.model_name = model_name
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.chunk_duration = chunk_duration
+        self.profiler = StageProfiler(enabled=profile_stages)
+        self.use_vad = use_vad
+        self.batch_size = max(1, int(batch_size)) if batch_size else (8 if self.device == "cuda" else 4)
         
         # Load model and processor with HF token if available
         hf_token_kwargs = get_hf_token_dict()
         logger.info(f"🔄 Loading Whisper model: {model_name}")
         self.processor = WhisperProcessor.from_pretrained(model_name, **hf_token_kwargs)
-        self.model = WhisperForConditionalGeneration.from_pretrained(model_name, **hf_token_kwargs)
-        self.model.to(self.device)
-        logger.info(f"✅ Whisper model loaded successfully on {self.device}")
+        self.model, self.backend = load_seq2seq_model(
+            model_name, "speech-seq2seq", backend=backend, device=self.device,
+            cache_dir=onnx_cache_dir, hf_token_kwargs=hf_token_kwargs
+        )
+        logger.info(f"✅ Whisper model loaded successfully on {self.device} ({self.backend} backend)")
         
         # Language code mapping
         self.language_codes = {
@@ -72,13 +88,13 @@ class TranscriptionPipeline:
             "ko": "korean", "zh": "chinese", "ar": "arabic", "hi": "hindi"
         }
     
-    def transcribe(self, audio_bytes: bytes, language: str = "en") -> Tuple[str, float]:
+    def transcribe(self, audio_bytes: Union[bytes, str, os.PathLike], language: str = "en") -> Tuple[str, float]:
         """
         Transcribe audio and return (transcript, processing_time) tuple.
         This maintains compatibility with existing miner code.
         
         Args:
-            audio_bytes: Raw audio data
+            audio_bytes: Raw audio data or path to an audio file
             language: Language code (e.g., 'en', 'es')
             
         Returns:
@@ -87,23 +103,9 @@ class TranscriptionPipeline:
         start_time = time.time()
         
         try:
-            logger.info(f"🎵 Starting transcription of {len(audio_bytes)} bytes")
-            
-            # Preprocess audio
-            audio_array, sample_rate = self.preprocess_audio(audio_bytes)
-            audio_duration = len(audio_array) / sample_rate
-            
-            logger.info(f"📊 Audio info: {audio_duration:.2f}s duration, {sample_rate}Hz sample rate")
-            
-            # Check if chunking is needed
-            should_chunk = audio_duration > self.chunk_duration
-            
-            if should_chunk:
-                logger.info(f"✂️ Chunking audio for better processing")
-                result = self._transcribe_chunked(audio_array, sample_rate, language, start_time)
-            else:
-                logger.info(f"🔄 Processing audio as single chunk")
-                result = self._transcribe_single(audio_array, sample_rate, language, start_time)
+            logger.info(f"🎵 Starting transcription of {self._describe_input(audio_bytes)}")
+            with self.profiler.trace():
+                result = self._transcribe(audio_bytes, language, start_time)
             
             # Return tuple format for compatibility
             return result.full_text, result.processing_time
@@ -113,13 +115,28 @@ class TranscriptionPipeline:
             logger.error(f"❌ Transcription failed: {e}")
             return "", processing_time
     
-    def transcribe_with_timestamps(self, audio_bytes: bytes, language: str = "en") -> TranscriptionResult:
+    def _transcribe(self, audio_bytes: Union[bytes, str, os.PathLike], language: str, start_time: float) -> TranscriptionResult:
+        """Decode audio and transcribe it whole or in chunks"""
+        # Preprocess audio
+        audio_array, sample_rate = self.preprocess_audio(audio_bytes)
+        audio_duration = len(audio_array) / sample_rate
+        
+        logger.info(f"📊 Audio info: {audio_duration:.2f}s duration, {sample_rate}Hz sample rate")
+        
+        # Check if chunking is needed
+        if audio_duration > self.chunk_duration:
+            logger.info(f"✂️ Chunking audio for better processing")
+            return self._transcribe_chunked(audio_array, sample_rate, language, start_time)
+        logger.info(f"🔄 Processing audio as single chunk")
+        return self._transcribe_single(audio_array, sample_rate, language, start_time)
+    
+    def transcribe_with_timestamps(self, audio_bytes: Union[bytes, str, os.PathLike], language: str = "en") -> TranscriptionResult:
         """
         Transcribe audio with full timestamp information.
         Use this when you need detailed timing data.
         
         Args:
-            audio_bytes: Raw audio data
+            audio_bytes: Raw audio data or path to an audio file
             language: Language code
             
         Returns:
@@ -128,19 +145,12 @@ class TranscriptionPipeline:
         start_time = time.time()
         
         try:
-            logger.info(f"🎵 Starting timestamped transcription of {len(audio_bytes)} bytes")
-            
-            # Preprocess audio
-            audio_array, sample_rate = self.preprocess_audio(audio_bytes)
-            audio_duration = len(audio_array) / sample_rate
-            
-            # Check if chunking is needed
-            should_chunk = audio_duration > self.chunk_duration
-            
-            if should_chunk:
-                return self._transcribe_chunked(audio_array, sample_rate, language, start_time)
-            else:
-                return self._transcribe_single(audio_array, sample_rate, language, start_time)
+            logger.info(f"🎵 Starting timestamped transcription of {self._describe_input(audio_bytes)}")
+            with self.profiler.trace() as trace:
+                result = self._transcribe(audio_bytes, language, start_time)
+            if trace is not None:
+                result.metadata['stages'] = trace.to_dict()
+            return result
                 
         except Exception as e:
             processing_time = time.time() - start_time
@@ -151,33 +161,22 @@ class TranscriptionPipeline:
         """Transcribe audio as a single chunk"""
         try:
             # Prepare input for Whisper
-            inputs = self.processor(
-                audio_array, 
-                sampling_rate=sample_rate, 
-                return_tensors="pt"
-            ).input_features.to(self.device)
+            with span("features"):
+                inputs = self.processor(
+                    audio_array, 
+                    sampling_rate=sample_rate, 
+                    return_tensors="pt"
+                ).input_features.to(self.device)
             
-            # Get language ID for forced language decoding (if supported)
-            language_id = self.language_codes.get(language.lower(), None)
-            if language_id:
-                logger.info(f"🌐 Forcing transcription language: {language} ({language_id})")
+            generate_kwargs = self._get_generate_kwargs(language)
             
-            # Generate transcription with language forcing if specified
-            # Whisper can auto-detect, but we can force language by setting forced_decoder_ids
-            generate_kwargs = {}
-            if language_id and hasattr(self.processor, 'get_decoder_prompt_ids'):
-                try:
-                    forced_decoder_ids = self.processor.get_decoder_prompt_ids(language=language, task="transcribe")
-                    generate_kwargs['forced_decoder_ids'] = forced_decoder_ids
-                except:
-                    # If language forcing not supported, continue with auto-detection
-                    logger.debug(f"Language forcing not available for {language}, using auto-detection")
-            
-            predicted_ids = self.model.generate(inputs, **generate_kwargs)
-            transcription = self.processor.batch_decode(
-                predicted_ids, 
-                skip_special_tokens=True
-            )[0]
+            with span("generate"):
+                predicted_ids = self.model.generate(inputs, **generate_kwargs)
+            with span("postprocess"):
+                transcription = self.processor.batch_decode(
+                    predicted_ids, 
+                    skip_special_tokens=True
+                )[0]
             
             processing_time = time.time() - start_time
             
@@ -201,6 +200,7 @@ class TranscriptionPipeline:
                     'chunked': False,
                     'chunk_count': 1,
                     'model_used': self.model_name,
+                    'backend': self.backend,
                     'device': self.device
                 }
             )
@@ -209,74 +209,46 @@ class TranscriptionPipeline:
             logger.error(f"❌ Single chunk transcription failed: {e}")
             raise
     
+    def _get_generate_kwargs(self, language: str) -> Dict:
+        """Build generate() kwargs forcing the transcription language (if supported)"""
+        # Whisper can auto-detect, but we can force language by setting forced_decoder_ids
+        generate_kwargs = {}
+        language_id = self.language_codes.get(language.lower(), None)
+        if language_id and hasattr(self.processor, 'get_decoder_prompt_ids'):
+            logger.info(f"🌐 Forcing transcription language: {language} ({language_id})")
+            try:
+                generate_kwargs['forced_decoder_ids'] = self.processor.get_decoder_prompt_ids(language=language, task="transcribe")
+            except Exception:
+                # If language forcing not supported, continue with auto-detection
+                logger.debug(f"Language forcing not available for {language}, using auto-detection")
+        return generate_kwargs
+    
+    def _decode_batch(self, chunk_arrays: List[np.ndarray], sample_rate: int, generate_kwargs: Dict) -> List[str]:
+        """Extract features for several chunks at once and decode them in one generate call"""
+        # The feature extractor pads/trims every chunk to Whisper's 30s window, so features stack
+        with span("features"):
+            inputs = self.processor(
+                chunk_arrays,
+                sampling_rate=sample_rate,
+                return_tensors="pt"
+            ).input_features.to(self.device)
+        
+        with span("generate"), torch.no_grad():
+            predicted_ids = self.model.generate(inputs, **generate_kwargs)
+        
+        with span("postprocess"):
+            return [text.strip() for text in self.processor.batch_decode(predicted_ids, skip_special_tokens=True)]
+    
     def _transcribe_chunked(self, audio_array: np.ndarray, sample_rate: int, language: str, start_time: float) -> TranscriptionResult:
-        """Transcribe audio in chunks with timing information"""
+        """Transcribe audio in batches of chunks with timing information"""
         try:
             # Segment audio
-            chunks = self._segment_audio(audio_array, sample_rate)
+            with span("segment"):
+                chunks = self._segment_audio(audio_array, sample_rate)
+            generate_kwargs = self._get_generate_kwargs(language)
             
-            # Process chunks sequentially for reliability
-            transcribed_chunks = []
-            full_text_parts = []
-            
-            for i, (chunk, start_time_chunk, end_time_chunk) in enumerate(chunks):
-                try:
-                    # Prepare input for Whisper
-                    inputs = self.processor(
-                        chunk, 
-                        sampling_rate=sample_rate, 
-                        return_tensors="pt"
-                    ).input_features.to(self.device)
-                    
-                    # Get language ID for forced language decoding (if supported)
-                    language_id = self.language_codes.get(language.lower(), None)
-                    generate_kwargs = {}
-                    if language_id and hasattr(self.processor, 'get_decoder_prompt_ids'):
-                        try:
-                            forced_decoder_ids = self.processor.get_decoder_prompt_ids(language=language, task="transcribe")
-                            generate_kwargs['forced_decoder_ids'] = forced_decoder_ids
-                        except:
-                            # If language forcing not supported, continue with auto-detection
-                            pass
-                    
-                    # Generate transcription with language forcing if specified
-                    predicted_ids = self.model.generate(inputs, **generate_kwargs)
-                    transcription = self.processor.batch_decode(
-                        predicted_ids, 
-                        skip_special_tokens=True
-                    )[0]
-                    
-                    # Calculate confidence (simple heuristic)
-                    confidence = min(0.95, max(0.5, len(transcription.strip()) / 50))
-                    
-                    # Create chunk result
-                    chunk_result = TranscriptionChunk(
-                        start_time=start_time_chunk,
-                        end_time=end_time_chunk,
-                        text=transcription.strip(),
-                        confidence=confidence,
-                        language=language,
-                        chunk_index=i
-                    )
-                    
-                    transcribed_chunks.append(chunk_result)
-                    full_text_parts.append(transcription.strip())
-                    
-                    logger.info(f"✅ Chunk {i+1}/{len(chunks)} transcribed: {start_time_chunk:.1f}s - {end_time_chunk:.1f}s")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Chunk {i} transcription failed: {e}")
-                    # Create empty chunk for failed segment
-                    chunk_result = TranscriptionChunk(
-                        start_time=start_time_chunk,
-                        end_time=end_time_chunk,
-                        text="[Transcription failed]",
-                        confidence=0.0,
-                        language=language,
-                        chunk_index=i
-                    )
-                    transcribed_chunks.append(chunk_result)
-                    full_text_parts.append("[Transcription failed]")
+            transcribed_chunks = self._decode_chunks(chunks, sample_rate, language, generate_kwargs)
+            full_text_parts = [chunk.text for chunk in transcribed_chunks]
             
             processing_time = time.time() - start_time
             
@@ -289,7 +261,11 @@ class TranscriptionPipeline:
                 metadata={
                     'chunked': True,
                     'chunk_count': len(chunks),
+                    'vad': self.use_vad,
+                    'speech_duration': sum(end - start for _, start, end in chunks),
+                    'batch_size': self.batch_size,
                     'model_used': self.model_name,
+                    'backend': self.backend,
                     'device': self.device
                 }
             )
@@ -298,8 +274,165 @@ class TranscriptionPipeline:
             logger.error(f"❌ Chunked transcription failed: {e}")
             raise
     
+    def transcribe_stream(self, audio_blocks: Iterable[np.ndarray], language: str = "en",
+                          sample_rate: int = 16000, expected_duration: Optional[float] = None) -> TranscriptionResult:
+        """
+        Transcribe audio that arrives in blocks (e.g. from VideoProcessor.stream_audio).
+        
+        Once a full batch of chunks is buffered it is segmented and decoded while later blocks
+        are still being produced. The last chunk_duration seconds of the buffer are held back,
+        so no chunk is cut at a block boundary.
+        
+        Args:
+            audio_blocks: Iterable of mono float32 sample blocks at sample_rate
+            language: Language code
+            sample_rate: Sample rate of the blocks
+            expected_duration: Probed media duration in seconds, if known (for progress reporting)
+            
+        Returns:
+            TranscriptionResult with chunk times relative to the start of the stream
+        """
+        start_time = time.time()
+        generate_kwargs = self._get_generate_kwargs(language)
+        holdback = int(self.chunk_duration * sample_rate)
+        window = holdback * self.batch_size
+        
+        transcribed_chunks = []
+        speech_duration = 0.0
+        buffer = []
+        buffered = 0
+        consumed = 0  # Samples before the buffer
+        
+        def decode(chunks):
+            nonlocal speech_duration
+            speech_duration += sum(end - start for _, start, end in chunks)
+            transcribed_chunks.extend(self._decode_chunks(
+                chunks, sample_rate, language, generate_kwargs,
+                index_offset=len(transcribed_chunks), time_offset=consumed / sample_rate
+            ))
+        
+        try:
+            with self.profiler.trace() as trace:
+                for block in timed_iter(audio_blocks, "stream"):
+                    buffer.append(np.asarray(block, dtype=np.float32))
+                    buffered += len(block)
+                    if buffered < window + holdback:
+                        continue
+                
+                    audio = np.concatenate(buffer)
+                    with span("segment"):
+                        chunks = self._segment_audio(audio, sample_rate)
+                    limit = len(audio) - holdback
+                    ready = [chunk for chunk in chunks if int(round(chunk[2] * sample_rate)) <= limit]
+                    if ready:
+                        cut = int(round(ready[-1][2] * sample_rate))
+                    else:
+                        # No chunk finishes before the held-back tail: drop the silence before the first one
+                        cut = min(int(chunks[0][1] * sample_rate), limit) if chunks else limit
+                
+                    if ready:
+                        progress = f" of {expected_duration:.1f}s" if expected_duration else ""
+                        logger.info(f"🎞️ Transcribing {cut / sample_rate:.1f}s of streamed audio "
+                                    f"(at {consumed / sample_rate:.1f}s{progress})")
+                        decode(ready)
+                    consumed += cut
+                    buffer = [audio[cut:]]
+                    buffered = len(audio) - cut
+            
+                # Rest of the stream
+                if buffered:
+                    audio = np.concatenate(buffer)
+                    with span("segment"):
+                        chunks = self._segment_audio(audio, sample_rate)
+                    if chunks:
+                        decode(chunks)
+                    consumed += len(audio)
+            
+            processing_time = time.time() - start_time
+            logger.info(f"✅ Streamed transcription of {consumed / sample_rate:.1f}s of audio "
+                        f"completed in {processing_time:.2f}s")
+            
+            metadata = {
+                'chunked': True,
+                'streamed': True,
+                'expected_duration': expected_duration,
+                'chunk_count': len(transcribed_chunks),
+                'vad': self.use_vad,
+                'speech_duration': speech_duration,
+                'batch_size': self.batch_size,
+                'model_used': self.model_name,
+                'backend': self.backend,
+                'device': self.device
+            }
+            if trace is not None:
+                metadata['stages'] = trace.to_dict()
+            
+            return TranscriptionResult(
+                full_text=" ".join(chunk.text for chunk in transcribed_chunks),
+                chunks=transcribed_chunks,
+                total_duration=consumed / sample_rate,
+                processing_time=processing_time,
+                language=language,
+                metadata=metadata
+            )
+            
+        except Exception as e:
+            logger.error(f"❌ Streamed transcription failed: {e}")
+            raise
+    
+    def _decode_chunks(self, chunks: List[Tuple[np.ndarray, float, float]], sample_rate: int, language: str,
+                       generate_kwargs: Dict, index_offset: int = 0, time_offset: float = 0.0) -> List[TranscriptionChunk]:
+        """Decode segmented chunks in batches, shifting their times and indices by the given offsets"""
+        transcribed_chunks = []
+        
+        for batch_start in range(0, len(chunks), self.batch_size):
+            batch = chunks[batch_start:batch_start + self.batch_size]
+            batch_timer = time.time()
+            
+            try:
+                texts = self._decode_batch([chunk for chunk, _, _ in batch], sample_rate, generate_kwargs)
+            except Exception as e:
+                # Retry the batch chunk by chunk so one bad chunk doesn't fail its neighbours
+                logger.warning(f"⚠️ Batch of {len(batch)} chunks failed, decoding them individually: {e}")
+                texts = []
+                for offset, (chunk, _, _) in enumerate(batch):
+                    try:
+                        texts.append(self._decode_batch([chunk], sample_rate, generate_kwargs)[0])
+                    except Exception as chunk_error:
+                        logger.error(f"❌ Chunk {index_offset + batch_start + offset} transcription failed: {chunk_error}")
+                        texts.append(None)
+            
+            for offset, ((_, start_time_chunk, end_time_chunk), transcription) in enumerate(zip(batch, texts)):
+                if transcription is None:
+                    # Create empty chunk for failed segment
+                    transcription = "[Transcription failed]"
+                    confidence = 0.0
+                else:
+                    # Calculate confidence (simple heuristic)
+                    confidence = min(0.95, max(0.5, len(transcription) / 50))
+                
+                transcribed_chunks.append(TranscriptionChunk(
+                    start_time=time_offset + start_time_chunk,
+                    end_time=time_offset + end_time_chunk,
+                    text=transcription,
+                    confidence=confidence,
+                    language=language,
+                    chunk_index=index_offset + batch_start + offset
+                ))
+            
+            logger.info(f"✅ Chunks {batch_start + 1}-{batch_start + len(batch)}/{len(chunks)} transcribed: "
+                        f"{time_offset + batch[0][1]:.1f}s - {time_offset + batch[-1][2]:.1f}s in {time.time() - batch_timer:.2f}s")
+        
+        return transcribed_chunks
+    
     def _segment_audio(self, audio_array: np.ndarray, sample_rate: int) -> List[Tuple[np.ndarray, float, float]]:
         """Segment audio into chunks with timing information"""
+        if self.use_vad:
+            try:
+                return self._segment_audio_vad(audio_array, sample_rate)
+            except Exception as e:
+                logger.warning(f"⚠️ VAD segmentation failed, using fixed chunks: {e}")
+        
         chunk_samples = int(self.chunk_duration * sample_rate)
         chunks = []
         
@@ -319,19 +452,33 @@ class TranscriptionPipeline:
         logger.info(f"📊 Audio segmented into {len(chunks)} chunks of ~{self.chunk_duration}s each")
         return chunks
     
-    def preprocess_audio(self, audio_bytes: bytes) -> Tuple[np.ndarray, int]:
-        """Preprocess audio data for transcription"""
+    def _segment_audio_vad(self, audio_array: np.ndarray, sample_rate: int) -> List[Tuple[np.ndarray, float, float]]:
+        """Segment audio at pauses, dropping silence - chunk times stay relative to the original audio"""
+        segments = segment_speech(audio_array, sample_rate, max_duration=self.chunk_duration)
+        chunks = [
+            (audio_array[start_sample:end_sample], start_sample / sample_rate, end_sample / sample_rate)
+            for start_sample, end_sample in segments
+        ]
+        
+        total_duration = len(audio_array) / sample_rate
+        speech_duration = sum(end - start for _, start, end in chunks)
+        logger.info(f"📊 VAD segmented audio into {len(chunks)} chunks: {speech_duration:.1f}s of "
+                    f"{total_duration:.1f}s kept ({total_duration - speech_duration:.1f}s silence skipped)")
+        return chunks
+    
+    @staticmethod
+    def _describe_input(audio: Union[bytes, str, os.PathLike]) -> str:
+        """Describe audio input for logging"""
+        if isinstance(audio, (bytes, bytearray)):
+            return f"{len(audio)} bytes"
+        return f"file {os.fspath(audio)} ({os.path.getsize(audio)} bytes)"
+    
+    def preprocess_audio(self, audio_bytes: Union[bytes, str, os.PathLike]) -> Tuple[np.ndarray, int]:
+        """Preprocess audio data (raw bytes or a file path) for transcription"""
         try:
-            # Load audio using librosa
-            audio_array, sample_rate = librosa.load(io.BytesIO(audio_bytes), sr=16000)
-            
-            # Convert to mono if stereo
-            if len(audio_array.shape) > 1:
-                audio_array = np.mean(audio_array, axis=1)
-            
-            # Normalize audio
-            if np.max(np.abs(audio_array)) > 0:
-                audio_array = audio_array / np.max(np.abs(audio_array))
+            # Decode to 16kHz float32 mono, peak-normalized in place. WAV/FLAC are read through
+            # soundfile in blocks and only resampled if needed; other containers go through librosa.
+            audio_array, sample_rate = load_audio(audio_bytes, target_sr=16000)
             
             logger.info(f"✅ Audio preprocessed: {len(audio_array)} samples, {sample_rate}Hz")
             return audio_array, sample_rate
@@ -439,6 +586,20 @@ class TranscriptionPipeline:
         except Exception as e:
             logger.warning(f"⚠️ Memory cleanup failed: {e}")
 
+    def get_performance_stats(self) -> Dict:
+        """Get performance statistics (per-stage timings when profile_stages is enabled)"""
+        return {
+            'model_info': {
+                'name': self.model_name,
+                'backend': self.backend,
+                'device': self.device,
+                'chunk_duration': self.chunk_duration,
+                'batch_size': self.batch_size,
+                'vad': self.use_vad
+            },
+            'stages': self.profiler.get_stats()
+        }
+
 # Global instance for backward compatibility (lazy initialization)
 # Removed immediate instantiation to prevent model loading during import
 _transcription_pipeline_instance = None
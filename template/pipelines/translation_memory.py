@@ -0,0 +1,123 @@
+"""
+Translation Memory for Pipelines
+Segment-level cache of translations keyed by (model, source language, target language,
+normalized segment hash). An in-process LRU is backed by an optional SQLite database, so
+boilerplate repeated across documents (headers, footers, legal text) is translated once.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_segment(segment: str) -> str:
+    """Collapse whitespace so reflowed copies of a segment share a cache entry"""
+    return " ".join(segment.split())
+
+
+class TranslationMemory:
+    """In-process LRU of segment translations with an optional SQLite tier"""
+
+    def __init__(self, max_entries: int = 10000, db_path: Optional[str] = None):
+        """
+        Initialize translation memory
+
+        Args:
+            max_entries: Segments kept in memory - least recently used entries are evicted above it
+            db_path: SQLite database for a persistent tier (None for memory only)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        # Statistics
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS translations "
+                    "(key TEXT PRIMARY KEY, translation TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Translation memory database unavailable ({db_path}), using memory only: {e}")
+                self._db = None
+
+    @staticmethod
+    def make_key(model_name: str, source_language: str, target_language: str, segment: str) -> str:
+        """Cache key for a segment"""
+        normalized = normalize_segment(segment)
+        return hashlib.sha256(
+            f"{model_name}\x00{source_language}\x00{target_language}\x00{normalized}".encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached translation, checking memory first and then the database"""
+        with self._lock:
+            translation = self._entries.get(key)
+            if translation is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return translation
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute("SELECT translation FROM translations WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ Translation memory lookup failed: {e}")
+                    row = None
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, translation: str):
+        """Store a translation in memory and in the database"""
+        with self._lock:
+            self._remember(key, translation)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO translations (key, translation, created_at) VALUES (?, ?, ?)",
+                        (key, translation, time.time())
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ Translation memory write failed: {e}")
+
+    def _remember(self, key: str, translation: str):
+        """Insert into the LRU, evicting the oldest entries (called with the lock held)"""
+        self._entries[key] = translation
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get translation memory statistics"""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'persistent': self._db is not None,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
@@ -8,13 +8,12 @@ import time
 import torch
 import numpy as np
 from transformers import (
-    AutoTokenizer, 
-    AutoModelForSeq2SeqLM, 
     pipeline,
     MarianMTModel,
     MarianTokenizer
 )
 import io
+import re
 import fitz  # PyMuPDF for PDF processing
 from docx import Document
 import tempfile
@@ -22,23 +21,40 @@ import os
 from typing import Optional, Tuple, Dict, List, Union
 import logging
 from template.utils.hf_token import get_hf_token_dict
+from template.pipelines.backends import load_seq2seq_model
+from template.pipelines.profiling import StageProfiler, span, traced
+from template.pipelines.text_chunker import chunk_text, get_tokenizer, plan_token_batches, token_counter
+from template.pipelines.translation_memory import TranslationMemory
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
 class TranslationPipeline:
     """
     Machine translation pipeline using HuggingFace models.
     Supports multiple languages and document formats.
     """
     
-    def __init__(self, model_name: str = "t5-small"):
+    def __init__(self, model_name: str = "t5-small", backend: str = "pytorch",
+                 onnx_cache_dir: Optional[str] = None, batch_size: Optional[int] = None,
+                 max_batch_tokens: Optional[int] = None, memory_entries: int = 10000,
+                 memory_db: Optional[str] = None, profile_stages: bool = False):
         """
         Initialize the translation pipeline.
         
         Args:
             model_name: HuggingFace model name for translation
+            backend: "pytorch" or "onnx" (ONNX Runtime, export cached per model_name)
+            onnx_cache_dir: ONNX export cache directory
+            batch_size: Maximum chunks translated per generate call (default: 4)
+            max_batch_tokens: Padded input token budget per generate call (default: 4096)
+            memory_entries: Segments kept in the in-process translation memory (0 disables it)
+            memory_db: SQLite database for a persistent translation memory tier
+            profile_stages: Record per-stage timings (get_performance_stats)
         """
         self.model_name = model_name
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -87,29 +103,34 @@ class TranslationPipeline:
         # Get HF token if available
         hf_token_kwargs = get_hf_token_dict()
         
-        # Model loading with multiple fallback options
+        # Model loading with multiple fallback options (the requested model first)
         fallback_models = [
             "t5-small",  # Simple, reliable T5 model
             "Helsinki-NLP/opus-mt-en-es",  # Marian model
             "facebook/mbart-large-50-many-to-many-mmt"  # Multilingual model
         ]
+        if model_name:
+            fallback_models = [model_name] + [m for m in fallback_models if m != model_name]
         
         for fallback_model in fallback_models:
             try:
                 logger.info(f"🔄 Loading translation model: {fallback_model}")
-                self.tokenizer = AutoTokenizer.from_pretrained(fallback_model, **hf_token_kwargs)
-                self.model = AutoModelForSeq2SeqLM.from_pretrained(fallback_model, **hf_token_kwargs)
-                self.model.to(self.device)
+                self.tokenizer = get_tokenizer(fallback_model)
+                self.model, self.backend = load_seq2seq_model(
+                    fallback_model, "seq2seq-lm", backend=backend, device=self.device,
+                    cache_dir=onnx_cache_dir, hf_token_kwargs=hf_token_kwargs
+                )
                 self.model_name = fallback_model
-                logger.info(f"✅ Translation model loaded successfully on {self.device}: {fallback_model}")
+                logger.info(f"✅ Translation model loaded successfully on {self.device} "
+                            f"({self.backend} backend): {fallback_model}")
                 
-                # Try to use pipeline for easier inference
+                # Try to use pipeline for easier inference (sharing the loaded model)
                 try:
                     self.translation_pipeline = pipeline(
                         "translation", 
-                        model=fallback_model, 
-                        device=0 if self.device == "cuda" else -1,
-                        token=hf_token_kwargs.get("token") if hf_token_kwargs else None
+                        model=self.model, 
+                        tokenizer=self.tokenizer,
+                        device=0 if self.device == "cuda" else -1
                     )
                     logger.info("✅ Translation pipeline initialized successfully")
                     break
@@ -128,7 +149,14 @@ class TranslationPipeline:
         # Production settings
         self.max_chunk_size = 1000  # Maximum characters per translation chunk
         self.chunk_overlap = 50     # Characters overlap between chunks
-        self.max_concurrent_chunks = 4  # Maximum concurrent chunk processing
+        self.max_concurrent_chunks = max(1, int(batch_size)) if batch_size else 4  # Maximum chunks per generate batch
+        self.max_batch_tokens = max(1, int(max_batch_tokens)) if max_batch_tokens else 4096  # Padded tokens per batch
+        
+        # Segment-level translation memory, so repeated segments are translated once
+        self.memory = TranslationMemory(memory_entries, memory_db) if memory_entries else None
+        
+        # Per-stage timings (tokenize, generate, ...) when enabled
+        self.profiler = StageProfiler(enabled=profile_stages)
         
         # Performance monitoring
         self.processing_stats = {
@@ -138,6 +166,7 @@ class TranslationPipeline:
             'memory_usage_samples': []
         }
     
+    @traced
     def translate_text(
         self, 
         text: str, 
@@ -152,7 +181,7 @@ class TranslationPipeline:
             text: Input text to translate
             source_language: Source language code
             target_language: Target language code
-            max_length: Maximum length for translation chunks
+            max_length: Maximum input tokens per translation chunk
             
         Returns:
             Tuple of (translated_text, processing_time)
@@ -163,27 +192,13 @@ class TranslationPipeline:
             logger.info(f"🌐 Translating text from {source_language} to {target_language}")
             logger.info(f"   Text length: {len(text)} characters")
             
-            # Handle long texts by chunking
-            if len(text) > max_length:
-                logger.info(f"📝 Text is long ({len(text)} chars), chunking for translation")
-                translated_chunks = []
-                
-                # Split text into chunks
-                chunks = self._chunk_text(text, max_length)
-                logger.info(f"   Split into {len(chunks)} chunks")
-                
-                for i, chunk in enumerate(chunks):
-                    logger.info(f"   Translating chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
-                    translated_chunk = self._translate_chunk(chunk, source_language, target_language)
-                    translated_chunks.append(translated_chunk)
-                
-                # Combine translated chunks
-                translated_text = " ".join(translated_chunks)
-                logger.info(f"✅ Combined {len(translated_chunks)} translated chunks")
-                
-            else:
-                # Direct translation for short texts
-                translated_text = self._translate_chunk(text, source_language, target_language)
+            paragraphs = self._split_paragraphs(text, max_length, target_language)
+            chunks = [chunk for paragraph in paragraphs for chunk in paragraph]
+            if len(chunks) > 1:
+                logger.info(f"📝 Text is long ({len(text)} chars), split into {len(chunks)} chunks for translation")
+            
+            translated_chunks = self._translate_segments(chunks, source_language, target_language)
+            translated_text = self._join_paragraphs(paragraphs, translated_chunks)
             
             processing_time = time.time() - start_time
             logger.info(f"✅ Translation completed in {processing_time:.2f}s")
@@ -197,6 +212,104 @@ class TranslationPipeline:
             logger.error(f"❌ Translation failed: {e}")
             raise Exception(f"Translation failed: {str(e)}")
     
+    @traced
+    def translate_batch(
+        self, 
+        texts: List[str], 
+        source_language: str, 
+        target_language: str,
+        max_length: int = 512
+    ) -> List[Tuple[str, float]]:
+        """
+        Translate several independent texts together (used by the micro-batcher).
+        
+        The chunks of all texts are translated in shared token-budgeted batches.
+        
+        Args:
+            texts: Input texts to translate
+            source_language: Source language code
+            target_language: Target language code
+            max_length: Maximum input tokens per translation chunk
+            
+        Returns:
+            List of (translated_text, processing_time), in input order
+        """
+        start_time = time.time()
+        
+        try:
+            logger.info(f"🌐 Translating {len(texts)} texts from {source_language} to {target_language}")
+            split_texts = [self._split_paragraphs(text, max_length, target_language) for text in texts]
+            chunks = [chunk for paragraphs in split_texts for paragraph in paragraphs for chunk in paragraph]
+            translated_chunks = self._translate_segments(chunks, source_language, target_language)
+            
+            results = []
+            position = 0
+            for paragraphs in split_texts:
+                count = sum(len(paragraph) for paragraph in paragraphs)
+                results.append(self._join_paragraphs(paragraphs, translated_chunks[position:position + count]))
+                position += count
+            
+            processing_time = time.time() - start_time
+            logger.info(f"✅ Translated {len(texts)} texts ({len(chunks)} chunks) in {processing_time:.2f}s")
+            return [(translated_text, processing_time) for translated_text in results]
+            
+        except Exception as e:
+            logger.error(f"❌ Batch translation failed: {e}")
+            raise Exception(f"Translation failed: {str(e)}")
+    
+    def _split_paragraphs(self, text: str, max_length: int, target_language: str) -> List[List[str]]:
+        """Split into paragraphs, and those into sentence-aligned chunks within the model's input budget"""
+        with span("chunk"):
+            return [
+                self._chunk_text(paragraph, max_length, target_language)
+                for paragraph in _PARAGRAPH_BREAK.split(text) if paragraph.strip()
+            ] or [[text]]
+    
+    @staticmethod
+    def _join_paragraphs(paragraphs: List[List[str]], translated_chunks: List[str]) -> str:
+        """Combine translated chunks, keeping the paragraph breaks"""
+        translated_paragraphs = []
+        position = 0
+        for paragraph in paragraphs:
+            translated_paragraphs.append(" ".join(translated_chunks[position:position + len(paragraph)]))
+            position += len(paragraph)
+        return "\n\n".join(translated_paragraphs)
+    
+    def _translate_segments(
+        self, 
+        chunks: List[str], 
+        source_language: str, 
+        target_language: str
+    ) -> List[str]:
+        """Translate chunks, serving repeated segments from the translation memory"""
+        if self.memory is None:
+            return self._translate_chunks(chunks, source_language, target_language)
+        
+        keys = [TranslationMemory.make_key(self.model_name, source_language, target_language, chunk) for chunk in chunks]
+        translations = {}
+        with span("memory"):
+            for key in dict.fromkeys(keys):
+                cached = self.memory.get(key)
+                if cached is not None:
+                    translations[key] = cached
+        
+        # Each new segment is translated once, even if it repeats within the text
+        missing = {}
+        for key, chunk in zip(keys, chunks):
+            if key not in translations:
+                missing.setdefault(key, chunk)
+        if len(missing) < len(chunks):
+            logger.info(f"📚 Translation memory: {len(chunks) - len(missing)}/{len(chunks)} segments reused")
+        
+        if missing:
+            results = self._translate_chunks(list(missing.values()), source_language, target_language)
+            with span("memory"):
+                for key, result in zip(missing, results):
+                    translations[key] = result
+                    self.memory.put(key, result)
+        
+        return [translations[key] for key in keys]
+    
     def _translate_chunk(
         self, 
         text: str, 
@@ -205,68 +318,98 @@ class TranslationPipeline:
     ) -> str:
         """Translate a single chunk of text"""
         try:
-            if self.translation_pipeline:
-                # Use pipeline if available
-                result = self.translation_pipeline(text)
-                return result[0]['translation_text']
-            else:
-                # Manual inference with T5-style prefix
-                if "t5" in self.model_name.lower():
-                    # T5 models need translation prefix
-                    prefix = f"translate English to {target_language}: "
-                    input_text = prefix + text
-                elif "mbart" in self.model_name.lower():
-                    # mBART models need language codes
-                    input_text = text
-                else:
-                    # Marian models work directly
-                    input_text = text
-                
-                inputs = self.tokenizer(
-                    input_text, 
-                    return_tensors="pt", 
-                    max_length=512, 
-                    truncation=True,
-                    padding=True
-                ).to(self.device)
-                
-                outputs = self.model.generate(
-                    **inputs,
-                    max_length=512,
-                    num_beams=4,
-                    early_stopping=True,
-                    pad_token_id=self.tokenizer.eos_token_id
-                )
-                
-                translated_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-                return translated_text
-                
+            return self._translate_batch([text], source_language, target_language)[0]
         except Exception as e:
             logger.error(f"❌ Chunk translation failed: {e}")
             raise
     
-    def _chunk_text(self, text: str, max_length: int) -> List[str]:
-        """Split text into chunks for translation"""
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_length = 0
+    def _prepare_input(self, text: str, target_language: str) -> str:
+        """Model-specific input text for manual inference"""
+        if "t5" in self.model_name.lower():
+            # T5 models need translation prefix
+            return f"translate English to {target_language}: " + text
+        # mBART models need language codes, Marian models work directly
+        return text
+    
+    def _translate_batch(
+        self, 
+        texts: List[str], 
+        source_language: str, 
+        target_language: str
+    ) -> List[str]:
+        """Translate several chunks in one padded generate call"""
+        if self.translation_pipeline:
+            # Use pipeline if available (tokenization and decoding happen inside it)
+            with span("generate"):
+                results = self.translation_pipeline(texts, batch_size=len(texts))
+            return [result['translation_text'] for result in results]
         
-        for word in words:
-            word_length = len(word) + 1  # +1 for space
-            if current_length + word_length > max_length and current_chunk:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_length = word_length
-            else:
-                current_chunk.append(word)
-                current_length += word_length
+        with span("tokenize"):
+            inputs = self.tokenizer(
+                [self._prepare_input(text, target_language) for text in texts], 
+                return_tensors="pt", 
+                max_length=512, 
+                truncation=True,
+                padding=True
+            ).to(self.device)
         
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        with span("generate"), torch.no_grad():
+            outputs = self.model.generate(
+                **inputs,
+                max_length=512,
+                num_beams=4,
+                early_stopping=True,
+                pad_token_id=self.tokenizer.eos_token_id
+            )
         
-        return chunks
+        with span("postprocess"):
+            return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
     
+    def _translate_chunks(
+        self, 
+        chunks: List[str], 
+        source_language: str, 
+        target_language: str
+    ) -> List[str]:
+        """Translate chunks in token-budgeted batches, returning translations in chunk order"""
+        if len(chunks) == 1:
+            # Direct translation for short texts
+            return [self._translate_chunk(chunks[0], source_language, target_language)]
+
+        with span("tokenize"):
+            token_ids = self.tokenizer(
+                [self._prepare_input(chunk, target_language) for chunk in chunks],
+                max_length=512,
+                truncation=True
+            )["input_ids"]
+        batches = plan_token_batches([len(ids) for ids in token_ids], self.max_batch_tokens, self.max_concurrent_chunks)
+        logger.info(f"   Translating {len(chunks)} chunks in {len(batches)} batches")
+        
+        translated_chunks = [None] * len(chunks)
+        for batch_number, batch in enumerate(batches):
+            batch_timer = time.time()
+            texts = [chunks[i] for i in batch]
+            try:
+                results = self._translate_batch(texts, source_language, target_language)
+            except Exception as e:
+                # Retry the batch chunk by chunk so one bad chunk doesn't fail its neighbours
+                logger.warning(f"⚠️ Batch of {len(batch)} chunks failed, translating them individually: {e}")
+                results = [self._translate_chunk(text, source_language, target_language) for text in texts]
+            
+            for index, result in zip(batch, results):
+                translated_chunks[index] = result
+            logger.info(f"   Batch {batch_number + 1}/{len(batches)}: {len(batch)} chunks "
+                        f"in {time.time() - batch_timer:.2f}s")
+        
+        return translated_chunks
+    
+    def _chunk_text(self, text: str, max_length: int, target_language: str) -> List[str]:
+        """Split text into sentence-aligned chunks that fit the model input (prefix and special tokens included)"""
+        overhead = len(self.tokenizer(self._prepare_input("", target_language))["input_ids"])
+        max_tokens = min(max_length, 512) - overhead
+        return chunk_text(text, max_tokens, token_counter(self.tokenizer)) or [text]
+    
+    @traced
     def translate_document(
         self, 
         file_data, 
@@ -296,14 +439,15 @@ class TranslationPipeline:
             # Extract text from document based on file type
             file_extension = filename.lower().split('.')[-1]
             
-            if file_extension == 'pdf':
-                extracted_text = self._extract_text_from_pdf(file_data)
-            elif file_extension == 'docx':
-                extracted_text = self._extract_text_from_docx(file_data)
-            elif file_extension in ['txt', 'text']:
-                extracted_text = self._extract_text_from_txt(file_data)
-            else:
-                raise Exception(f"Unsupported file format: {file_extension}")
+            with span("extract"):
+                if file_extension == 'pdf':
+                    extracted_text = self._extract_text_from_pdf(file_data)
+                elif file_extension == 'docx':
+                    extracted_text = self._extract_text_from_docx(file_data)
+                elif file_extension in ['txt', 'text']:
+                    extracted_text = self._extract_text_from_txt(file_data)
+                else:
+                    raise Exception(f"Unsupported file format: {file_extension}")
             
             logger.info(f"✅ Text extracted: {len(extracted_text)} characters")
             
@@ -501,7 +645,9 @@ class TranslationPipeline:
                 'max_chunk_size': self.max_chunk_size,
                 'chunk_overlap': self.chunk_overlap,
                 'max_concurrent_chunks': self.max_concurrent_chunks
-            }
+            },
+            'translation_memory': self.memory.get_stats() if self.memory else None,
+            'stages': self.profiler.get_stats()
         }
     
     def optimize_for_production(self, target_max_chunk_size: int = 800, target_chunk_overlap: int = 30):
@@ -7,9 +7,7 @@ import time
 import torch
 import numpy as np
 from TTS.api import TTS
-import io
-import soundfile as sf
-from typing import Optional, Tuple, List, Dict
+from typing import Optional, Tuple, List, Dict, Iterator
 import gc
 import psutil
 import logging
@@ -17,11 +15,31 @@ from dataclasses import dataclass
 import threading
 import tempfile
 import os
+import struct
+from template.pipelines.audio_encoding import encode_audio
+from template.pipelines.profiling import StageProfiler, span, traced
+from template.pipelines.text_chunker import chunk_text, split_sentences
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def streaming_wav_header(sample_rate: int, channels: int = 1, bits_per_sample: int = 16) -> bytes:
+    """WAV header for a stream of unknown length (sizes set to the maximum, as streaming players expect)"""
+    byte_rate = sample_rate * channels * bits_per_sample // 8
+    block_align = channels * bits_per_sample // 8
+    return (
+        b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, byte_rate, block_align, bits_per_sample)
+        + b"data" + struct.pack("<I", 0xFFFFFFFF)
+    )
+
+
+def to_pcm16(audio) -> bytes:
+    """Convert float audio in [-1, 1] to 16-bit little-endian PCM"""
+    return (np.clip(np.asarray(audio, dtype=np.float32), -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
 @dataclass
 class TTSSynthesisResult:
     """Result of TTS synthesis with metadata"""
@@ -41,12 +59,14 @@ class TTSPipeline:
     Supports multiple languages and voices.
     """
     
-    def __init__(self, model_name: str = "tts_models/multilingual/multi-dataset/your_tts"):
+    def __init__(self, model_name: str = "tts_models/multilingual/multi-dataset/your_tts",
+                 profile_stages: bool = False):
         """
         Initialize the TTS pipeline with a multilingual model.
         
         Args:
             model_name: TTS model name from Coqui TTS (default: multilingual model)
+            profile_stages: Record per-stage timings (get_performance_stats)
         """
         self.model_name = model_name
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -96,6 +116,7 @@ class TTSPipeline:
         
         # Production settings
         self.max_text_length = 5000  # Maximum characters per synthesis
+        self.max_stream_block_length = 250  # Maximum characters per streamed block (synthesize_stream)
         self.chunk_overlap = 100     # Characters overlap between chunks
         
         # Performance monitoring
@@ -105,8 +126,11 @@ class TTSPipeline:
             'total_processing_time': 0.0,
             'memory_usage_samples': []
         }
+        self.profiler = StageProfiler(enabled=profile_stages)
     
-    def synthesize(self, text: str, language: str = "en", speaker: Optional[str] = None) -> Tuple[bytes, float]:
+    @traced
+    def synthesize(self, text: str, language: str = "en", speaker: Optional[str] = None,
+                   output_format: str = "wav") -> Tuple[bytes, float]:
         """
         Synthesize text to speech.
         
@@ -114,6 +138,7 @@ class TTSPipeline:
             text: Input text to synthesize
             language: Language code (e.g., 'en', 'es', 'fr')
             speaker: Speaker name (if model supports multiple speakers)
+            output_format: Audio encoding - "wav", "flac", "opus" or "mp3"
             
         Returns:
             Tuple of (audio_bytes, processing_time)
@@ -122,45 +147,102 @@ class TTSPipeline:
         
         try:
             # Prepare synthesis parameters
-            synthesis_params = {"text": text}
-            
-            # Add language if model is multilingual
-            if self.is_multilingual and language in self.language_codes:
-                synthesis_params["language"] = self.language_codes.get(language, "en")
-                print(f"🎵 Using language: {language} for TTS synthesis")
-            elif not self.is_multilingual:
-                print(f"⚠️ Model is not multilingual, ignoring language parameter: {language}")
-            
-            # Add speaker if specified and supported
-            if speaker and hasattr(self.tts, 'speakers') and speaker in self.tts.speakers:
-                synthesis_params["speaker"] = speaker
-                print(f"🎤 Using speaker: {speaker}")
-            elif hasattr(self.tts, 'speakers') and self.tts.speakers:
-                # Auto-select first available speaker if none specified
-                default_speaker = self.tts.speakers[0]
-                synthesis_params["speaker"] = default_speaker
-                print(f"🎤 Auto-selected speaker: {default_speaker}")
-            
+            synthesis_params = self._synthesis_params(text, language, speaker)
             print(f"🔧 TTS synthesis parameters: {synthesis_params}")
             
-            # Synthesize audio
-            audio_array = self.tts.tts(**synthesis_params)
+            # Synthesize long texts in sentence-aligned chunks of at most max_text_length characters
+            chunks = chunk_text(text, self.max_text_length) or [text]
+            if len(chunks) > 1:
+                print(f"📝 Text is long ({len(text)} chars), synthesizing {len(chunks)} chunks")
+            audio_parts = []
+            for chunk in chunks:
+                synthesis_params["text"] = chunk
+                with span("synthesis"):
+                    audio_parts.append(np.asarray(self.tts.tts(**synthesis_params), dtype=np.float32))
+            audio_array = np.concatenate(audio_parts)
             
-            # Convert to bytes
-            audio_bytes = io.BytesIO()
-            sf.write(audio_bytes, audio_array, self.tts.synthesizer.output_sample_rate, format='WAV')
-            audio_bytes.seek(0)
+            # Encode (WAV unless a compressed format was requested)
+            with span("encode"):
+                encoded = encode_audio(audio_array, self.tts.synthesizer.output_sample_rate, output_format)
             
             processing_time = time.time() - start_time
-            print(f"✅ TTS synthesis completed in {processing_time:.2f}s")
+            print(f"✅ TTS synthesis completed in {processing_time:.2f}s ({encoded.output_format}, {len(encoded.data)} bytes)")
             
-            return audio_bytes.read(), processing_time
+            return encoded.data, processing_time
             
         except Exception as e:
             processing_time = time.time() - start_time
             print(f"❌ TTS synthesis error: {str(e)}")
             raise Exception(f"TTS synthesis failed: {str(e)}")
     
+    def synthesize_stream(self, text: str, language: str = "en", speaker: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Synthesize text sentence by sentence, yielding audio as it is produced.
+        
+        Time to first audio is the synthesis time of the first sentence rather than of the
+        whole text. Sentences longer than max_stream_block_length characters (or text without
+        terminal punctuation) are split at word boundaries, so no block grows unbounded.
+        Prepend streaming_wav_header(self.sample_rate) to get a playable WAV stream.
+        
+        Args:
+            text: Input text to synthesize
+            language: Language code (e.g., 'en', 'es', 'fr')
+            speaker: Speaker name (if model supports multiple speakers)
+            
+        Yields:
+            16-bit mono PCM blocks at self.sample_rate, one per sentence (or sentence piece)
+        """
+        start_time = time.time()
+        synthesis_params = self._synthesis_params(text, language, speaker)
+        sentences = [
+            piece
+            for sentence in split_sentences(text)
+            for piece in chunk_text(sentence, self.max_stream_block_length)
+        ] or [text]
+        
+        for i, sentence in enumerate(sentences):
+            synthesis_params["text"] = sentence
+            try:
+                audio_array = self.tts.tts(**synthesis_params)
+            except Exception as e:
+                print(f"❌ TTS synthesis error in sentence {i + 1}/{len(sentences)}: {str(e)}")
+                raise Exception(f"TTS synthesis failed: {str(e)}")
+            if i == 0:
+                print(f"🎵 First audio block ready in {time.time() - start_time:.2f}s")
+            yield to_pcm16(audio_array)
+        
+        processing_time = time.time() - start_time
+        self._update_stats(len(text), processing_time)
+        print(f"✅ Streamed TTS synthesis of {len(sentences)} sentences completed in {processing_time:.2f}s")
+    
+    @property
+    def sample_rate(self) -> int:
+        """Output sample rate of the loaded model"""
+        return self.tts.synthesizer.output_sample_rate
+    
+    def _synthesis_params(self, text: str, language: str, speaker: Optional[str]) -> Dict:
+        """Build tts() arguments (language and speaker only where the model supports them)"""
+        synthesis_params = {"text": text}
+        
+        # Add language if model is multilingual
+        if self.is_multilingual and language in self.language_codes:
+            synthesis_params["language"] = self.language_codes.get(language, "en")
+            print(f"🎵 Using language: {language} for TTS synthesis")
+        elif not self.is_multilingual:
+            print(f"⚠️ Model is not multilingual, ignoring language parameter: {language}")
+        
+        # Add speaker if specified and supported
+        if speaker and hasattr(self.tts, 'speakers') and speaker in self.tts.speakers:
+            synthesis_params["speaker"] = speaker
+            print(f"🎤 Using speaker: {speaker}")
+        elif hasattr(self.tts, 'speakers') and self.tts.speakers:
+            # Auto-select first available speaker if none specified
+            default_speaker = self.tts.speakers[0]
+            synthesis_params["speaker"] = default_speaker
+            print(f"🎤 Auto-selected speaker: {default_speaker}")
+        
+        return synthesis_params
+    
     def get_available_models(self) -> list:
         """Get list of available TTS models."""
         return TTS.list_models()
@@ -219,7 +301,8 @@ class TTSPipeline:
                 'name': self.model_name,
                 'max_text_length': self.max_text_length,
                 'chunk_overlap': self.chunk_overlap
-            }
+            },
+            'stages': self.profiler.get_stats()
         }
     
     def optimize_for_production(self, target_max_text_length: int = 3000, target_chunk_overlap: int = 50):
@@ -0,0 +1,120 @@
+"""
+Energy-based Voice Activity Detection for Pipelines
+CPU-only NumPy segmenter that drops silent regions, cuts at pauses and merges short
+speech runs into chunks up to the model window, so silence isn't sent to Whisper.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+def frame_energies_db(audio: np.ndarray, frame_length: int) -> np.ndarray:
+    """RMS energy (dB) of consecutive non-overlapping frames; the last partial frame is included"""
+    num_frames = int(np.ceil(len(audio) / frame_length))
+    padded = np.zeros(num_frames * frame_length, dtype=np.float32)
+    padded[:len(audio)] = audio
+    frames = padded.reshape(num_frames, frame_length)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """[start, end) index pairs of consecutive True values"""
+    if not len(mask):
+        return []
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return list(zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+
+def segment_speech(
+    audio: np.ndarray,
+    sample_rate: int,
+    max_duration: float = 30.0,
+    frame_ms: float = 30.0,
+    threshold_margin_db: float = 12.0,
+    dynamic_range_db: float = 45.0,
+    min_silence: float = 0.5,
+    min_speech: float = 0.25,
+    padding: float = 0.2,
+) -> List[Tuple[int, int]]:
+    """
+    Find speech and group it into chunks no longer than max_duration.
+
+    The speech threshold adapts to the recording: it sits threshold_margin_db above the noise
+    floor (10th percentile of frame energy), but never more than dynamic_range_db below the peak.
+
+    Args:
+        audio: Mono audio samples
+        sample_rate: Sample rate of the audio
+        max_duration: Maximum chunk length in seconds (the model window)
+        frame_ms: Analysis frame length in milliseconds
+        threshold_margin_db: Speech threshold above the estimated noise floor
+        dynamic_range_db: Frames quieter than this below the peak are always silence
+        min_silence: Pauses shorter than this (seconds) don't split speech
+        min_speech: Speech runs shorter than this (seconds) are dropped as clicks/noise
+        padding: Seconds of context kept around each speech run
+
+    Returns:
+        List of (start_sample, end_sample) chunks in order; empty if there is no speech
+    """
+    if len(audio) == 0:
+        return []
+
+    frame_length = max(1, int(sample_rate * frame_ms / 1000))
+    frame_seconds = frame_length / sample_rate
+    energies = frame_energies_db(audio, frame_length)
+
+    noise_floor = float(np.percentile(energies, 10))
+    peak = float(np.max(energies))
+    if peak <= -100.0:
+        # Digital silence
+        return []
+    if peak - noise_floor < threshold_margin_db:
+        # No usable dynamics (constant noise or continuous speech) - keep everything
+        speech = np.ones(len(energies), dtype=bool)
+    else:
+        threshold = max(noise_floor + threshold_margin_db, peak - dynamic_range_db)
+        speech = energies > threshold
+
+    # Bridge short pauses, then drop short blips
+    min_silence_frames = int(round(min_silence / frame_seconds))
+    for start, end in _runs(~speech):
+        if 0 < start and end < len(speech) and end - start < min_silence_frames:
+            speech[start:end] = True
+    min_speech_frames = max(1, int(round(min_speech / frame_seconds)))
+    regions = [(start, end) for start, end in _runs(speech) if end - start >= min_speech_frames]
+    if not regions:
+        return []
+
+    # Pad regions (merging any that now touch)
+    pad_frames = int(round(padding / frame_seconds))
+    padded = []
+    for start, end in regions:
+        start, end = max(0, start - pad_frames), min(len(energies), end + pad_frames)
+        if padded and start <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], max(padded[-1][1], end))
+        else:
+            padded.append((start, end))
+
+    # Split regions longer than the window at their quietest frame in the second half of the window
+    max_frames = max(1, int(max_duration / frame_seconds))
+    pieces = []
+    for start, end in padded:
+        while end - start > max_frames:
+            search_start = start + max_frames // 2
+            cut = search_start + int(np.argmin(energies[search_start:start + max_frames]))
+            cut = max(cut, start + 1)
+            pieces.append((start, cut))
+            start = cut
+        pieces.append((start, end))
+
+    # Merge neighbouring pieces while the combined span fits in the window
+    chunks = [pieces[0]]
+    for start, end in pieces[1:]:
+        if end - chunks[-1][0] <= max_frames:
+            chunks[-1] = (chunks[-1][0], end)
+        else:
+            chunks.append((start, end))
+
+    return [(start * frame_length, min(end * frame_length, len(audio))) for start, end in chunks]
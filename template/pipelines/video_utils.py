@@ -4,27 +4,343 @@ Video processing utilities for extracting audio from video files
 """
 
 import os
+import hashlib
+import json
+import queue
 import tempfile
 import subprocess
+import threading
+import time
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional, Union
 import shutil
 
+import numpy as np
+
+from template.pipelines.audio_encoding import encode_audio
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Extraction timeout: a floor, plus a budget per second of media
+MIN_EXTRACTION_TIMEOUT = 60.0
+EXTRACTION_SECONDS_PER_MEDIA_SECOND = 0.25
+
+# Low bitrate (128 kbit/s) used to bound the duration of a video from its size when unknown
+MIN_BITRATE_BYTES_PER_SECOND = 16000
+
+# Containers whose index may sit at the end of the file - FFmpeg needs a seekable path for these
+SEEKABLE_CONTAINERS = {'.mp4', '.mov', '.m4v', '.m4a', '.3gp'}
+
+# Audio per streamed block: about a tenth of the media, within these bounds (seconds)
+MIN_BLOCK_SECONDS = 2.0
+MAX_BLOCK_SECONDS = 30.0
+
+
+def ffmpeg_input(video_data: Union[bytes, str, os.PathLike], video_filename: str) -> Tuple[str, Optional[str], Optional[bytes]]:
+    """
+    Choose how FFmpeg/FFprobe reads an input.
+    
+    Returns:
+        (source argument, spooled temporary path to delete or None, bytes to feed on stdin or None)
+    """
+    if isinstance(video_data, (str, os.PathLike)):
+        return os.fspath(video_data), None, None
+    if Path(video_filename).suffix.lower() in SEEKABLE_CONTAINERS:
+        with tempfile.NamedTemporaryFile(suffix=Path(video_filename).suffix, delete=False) as temp_video:
+            temp_video.write(video_data)
+        return temp_video.name, temp_video.name, None
+    return 'pipe:0', None, bytes(video_data)
+
+
+def content_hash(video_data: Union[bytes, str, os.PathLike], block_size: int = 1024 * 1024) -> str:
+    """SHA-256 of raw bytes or of a file's contents"""
+    digest = hashlib.sha256()
+    if isinstance(video_data, (str, os.PathLike)):
+        with open(video_data, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+    else:
+        digest.update(video_data)
+    return digest.hexdigest()
+
+
+# probe() takes a content_hash argument, which shadows the function there
+_content_digest = content_hash
+
+
+def _number(value, cast=float, default=0):
+    """Parse an ffprobe field ("N/A" and missing fields become default)"""
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass
+class MediaStream:
+    """One stream of a media file, as reported by ffprobe"""
+    index: int
+    codec_type: str
+    codec_name: str
+    duration: float = 0.0
+    sample_rate: int = 0
+    channels: int = 0
+    width: int = 0
+    height: int = 0
+
+
+@dataclass
+class MediaInfo:
+    """Probed media metadata: container, duration and streams"""
+    filename: str
+    size_bytes: int
+    content_hash: str
+    duration: float
+    format_name: str
+    streams: List[MediaStream] = field(default_factory=list)
+    
+    @classmethod
+    def from_ffprobe(cls, probe: dict, filename: str, size_bytes: int, content_hash: str) -> "MediaInfo":
+        """Build from ffprobe -show_format -show_streams JSON output"""
+        format_info = probe.get('format', {})
+        streams = [
+            MediaStream(
+                index=_number(stream.get('index'), int, i),
+                codec_type=stream.get('codec_type', 'unknown'),
+                codec_name=stream.get('codec_name', 'unknown'),
+                duration=_number(stream.get('duration'), float, 0.0),
+                sample_rate=_number(stream.get('sample_rate'), int, 0),
+                channels=_number(stream.get('channels'), int, 0),
+                width=_number(stream.get('width'), int, 0),
+                height=_number(stream.get('height'), int, 0),
+            )
+            for i, stream in enumerate(probe.get('streams', []))
+        ]
+        duration = _number(format_info.get('duration'), float, 0.0) or max((s.duration for s in streams), default=0.0)
+        return cls(filename, size_bytes, content_hash, duration, format_info.get('format_name', 'unknown'), streams)
+    
+    def _first(self, codec_type: str) -> Optional[MediaStream]:
+        return next((stream for stream in self.streams if stream.codec_type == codec_type), None)
+    
+    @property
+    def video_stream(self) -> Optional[MediaStream]:
+        """First video stream"""
+        return self._first('video')
+    
+    @property
+    def audio_stream(self) -> Optional[MediaStream]:
+        """First audio stream"""
+        return self._first('audio')
+    
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_stream is not None
+    
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the first audio stream (0 without audio)"""
+        return self.audio_stream.sample_rate if self.audio_stream else 0
+    
+    def to_dict(self) -> dict:
+        """Video info dictionary (the get_video_info format)"""
+        video_stream = self.video_stream or MediaStream(-1, 'video', 'unknown')
+        audio_stream = self.audio_stream or MediaStream(-1, 'audio', 'unknown')
+        return {
+            "filename": self.filename,
+            "size_bytes": self.size_bytes,
+            "size_mb": self.size_bytes / (1024 * 1024),
+            "duration": self.duration,
+            "format": self.format_name,
+            "video_codec": video_stream.codec_name,
+            "video_resolution": f"{video_stream.width}x{video_stream.height}",
+            "audio_codec": audio_stream.codec_name,
+            "audio_channels": audio_stream.channels,
+            "audio_sample_rate": audio_stream.sample_rate,
+            "content_hash": self.content_hash,
+            "ffmpeg_available": True
+        }
+
+
+class AudioStream:
+    """
+    Audio extracted by FFmpeg as raw 16-bit mono PCM on a pipe, yielded as float32 blocks.
+    
+    Bytes inputs are fed through stdin (or spooled to a temporary file for containers that need
+    seeking). A reader thread drains stdout into a bounded queue, so FFmpeg keeps decoding while
+    the consumer works, and a watchdog kills FFmpeg once the timeout expires. Time FFmpeg spends
+    waiting on a full queue (a slow consumer) does not count towards the timeout.
+    """
+    
+    def __init__(self, video_data: Union[bytes, str, os.PathLike], video_filename: str,
+                 sample_rate: int = 16000, block_seconds: float = 10.0, timeout: float = MIN_EXTRACTION_TIMEOUT,
+                 max_queued_blocks: int = 64):
+        self.video_filename = video_filename
+        self.sample_rate = sample_rate
+        self.timeout = timeout
+        self.samples_read = 0
+        self.timed_out = False
+        
+        self._block_bytes = max(1, int(block_seconds * sample_rate)) * 2
+        self._blocks: "queue.Queue" = queue.Queue(maxsize=max_queued_blocks)
+        self._stderr = b""
+        self._stalled = 0.0
+        self._stalled_since = None
+        self._done = threading.Event()
+        source, self._temp_path, self._feed_data = ffmpeg_input(video_data, video_filename)
+        
+        cmd = ['ffmpeg', '-hide_banner'] + (['-nostdin'] if self._feed_data is None else []) + [
+            '-i', source,            # Input video
+            '-vn',                   # No video
+            '-f', 's16le',           # Raw PCM 16-bit little-endian
+            '-acodec', 'pcm_s16le',
+            '-ar', str(sample_rate), # Sample rate
+            '-ac', '1',              # Mono audio
+            'pipe:1'
+        ]
+        logger.info(f"🔧 Running FFmpeg command: {' '.join(cmd)}")
+        
+        self._process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if self._feed_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        self._started = time.time()
+        self._watchdog = threading.Thread(target=self._watch, name="ffmpeg-watchdog", daemon=True)
+        self._watchdog.start()
+        
+        self._threads = [
+            threading.Thread(target=self._read_stdout, name="ffmpeg-stdout", daemon=True),
+            threading.Thread(target=self._read_stderr, name="ffmpeg-stderr", daemon=True),
+        ]
+        if self._feed_data is not None:
+            self._threads.append(threading.Thread(target=self._write_stdin, name="ffmpeg-stdin", daemon=True))
+        for thread in self._threads:
+            thread.start()
+    
+    def _watch(self):
+        """Stop FFmpeg once it has run longer than the timeout (excluding time stalled on the queue)"""
+        while not self._done.wait(0.5):
+            now = time.time()
+            stalled_since = self._stalled_since
+            stalled = self._stalled + (now - stalled_since if stalled_since is not None else 0.0)
+            if now - self._started - stalled > self.timeout and self._process.poll() is None:
+                self.timed_out = True
+                self._process.kill()
+                return
+    
+    def _write_stdin(self):
+        """Feed the input video to FFmpeg"""
+        try:
+            self._process.stdin.write(self._feed_data)
+        except (BrokenPipeError, OSError):
+            pass  # FFmpeg exited early - the error surfaces through its exit code
+        finally:
+            self._feed_data = None
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+    
+    def _read_stderr(self):
+        """Collect FFmpeg diagnostics without letting the pipe fill up"""
+        self._stderr = self._process.stderr.read()
+    
+    def _read_stdout(self):
+        """Read PCM blocks from FFmpeg (None marks the end of the stream)"""
+        try:
+            while True:
+                data = self._process.stdout.read(self._block_bytes)
+                if not data:
+                    break
+                if len(data) % 2:
+                    data += self._process.stdout.read(1)
+                self._stalled_since = time.time()
+                self._blocks.put(data)
+                self._stalled += time.time() - self._stalled_since
+                self._stalled_since = None
+        finally:
+            self._blocks.put(None)
+    
+    def __iter__(self):
+        start_time = time.time()
+        while True:
+            data = self._blocks.get()
+            if data is None:
+                break
+            block = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+            self.samples_read += len(block)
+            yield block
+        
+        returncode = self._process.wait()
+        self._finish()
+        if self.timed_out:
+            raise Exception(f"FFmpeg extraction timed out after {self.timeout:.0f}s")
+        if returncode != 0:
+            stderr = self._stderr.decode("utf-8", errors="replace")[-2000:]
+            logger.error(f"❌ FFmpeg failed: {stderr}")
+            raise Exception(f"FFmpeg extraction failed: {stderr}")
+        logger.info(f"✅ Extracted {self.samples_read / self.sample_rate:.1f}s of audio from {self.video_filename} "
+                    f"in {time.time() - start_time:.2f}s")
+    
+    def _finish(self):
+        """Stop the watchdog and remove the spooled input"""
+        self._done.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        if self._temp_path and os.path.exists(self._temp_path):
+            try:
+                os.unlink(self._temp_path)
+                logger.debug(f"🧹 Cleaned up temp video: {self._temp_path}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to clean up temp video: {e}")
+        self._temp_path = None
+    
+    def close(self):
+        """Stop extraction early and release FFmpeg"""
+        if self._process.poll() is None:
+            self._process.kill()
+        # Drain the queue so a reader blocked on a full queue can finish
+        reader = self._threads[0]
+        while reader.is_alive():
+            try:
+                self._blocks.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._process.wait()
+        self._finish()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class VideoProcessor:
     """
     Utility class for processing video files and extracting audio
     """
     
-    def __init__(self):
-        """Initialize video processor and check dependencies"""
+    def __init__(self, probe_cache_size: int = 256):
+        """
+        Initialize video processor and check dependencies
+        
+        Args:
+            probe_cache_size: Probed inputs remembered by content hash
+        """
         self.ffmpeg_available = self._check_ffmpeg()
         if not self.ffmpeg_available:
             logger.warning("⚠️ FFmpeg not available - video processing will be limited")
+        
+        self.probe_cache_size = max(1, int(probe_cache_size))
+        self._probe_cache: "OrderedDict[str, MediaInfo]" = OrderedDict()
+        self._probe_lock = threading.Lock()
     
     def _check_ffmpeg(self) -> bool:
         """Check if FFmpeg is available in the system"""
@@ -45,206 +361,230 @@ class VideoProcessor:
             logger.warning("⚠️ FFmpeg not found in system PATH")
             return False
     
-    def extract_audio_from_video(
-        self, 
-        video_data: bytes, 
-        video_filename: str,
-        output_format: str = "wav",
-        sample_rate: int = 16000
-    ) -> Tuple[bytes, str]:
+    def extraction_timeout(self, duration: Optional[float] = None, size_bytes: Optional[int] = None) -> float:
         """
-        Extract audio from video file data
+        FFmpeg timeout for extracting audio from a video.
+        
+        Scales with the media duration; if it is unknown, the duration is bounded from the file
+        size at a low bitrate, so long videos get a proportionally longer budget.
+        
+        Args:
+            duration: Media duration in seconds, if known
+            size_bytes: Input size in bytes, if the duration is unknown
+            
+        Returns:
+            Timeout in seconds
+        """
+        if not duration and size_bytes:
+            duration = size_bytes / MIN_BITRATE_BYTES_PER_SECOND
+        return max(MIN_EXTRACTION_TIMEOUT, MIN_EXTRACTION_TIMEOUT / 2 + (duration or 0.0) * EXTRACTION_SECONDS_PER_MEDIA_SECOND)
+    
+    def probe(self, video_data: Union[bytes, str, os.PathLike], video_filename: str,
+              content_hash: Optional[str] = None) -> Optional[MediaInfo]:
+        """
+        Probe a media file once with ffprobe.
+        
+        Results are cached by content hash, so the same input is only parsed once across the
+        pipeline stages (and across tasks that share an input).
         
         Args:
-            video_data: Raw video file bytes
+            video_data: Raw video file bytes or path to the video file
             video_filename: Original video filename
-            output_format: Audio output format (wav, mp3, etc.)
-            sample_rate: Target audio sample rate
+            content_hash: SHA-256 hex digest of the input, if already known (skips hashing it again)
             
         Returns:
-            Tuple of (audio_bytes, temp_audio_path)
+            MediaInfo, or None if FFmpeg is unavailable or the input could not be probed
         """
         if not self.ffmpeg_available:
-            raise Exception("FFmpeg not available for video processing")
+            return None
         
-        # Create temporary files
-        temp_video = None
-        temp_audio = None
+        digest = content_hash or _content_digest(video_data)
+        with self._probe_lock:
+            media_info = self._probe_cache.get(digest)
+            if media_info is not None:
+                self._probe_cache.move_to_end(digest)
+                logger.info(f"♻️ Using cached media info for {video_filename}")
+                return media_info
         
+        is_path = isinstance(video_data, (str, os.PathLike))
+        size_bytes = os.path.getsize(video_data) if is_path else len(video_data)
+        source, temp_path, feed_data = ffmpeg_input(video_data, video_filename)
         try:
-            # Create temporary video file
-            temp_video = tempfile.NamedTemporaryFile(
-                suffix=f".{video_filename.split('.')[-1]}", 
-                delete=False
-            )
-            temp_video.write(video_data)
-            temp_video.close()
-            
-            # Create temporary audio file
-            temp_audio = tempfile.NamedTemporaryFile(
-                suffix=f".{output_format}", 
-                delete=False
-            )
-            temp_audio.close()
-            
-            logger.info(f"🎬 Processing video: {video_filename}")
-            logger.info(f"   Video size: {len(video_data)} bytes")
-            logger.info(f"   Temp video: {temp_video.name}")
-            logger.info(f"   Temp audio: {temp_audio.name}")
-            
-            # Extract audio using FFmpeg
             cmd = [
-                'ffmpeg',
-                '-i', temp_video.name,  # Input video
-                '-vn',                   # No video
-                '-acodec', 'pcm_s16le', # PCM 16-bit audio codec
-                '-ar', str(sample_rate), # Sample rate
-                '-ac', '1',              # Mono audio
-                '-y',                    # Overwrite output
-                temp_audio.name          # Output audio file
+                'ffprobe',
+                '-v', 'quiet',
+                '-print_format', 'json',
+                '-show_format',
+                '-show_streams',
+                source
             ]
-            
-            logger.info(f"🔧 Running FFmpeg command: {' '.join(cmd)}")
-            
-            # Execute FFmpeg
             result = subprocess.run(
                 cmd,
+                input=feed_data,
                 capture_output=True,
-                text=True,
-                timeout=60  # 1 minute timeout
+                timeout=30
             )
-            
             if result.returncode != 0:
-                logger.error(f"❌ FFmpeg failed: {result.stderr}")
-                raise Exception(f"FFmpeg extraction failed: {result.stderr}")
-            
-            # Read extracted audio
-            with open(temp_audio.name, 'rb') as f:
-                audio_bytes = f.read()
+                logger.warning(f"⚠️ FFprobe failed: {result.stderr.decode('utf-8', errors='replace')}")
+                return None
+            media_info = MediaInfo.from_ffprobe(json.loads(result.stdout), video_filename, size_bytes, digest)
+        except Exception as e:
+            logger.error(f"❌ Error probing media: {e}")
+            return None
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.unlink(temp_path)
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to clean up temp video: {e}")
+        
+        logger.info(f"📊 Probed {video_filename}: {media_info.duration:.1f}s, {media_info.format_name}, "
+                    f"audio: {media_info.audio_stream.codec_name if media_info.has_audio else 'none'}")
+        with self._probe_lock:
+            self._probe_cache[digest] = media_info
+            while len(self._probe_cache) > self.probe_cache_size:
+                self._probe_cache.popitem(last=False)
+        return media_info
+    
+    def stream_audio(
+        self,
+        video_data: Union[bytes, str, os.PathLike],
+        video_filename: str,
+        sample_rate: int = 16000,
+        block_seconds: Optional[float] = None,
+        timeout: Optional[float] = None,
+        media_info: Optional[MediaInfo] = None
+    ) -> "AudioStream":
+        """
+        Start extracting mono float32 audio from a video as a stream of sample blocks.
+        
+        FFmpeg writes raw 16-bit PCM to a pipe that is read on a background thread, so callers
+        can start on the first blocks (e.g. transcription) while extraction continues.
+        
+        Args:
+            video_data: Raw video file bytes or path to the video file
+            video_filename: Original video filename
+            sample_rate: Target audio sample rate
+            block_seconds: Audio per yielded block (default: sized from the duration)
+            timeout: FFmpeg timeout in seconds (default: scaled with duration/size)
+            media_info: Result of probe() for this input, if already known
             
-            logger.info(f"✅ Audio extraction successful: {len(audio_bytes)} bytes")
+        Returns:
+            AudioStream yielding np.float32 blocks
+        """
+        if not self.ffmpeg_available:
+            raise Exception("FFmpeg not available for video processing")
+        if media_info is not None and not media_info.has_audio:
+            raise Exception(f"Video {video_filename} has no audio stream")
+        
+        is_path = isinstance(video_data, (str, os.PathLike))
+        size_bytes = os.path.getsize(video_data) if is_path else len(video_data)
+        duration = media_info.duration if media_info is not None else None
+        if timeout is None:
+            timeout = self.extraction_timeout(duration, size_bytes)
+        if block_seconds is None:
+            block_seconds = min(MAX_BLOCK_SECONDS, max(MIN_BLOCK_SECONDS, duration / 10)) if duration else 10.0
+        
+        logger.info(f"🎬 Processing video: {video_filename}")
+        logger.info(f"   Video size: {size_bytes} bytes")
+        if duration:
+            logger.info(f"   Duration: {duration:.1f}s")
+        logger.info(f"   Extraction timeout: {timeout:.0f}s")
+        return AudioStream(video_data, video_filename, sample_rate, block_seconds, timeout)
+    
+    def extract_audio_array(
+        self,
+        video_data: Union[bytes, str, os.PathLike],
+        video_filename: str,
+        sample_rate: int = 16000,
+        timeout: Optional[float] = None,
+        media_info: Optional[MediaInfo] = None
+    ) -> np.ndarray:
+        """
+        Extract the whole audio track of a video as mono float32 samples.
+        
+        Args:
+            video_data: Raw video file bytes or path to the video file
+            video_filename: Original video filename
+            sample_rate: Target audio sample rate
+            timeout: FFmpeg timeout in seconds (default: scaled with duration/size)
+            media_info: Result of probe() for this input, if already known
             
-            return audio_bytes, temp_audio.name
+        Returns:
+            Audio samples in [-1, 1]
+        """
+        with self.stream_audio(video_data, video_filename, sample_rate, timeout=timeout, media_info=media_info) as stream:
+            blocks = list(stream)
+        audio = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.float32)
+        logger.info(f"✅ Audio extraction successful: {len(audio) / sample_rate:.1f}s of audio")
+        return audio
+    
+    def extract_audio_from_video(
+        self, 
+        video_data: Union[bytes, str, os.PathLike], 
+        video_filename: str,
+        output_format: str = "wav",
+        sample_rate: int = 16000,
+        timeout: Optional[float] = None,
+        media_info: Optional[MediaInfo] = None
+    ) -> Tuple[bytes, str]:
+        """
+        Extract audio from video file data
+        
+        Args:
+            video_data: Raw video file bytes or path to the video file
+            video_filename: Original video filename
+            output_format: Audio output format (wav, flac, opus or mp3)
+            sample_rate: Target audio sample rate
+            timeout: FFmpeg timeout in seconds (default: scaled with duration/size)
+            media_info: Result of probe() for this input, if already known
             
+        Returns:
+            Tuple of (audio_bytes, audio_filename)
+        """
+        try:
+            audio = self.extract_audio_array(video_data, video_filename, sample_rate, timeout=timeout, media_info=media_info)
+            encoded = encode_audio(audio, sample_rate, output_format)
+            return encoded.data, f"{Path(video_filename).stem}{encoded.extension}"
         except Exception as e:
             logger.error(f"❌ Error extracting audio: {e}")
             raise
-        finally:
-            # Clean up temporary files
-            try:
-                if temp_video and os.path.exists(temp_video.name):
-                    os.unlink(temp_video.name)
-                    logger.debug(f"🧹 Cleaned up temp video: {temp_video.name}")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to clean up temp video: {e}")
-            
-            try:
-                if temp_audio and os.path.exists(temp_audio.name):
-                    os.unlink(temp_audio.name)
-                    logger.debug(f"🧹 Cleaned up temp audio: {temp_audio.name}")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to clean up temp audio: {e}")
     
-    def get_video_info(self, video_data: bytes, video_filename: str) -> dict:
+    def get_video_info(self, video_data: Union[bytes, str, os.PathLike], video_filename: str,
+                       media_info: Optional[MediaInfo] = None) -> dict:
         """
         Get basic information about the video file
         
         Args:
-            video_data: Raw video file bytes
+            video_data: Raw video file bytes or path to the video file
             video_filename: Original video filename
+            media_info: Result of probe() for this input, if already known
             
         Returns:
             Dictionary with video information
         """
+        is_path = isinstance(video_data, (str, os.PathLike))
+        size_bytes = os.path.getsize(video_data) if is_path else len(video_data)
+        
         if not self.ffmpeg_available:
             return {
                 "filename": video_filename,
-                "size_bytes": len(video_data),
-                "size_mb": len(video_data) / (1024 * 1024),
+                "size_bytes": size_bytes,
+                "size_mb": size_bytes / (1024 * 1024),
                 "ffmpeg_available": False
             }
         
-        # Create temporary video file for analysis
-        temp_video = None
-        try:
-            temp_video = tempfile.NamedTemporaryFile(
-                suffix=f".{video_filename.split('.')[-1]}", 
-                delete=False
-            )
-            temp_video.write(video_data)
-            temp_video.close()
-            
-            # Get video information using FFmpeg
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                temp_video.name
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                import json
-                info = json.loads(result.stdout)
-                
-                # Extract relevant information
-                format_info = info.get('format', {})
-                video_stream = next(
-                    (s for s in info.get('streams', []) if s.get('codec_type') == 'video'), 
-                    {}
-                )
-                audio_stream = next(
-                    (s for s in info.get('streams', []) if s.get('codec_type') == 'audio'), 
-                    {}
-                )
-                
-                return {
-                    "filename": video_filename,
-                    "size_bytes": len(video_data),
-                    "size_mb": len(video_data) / (1024 * 1024),
-                    "duration": float(format_info.get('duration', 0)),
-                    "format": format_info.get('format_name', 'unknown'),
-                    "video_codec": video_stream.get('codec_name', 'unknown'),
-                    "video_resolution": f"{video_stream.get('width', 0)}x{video_stream.get('height', 0)}",
-                    "audio_codec": audio_stream.get('codec_name', 'unknown'),
-                    "audio_channels": audio_stream.get('channels', 0),
-                    "audio_sample_rate": audio_stream.get('sample_rate', 0),
-                    "ffmpeg_available": True
-                }
-            else:
-                logger.warning(f"⚠️ FFprobe failed: {result.stderr}")
-                return {
-                    "filename": video_filename,
-                    "size_bytes": len(video_data),
-                    "size_mb": len(video_data) / (1024 * 1024),
-                    "ffmpeg_available": True,
-                    "error": "Failed to extract video info"
-                }
-                
-        except Exception as e:
-            logger.error(f"❌ Error getting video info: {e}")
+        if media_info is None:
+            media_info = self.probe(video_data, video_filename)
+        if media_info is None:
             return {
                 "filename": video_filename,
-                "size_bytes": len(video_data),
-                "size_mb": len(video_data) / (1024 * 1024),
+                "size_bytes": size_bytes,
+                "size_mb": size_bytes / (1024 * 1024),
                 "ffmpeg_available": True,
-                "error": str(e)
+                "error": "Failed to extract video info"
             }
-        finally:
-            # Clean up temporary file
-            try:
-                if temp_video and os.path.exists(temp_video.name):
-                    os.unlink(temp_video.name)
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to clean up temp video: {e}")
+        return media_info.to_dict()
     
     def is_video_file(self, filename: str) -> bool:
         """Check if file is a video file based on extension"""
@@ -81,3 +81,66 @@ class AudioTask(bt.Synapse):
     def decode_text(self, text_b64: str) -> str:
         """Decode base64 string to text."""
         return base64.b64decode(text_b64.encode('utf-8')).decode('utf-8')
+
+
+class TTSStream(bt.StreamingSynapse):
+    """
+    Streaming protocol for text-to-speech (see docs/stream_tutorial).
+
+    The miner synthesizes the text sentence by sentence and streams the audio as it is
+    produced: a WAV header first, then 16-bit mono PCM blocks, so playback can start before
+    the whole text has been rendered.
+
+    Attributes:
+    - text: Text to synthesize
+    - language: Language code (e.g., 'en', 'es', 'fr')
+    - speaker: Speaker name (if the model supports multiple speakers)
+    - pipeline_model: TTS model to use (None for the default model)
+    - output_data: Base64 encoded WAV, filled in once the stream has been consumed
+    """
+
+    text: str
+    language: str = "en"
+    speaker: typing.Optional[str] = None
+    pipeline_model: typing.Optional[str] = None
+    output_data: typing.Optional[str] = None
+
+    required_hash_fields: typing.ClassVar[typing.Tuple[str, ...]] = ("text",)
+
+    async def process_streaming_response(self, response):
+        """Yield audio chunks as they arrive and keep the full WAV in output_data"""
+        chunks = []
+        async for chunk in response.content.iter_any():
+            chunks.append(chunk)
+            yield chunk
+        self.output_data = base64.b64encode(b"".join(chunks)).decode('utf-8')
+
+    def deserialize(self) -> bytes:
+        """Return the streamed WAV bytes."""
+        return base64.b64decode(self.output_data.encode('utf-8')) if self.output_data else b""
+
+    def extract_response_json(self, response) -> dict:
+        """Extract response metadata from the streaming response headers."""
+        headers = {
+            k.decode("utf-8"): v.decode("utf-8")
+            for k, v in response.__dict__["_raw_headers"]
+        }
+
+        def extract_info(prefix):
+            return {
+                key.split("_")[-1]: value
+                for key, value in headers.items()
+                if key.startswith(prefix)
+            }
+
+        return {
+            "name": headers.get("name", ""),
+            "timeout": float(headers.get("timeout", 0)),
+            "total_size": int(headers.get("total_size", 0)),
+            "header_size": int(headers.get("header_size", 0)),
+            "dendrite": extract_info("bt_header_dendrite"),
+            "axon": extract_info("bt_header_axon"),
+            "text": self.text,
+            "language": self.language,
+            "pipeline_model": self.pipeline_model,
+        }
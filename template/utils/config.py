@@ -134,6 +134,237 @@ def add_miner_args(cls, parser):
         default="miner",
     )
 
+    parser.add_argument(
+        "--neuron.task_concurrency",
+        type=str,
+        help="Per task type concurrency limits for proxy tasks, e.g. 'tts=1,transcription=2,text_translation=4'.",
+        default="",
+    )
+
+    parser.add_argument(
+        "--neuron.inference_mode",
+        type=str,
+        choices=["thread", "process"],
+        help="Run blocking model inference on a thread pool or a forked process pool.",
+        default="thread",
+    )
+
+    parser.add_argument(
+        "--neuron.inference_workers",
+        type=str,
+        help="Inference workers per pipeline type, e.g. 'transcription=2,translation=2,tts=1'.",
+        default="",
+    )
+
+    parser.add_argument(
+        "--neuron.torch_threads",
+        type=int,
+        help="Torch thread budget divided between the torch inference workers "
+        "(0 = torch default in thread mode, number of CPUs in process mode).",
+        default=0,
+    )
+
+    parser.add_argument(
+        "--neuron.micro_batch_wait_ms",
+        type=float,
+        help="How long a summarization/translation request waits to be batched with others (0 disables batching).",
+        default=20.0,
+    )
+
+    parser.add_argument(
+        "--neuron.micro_batch_size",
+        type=int,
+        help="Maximum summarization/translation requests per micro-batch.",
+        default=8,
+    )
+
+    parser.add_argument(
+        "--neuron.proxy_max_connections",
+        type=int,
+        help="Maximum pooled connections of the shared miner-to-proxy HTTP client.",
+        default=20,
+    )
+
+    parser.add_argument(
+        "--neuron.proxy_max_retries",
+        type=int,
+        help="Retries (with exponential backoff) for failed proxy requests.",
+        default=3,
+    )
+
+    parser.add_argument(
+        "--neuron.max_download_mb",
+        type=float,
+        help="Maximum size of a task input file streamed from the proxy (MB).",
+        default=1024,
+    )
+
+    parser.add_argument(
+        "--neuron.input_cache_mb",
+        type=float,
+        help="Disk budget for the miner's input file cache (MB, 0 disables it).",
+        default=2048,
+    )
+
+    parser.add_argument(
+        "--neuron.input_cache_dir",
+        type=str,
+        help="Directory for the input file cache (default: <neuron.full_path>/input_cache).",
+        default="",
+    )
+
+    parser.add_argument(
+        "--neuron.tts_streaming",
+        action="store_true",
+        help="Serve streaming TTS queries (TTSStream): audio is streamed sentence by sentence as it is synthesized.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.speaker_cache_entries",
+        type=int,
+        help="Number of TTS voices (speaker WAV + conditioning latents) to keep cached (0 disables it).",
+        default=32,
+    )
+
+    parser.add_argument(
+        "--neuron.speaker_cache_ttl",
+        type=float,
+        help="Seconds a voice's speaker_wav_url is trusted before its audio is downloaded and re-hashed.",
+        default=3600.0,
+    )
+
+    parser.add_argument(
+        "--neuron.model_cache_mb",
+        type=float,
+        help="Memory budget for loaded models; least recently used non-default models are evicted above it "
+             "(0 for no limit, applies per worker process in process inference mode).",
+        default=8192,
+    )
+
+    parser.add_argument(
+        "--neuron.warmup_models",
+        type=str,
+        help="Models to preload and warm up at startup, e.g. 'transcription,translation:t5-small,tts' "
+             "(default: the default transcription, summarization and translation models; 'none' disables it).",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--neuron.warmup_skip_inference",
+        action="store_true",
+        help="Only preload warm-up models, without running a synthetic inference on them.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.warmup_timeout",
+        type=float,
+        help="Maximum seconds to wait for model warm-up before serving requests anyway.",
+        default=600.0,
+    )
+
+    parser.add_argument(
+        "--neuron.transcription_batch_size",
+        type=int,
+        help="Number of 30s audio chunks decoded per Whisper generate call (0 = 8 on GPU, 4 on CPU).",
+        default=0,
+    )
+
+    parser.add_argument(
+        "--neuron.summarization_max_depth",
+        type=int,
+        help="Map-reduce rounds for documents longer than the summarization model input (0 = truncate).",
+        default=2,
+    )
+
+    parser.add_argument(
+        "--neuron.summarization_batch_size",
+        type=int,
+        help="Maximum document chunks summarized per generate call (0 = default of 4).",
+        default=0,
+    )
+
+    parser.add_argument(
+        "--neuron.translation_batch_size",
+        type=int,
+        help="Maximum text chunks translated per generate call (0 = default of 4).",
+        default=0,
+    )
+
+    parser.add_argument(
+        "--neuron.translation_batch_tokens",
+        type=int,
+        help="Padded input token budget per translation generate call (0 = default of 4096).",
+        default=0,
+    )
+
+    parser.add_argument(
+        "--neuron.translation_memory_entries",
+        type=int,
+        help="Translated segments kept in the in-process translation memory (0 disables it).",
+        default=10000,
+    )
+
+    parser.add_argument(
+        "--neuron.translation_memory_db",
+        type=str,
+        help="SQLite file for a persistent translation memory tier (empty = memory only).",
+        default="",
+    )
+
+    parser.add_argument(
+        "--neuron.disable_vad",
+        action="store_true",
+        help="Cut long audio into fixed 30s slices instead of segmenting at pauses and skipping silence.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.profile_pipeline_stages",
+        action="store_true",
+        help="Record per-stage timings and memory deltas (decode, resample, features, generate, ...) "
+        "for every pipeline call; reported in transcription metadata and pipeline performance stats.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.optimize_cpu",
+        action="store_true",
+        help="Int8 dynamic quantization of transcription/summarization/translation models running on CPU.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.compile_models",
+        action="store_true",
+        help="torch.compile transcription/summarization/translation models running on CPU.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.optimized_model_dir",
+        type=str,
+        help="Disk cache for quantized model weights (default: ~/.cache/violet/optimized_models).",
+        default="",
+    )
+
+    parser.add_argument(
+        "--neuron.inference_backend",
+        type=str,
+        choices=["pytorch", "onnx"],
+        help="Inference backend for transcription, summarization and translation models. "
+        "'onnx' runs them on ONNX Runtime (requires optimum[onnxruntime]; exports are cached).",
+        default="pytorch",
+    )
+
+    parser.add_argument(
+        "--neuron.onnx_cache_dir",
+        type=str,
+        help="Disk cache for ONNX model exports (default: ~/.cache/violet/onnx).",
+        default="",
+    )
+
     parser.add_argument(
         "--blacklist.force_validator_permit",
         action="store_true",
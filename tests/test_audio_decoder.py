@@ -0,0 +1,53 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sf = pytest.importorskip("soundfile")
+signal = pytest.importorskip("scipy.signal")
+pytest.importorskip("torch")
+
+from template.pipelines.audio_decoder import load_audio, sniff_container
+
+
+def encode(audio, sample_rate, fmt="WAV"):
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format=fmt)
+    return buffer.getvalue()
+
+
+def test_sniff_container():
+    assert sniff_container(encode(np.zeros(100), 16000)[:12]) == "wav"
+    assert sniff_container(encode(np.zeros(100), 16000, "FLAC")[:12]) == "flac"
+    assert sniff_container(b"ID3\x04\x00\x00\x00\x00\x00\x00\x00\x00") == "mp3"
+    assert sniff_container(b"\x00\x00\x00\x20ftypisom") == "mp4"
+    assert sniff_container(b"not audio") == "unknown"
+
+
+def test_matching_rate_skips_resampling_and_normalizes(tmp_path):
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal(16000 * 3) * 0.1).astype(np.float32)
+    path = tmp_path / "input.flac"
+    path.write_bytes(encode(audio, 16000, "FLAC"))
+
+    decoded, sample_rate = load_audio(str(path), target_sr=16000, block_seconds=1.0)
+
+    assert sample_rate == 16000
+    assert decoded.dtype == np.float32
+    assert len(decoded) == len(audio)
+    assert np.max(np.abs(decoded)) == pytest.approx(1.0)
+    assert np.allclose(decoded * np.max(np.abs(audio)), audio, atol=1e-4)
+
+
+def test_blockwise_resampling_matches_whole_signal():
+    rng = np.random.default_rng(1)
+    stereo = (rng.standard_normal((44100 * 5 + 123, 2)) * 0.2).astype(np.float32)
+    data = encode(stereo, 44100, "WAV")
+
+    decoded, sample_rate = load_audio(data, target_sr=16000, normalize=False, block_seconds=1.0)
+
+    mono = sf.read(io.BytesIO(data), dtype="float32")[0].mean(axis=1)
+    expected = signal.resample_poly(mono, 160, 441)
+    assert sample_rate == 16000
+    assert len(decoded) == len(expected)
+    assert np.max(np.abs(decoded - expected)) < 1e-4
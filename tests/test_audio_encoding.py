@@ -0,0 +1,44 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sf = pytest.importorskip("soundfile")
+pytest.importorskip("torch")
+
+from template.pipelines.audio_encoding import encode_audio, encode_audio_file
+
+
+def _tone(sample_rate, seconds=1.0):
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+def test_flac_round_trip_is_smaller_than_wav():
+    audio = _tone(22050)
+    wav = encode_audio(audio, 22050, "wav")
+    flac = encode_audio(audio, 22050, "FLAC")
+    assert (flac.output_format, flac.content_type, flac.extension) == ("flac", "audio/flac", ".flac")
+    assert len(flac.data) < len(wav.data)
+    decoded, sample_rate = sf.read(io.BytesIO(flac.data), dtype="float32")
+    assert sample_rate == 22050
+    assert np.allclose(decoded, audio, atol=1e-3)
+
+
+def test_opus_is_resampled_to_a_supported_rate():
+    pytest.importorskip("scipy")
+    if not sf.check_format("OGG", "OPUS"):
+        pytest.skip("libsndfile without Opus support")
+    encoded = encode_audio(_tone(22050), 22050, "opus")
+    assert (encoded.output_format, encoded.content_type, encoded.sample_rate) == ("opus", "audio/ogg", 24000)
+    assert sf.info(io.BytesIO(encoded.data)).samplerate == 24000
+
+
+def test_unknown_format_and_wav_file_passthrough(tmp_path):
+    encoded = encode_audio(_tone(16000), 16000, "aac")
+    assert (encoded.output_format, encoded.content_type, encoded.extension) == ("wav", "audio/wav", ".wav")
+
+    path = tmp_path / "speech.wav"
+    path.write_bytes(encoded.data)
+    passthrough = encode_audio_file(str(path), "wav")
+    assert passthrough.data == encoded.data and passthrough.sample_rate == 16000
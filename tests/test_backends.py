@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+pytest.importorskip("torch")
+
+from template.pipelines import backends
+from template.pipelines.backends import load_seq2seq_model, onnx_export_path, resolve_backend
+
+
+def test_resolve_backend():
+    assert resolve_backend(None) == "pytorch"
+    assert resolve_backend("PyTorch") == "pytorch"
+    with pytest.raises(ValueError):
+        resolve_backend("tensorrt")
+
+
+def test_onnx_falls_back_to_pytorch_when_unavailable(monkeypatch):
+    monkeypatch.setattr(backends, "ONNX_AVAILABLE", False)
+    assert resolve_backend("onnx") == "pytorch"
+
+
+def test_onnx_export_path_is_per_model(tmp_path):
+    path = onnx_export_path("openai/whisper-tiny", str(tmp_path))
+    assert os.path.dirname(path) == str(tmp_path)
+    assert os.path.basename(path) == "openai_whisper-tiny"
+    assert path != onnx_export_path("openai/whisper-base", str(tmp_path))
+
+
+def test_invalid_model_kind():
+    with pytest.raises(ValueError):
+        load_seq2seq_model("t5-small", "causal-lm")
@@ -0,0 +1,51 @@
+import asyncio
+import hashlib
+import os
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("bittensor")
+
+from neurons.file_downloader import DownloadError, stream_download
+
+PAYLOAD = os.urandom(300_000)
+
+
+def make_client(body=PAYLOAD, headers=None):
+    def handler(request):
+        return httpx.Response(200, content=body, headers=headers or {"content-type": "audio/wav"})
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_stream_download_writes_verified_file(tmp_path):
+    expected = hashlib.sha256(PAYLOAD).hexdigest()
+    downloaded = asyncio.run(stream_download(
+        make_client(), "http://proxy/file", max_bytes=1_000_000,
+        expected_size=len(PAYLOAD), expected_sha256=expected,
+        suffix=".wav", download_dir=str(tmp_path), chunk_size=64 * 1024
+    ))
+
+    assert len(downloaded) == len(PAYLOAD)
+    assert downloaded.sha256 == expected
+    assert os.fspath(downloaded).endswith(".wav")
+    assert downloaded.read_bytes() == PAYLOAD
+    with downloaded.open_mmap() as mapped:
+        assert mapped[:16] == PAYLOAD[:16]
+
+    downloaded.cleanup()
+    assert not os.path.exists(downloaded.path)
+
+
+def test_stream_download_enforces_max_size(tmp_path):
+    with pytest.raises(DownloadError, match="too large"):
+        asyncio.run(stream_download(make_client(), "http://proxy/file", max_bytes=1000,
+                                    download_dir=str(tmp_path)))
+    assert os.listdir(tmp_path) == []
+
+
+def test_stream_download_rejects_hash_mismatch(tmp_path):
+    with pytest.raises(DownloadError, match="Hash mismatch"):
+        asyncio.run(stream_download(make_client(), "http://proxy/file", max_bytes=1_000_000,
+                                    expected_sha256="0" * 64, download_dir=str(tmp_path)))
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("bittensor")
+torch = pytest.importorskip("torch")
+
+from template.pipelines.inference_executor import InferenceExecutor
+
+
+@pytest.fixture(autouse=True)
+def restore_torch_threads():
+    # Thread mode resizes torch's process-wide pool - don't leak that into other tests
+    num_threads = torch.get_num_threads()
+    yield
+    torch.set_num_threads(num_threads)
+
+
+class FakeTranslationPipeline:
+    def translate_text(self, text, source_language, target_language):
+        return f"{source_language}->{target_language}:{text}", threading.current_thread().name
+
+
+class FakePipelineManager:
+    def __init__(self):
+        self.requested_models = []
+
+    def get_translation_pipeline(self, model_name=None):
+        self.requested_models.append(model_name)
+        return FakeTranslationPipeline()
+
+    def get_tts_pipeline(self, model_name=None):
+        return None
+
+
+def test_run_pipeline_uses_worker_thread():
+    executor = InferenceExecutor(mode="thread", workers={"translation": 1}, torch_threads=2)
+    manager = FakePipelineManager()
+
+    async def run():
+        return await executor.run_pipeline(manager, "translation", "t5-small", "translate_text", "hi", "en", "es")
+
+    try:
+        result, thread_name = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert result == "en->es:hi"
+    assert thread_name.startswith("inference-translation")
+    assert manager.requested_models == ["t5-small"]
+    assert executor.get_stats()["pipelines"]["translation"]["calls"] == 1
+
+
+def test_run_pipeline_raises_when_pipeline_unavailable():
+    executor = InferenceExecutor(mode="thread")
+
+    async def run():
+        return await executor.run_pipeline(FakePipelineManager(), "tts", None, "synthesize", "hi")
+
+    try:
+        with pytest.raises(Exception, match="Tts pipeline not available"):
+            asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert executor.get_stats()["pipelines"]["tts"]["failures"] == 1
+
+
+def test_torch_thread_budget_is_split_between_torch_workers():
+    executor = InferenceExecutor(workers={"transcription": 2, "summarization": 2, "translation": 2, "tts": 2, "video": 4},
+                                 torch_threads=16)
+    # The ffmpeg video pool doesn't count against the torch budget
+    assert executor.threads_per_worker == 2
+    assert torch.get_num_threads() == 2
+    executor.shutdown()
+
+    with pytest.raises(ValueError):
+        InferenceExecutor(mode="gpu")
+
+
+def test_thread_mode_leaves_torch_threads_alone_by_default():
+    torch.set_num_threads(3)
+    executor = InferenceExecutor(mode="thread")
+    assert executor.threads_per_worker is None
+    assert torch.get_num_threads() == 3
+    executor.shutdown()
+
+
+def test_process_mode_splits_cpu_count_by_default(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 12)
+    executor = InferenceExecutor(mode="process", workers={"transcription": 1, "summarization": 1,
+                                                         "translation": 1, "tts": 1, "video": 8})
+    assert executor.torch_threads == 12
+    assert executor.threads_per_worker == 3
+    executor.shutdown()
@@ -0,0 +1,72 @@
+import hashlib
+import os
+
+import pytest
+
+pytest.importorskip("bittensor")
+
+from neurons.file_downloader import DownloadedFile
+from neurons.input_cache import InputCache
+
+
+def make_download(tmp_path, name, size):
+    data = os.urandom(size)
+    path = tmp_path / name
+    path.write_bytes(data)
+    return DownloadedFile(path=str(path), size=size, sha256=hashlib.sha256(data).hexdigest(),
+                          content_type="audio/wav")
+
+
+def test_put_and_get_by_hash_and_file_id(tmp_path):
+    cache = InputCache(str(tmp_path / "cache"), max_bytes=1_000_000)
+    downloaded = make_download(tmp_path, "a.wav", 1000)
+    cache.put(downloaded, file_id="file-a")
+    downloaded.cleanup()
+
+    by_hash = cache.get(file_hash=downloaded.sha256)
+    by_id = cache.get(file_id="file-a")
+    assert by_hash.read_bytes() == by_id.read_bytes()
+    assert by_hash.path != by_id.path
+    assert by_id.path.endswith(".wav")
+
+    # Callers own their copy - cleaning it up keeps the cached entry
+    by_hash.cleanup()
+    assert cache.get(file_id="file-a") is not None
+    assert cache.get(file_hash="0" * 64) is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["bytes_saved"] == 3000
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = InputCache(str(tmp_path / "cache"), max_bytes=2500)
+    first = make_download(tmp_path, "first.wav", 1000)
+    second = make_download(tmp_path, "second.wav", 1000)
+    third = make_download(tmp_path, "third.wav", 1000)
+
+    cache.put(first, file_id="first")
+    cache.put(second, file_id="second")
+    cache.get(file_id="first")
+    cache.put(third, file_id="third")
+
+    assert cache.get(file_id="second") is None
+    assert cache.get(file_id="first") is not None
+    assert cache.get(file_id="third") is not None
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["total_bytes"] == 2000
+
+
+def test_index_survives_restart(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    cache = InputCache(cache_dir, max_bytes=1_000_000)
+    downloaded = make_download(tmp_path, "a.mp4", 500)
+    cache.put(downloaded, file_id="file-a")
+    cache.get(file_id="file-a")
+
+    reloaded = InputCache(cache_dir, max_bytes=1_000_000)
+    assert os.listdir(reloaded.links_dir) == []
+    cached = reloaded.get(file_id="file-a")
+    assert cached is not None
+    assert cached.sha256 == downloaded.sha256
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("torch")
+
+from template.pipelines.micro_batcher import MicroBatcher
+
+
+class FakeExecutor:
+    def __init__(self, fail_batches=False):
+        self.calls = []
+        self.fail_batches = fail_batches
+
+    async def run_pipeline(self, pipeline_manager, pipeline_type, model_name, method_name, payload, **params):
+        self.calls.append((method_name, payload, params))
+        await asyncio.sleep(0)
+        if method_name == 'summarize_batch':
+            if self.fail_batches:
+                raise RuntimeError("batch failed")
+            return [(text.upper(), 0.1) for text in payload]
+        if payload == "bad":
+            raise RuntimeError("bad input")
+        return payload.upper(), 0.1
+
+
+def submit_all(batcher, requests):
+    async def main():
+        return await asyncio.gather(*(batcher.submit('summarization', model, text, **params)
+                                      for model, text, params in requests), return_exceptions=True)
+    return asyncio.run(main())
+
+
+def test_requests_are_grouped_by_model_and_params():
+    executor = FakeExecutor()
+    batcher = MicroBatcher(executor, None, max_wait_ms=50, max_batch_size=8)
+    try:
+        results = submit_all(batcher, [
+            (None, "a", {'language': 'en'}),
+            (None, "b", {'language': 'en'}),
+            ("other", "c", {'language': 'en'}),
+            (None, "d", {'language': 'es'}),
+            (None, "e", {'language': 'en'}),
+        ])
+    finally:
+        batcher.shutdown()
+
+    assert results == [("A", 0.1), ("B", 0.1), ("C", 0.1), ("D", 0.1), ("E", 0.1)]
+    assert sorted((method, payload) for method, payload, _ in executor.calls) == [
+        ('summarize', "c"), ('summarize', "d"), ('summarize_batch', ["a", "b", "e"])
+    ]
+    stats = batcher.get_stats()['pipelines']['summarization']
+    assert stats['batches'] == 3 and stats['requests'] == 5 and stats['max_batch_size'] == 3
+
+
+def test_full_batch_flushes_without_waiting():
+    executor = FakeExecutor()
+    batcher = MicroBatcher(executor, None, max_wait_ms=10000, max_batch_size=2)
+    try:
+        results = submit_all(batcher, [(None, "a", {}), (None, "b", {})])
+    finally:
+        batcher.shutdown()
+    assert results == [("A", 0.1), ("B", 0.1)]
+
+
+def test_failed_batch_is_retried_individually():
+    executor = FakeExecutor(fail_batches=True)
+    batcher = MicroBatcher(executor, None, max_wait_ms=50, max_batch_size=8)
+    try:
+        results = submit_all(batcher, [(None, "a", {}), (None, "bad", {})])
+    finally:
+        batcher.shutdown()
+
+    assert results[0] == ("A", 0.1)
+    assert isinstance(results[1], RuntimeError)
+    assert batcher.get_stats()['pipelines']['summarization']['fallbacks'] == 1
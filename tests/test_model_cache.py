@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("torch")
+
+from template.pipelines.pipeline_manager import ModelCache
+
+
+def sized(size):
+    return {"size": size}
+
+
+def test_concurrent_requests_share_one_load():
+    cache = ModelCache(size_fn=lambda pipeline: pipeline["size"])
+    loads = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.1)
+        return sized(10)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load(("translation", "m"), loader)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+    stats = cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["load_waits"] == 3
+
+
+def test_failed_load_is_raised_to_waiters_and_retried_later():
+    cache = ModelCache(size_fn=lambda pipeline: 0)
+
+    def failing_loader():
+        raise RuntimeError("no such model")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load(("summarization", "bad"), failing_loader)
+    assert cache.get_or_load(("summarization", "bad"), lambda: "ok") == "ok"
+    assert cache.get_stats()["load_failures"] == 1
+
+
+def test_lru_eviction_respects_budget_and_pins():
+    cache = ModelCache(max_bytes=100, size_fn=lambda pipeline: pipeline["size"])
+    cache.get_or_load(("transcription", "default"), lambda: sized(40), pinned=True)
+    cache.get_or_load(("translation", "a"), lambda: sized(30))
+    cache.get_or_load(("translation", "b"), lambda: sized(30))
+    cache.get_or_load(("translation", "a"), lambda: sized(30))
+
+    # "b" is the least recently used unpinned model
+    cache.get_or_load(("summarization", "c"), lambda: sized(30))
+    assert cache.get(("translation", "b")) is None
+    assert cache.get(("translation", "a")) is not None
+    assert cache.get(("transcription", "default")) is not None
+    assert cache.get_stats()["total_bytes"] == 100
+    assert cache.count("translation") == 1
+
+    # Shrinking the budget never evicts pinned models
+    cache.set_max_bytes(10)
+    assert [m["model_name"] for m in cache.get_stats()["models"]] == ["default"]
+    assert cache.get_stats()["evictions"] == 3
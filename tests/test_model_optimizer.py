@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from template.pipelines.model_optimizer import optimize_pipeline
+
+
+class TinyModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.encoder = torch.nn.Sequential(torch.nn.Linear(16, 32), torch.nn.ReLU(), torch.nn.Linear(32, 8))
+        self.norm = torch.nn.LayerNorm(8)
+
+    def forward(self, x):
+        return self.norm(self.encoder(x))
+
+
+class FakePipeline:
+    def __init__(self, seed):
+        torch.manual_seed(seed)
+        self.model_name = "tiny/model"
+        self.device = "cpu"
+        self.model = TinyModel()
+
+
+def test_quantized_weights_are_cached_and_reused(tmp_path):
+    inputs = torch.randn(4, 16)
+
+    first = FakePipeline(seed=0)
+    with torch.no_grad():
+        fp32_output = first.model(inputs)
+    optimize_pipeline(first, cache_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+    assert not any(type(m) is torch.nn.Linear for m in first.model.modules())
+    with torch.no_grad():
+        quantized_output = first.model(inputs)
+    assert torch.allclose(quantized_output, fp32_output, atol=0.1)
+
+    # A second load takes the int8 weights from the cache rather than quantizing its own fp32 weights
+    second = FakePipeline(seed=1)
+    optimize_pipeline(second, cache_dir=str(tmp_path))
+    with torch.no_grad():
+        assert torch.equal(second.model(inputs), quantized_output)
+    assert second.optimization == {'quantized': True, 'compiled': False}
+
+
+def test_gpu_pipelines_are_left_alone(tmp_path):
+    pipeline = FakePipeline(seed=0)
+    pipeline.device = "cuda"
+    optimize_pipeline(pipeline, cache_dir=str(tmp_path))
+    assert any(type(m) is torch.nn.Linear for m in pipeline.model.modules())
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip("torch")
+
+from template.pipelines.warmup import ModelWarmup, parse_warmup_models
+
+
+class FakeTranslationPipeline:
+    model_name = "t5-small"
+
+    def __init__(self):
+        self.calls = []
+
+    def translate_text(self, text, source_language, target_language):
+        self.calls.append((source_language, target_language))
+        return text, 0.0
+
+
+class FakePipelineManager:
+    default_models = {"translation": "t5-small", "summarization": "facebook/bart-large-cnn"}
+
+    def __init__(self):
+        self.translation = FakeTranslationPipeline()
+
+    def get_translation_pipeline(self, model_name=None):
+        return self.translation
+
+    def get_summarization_pipeline(self, model_name=None):
+        raise RuntimeError("out of memory")
+
+
+def test_parse_warmup_models():
+    assert parse_warmup_models("transcription, translation:t5-small,tts") == [
+        ("transcription", None), ("translation", "t5-small"), ("tts", None)
+    ]
+    assert parse_warmup_models("none") == []
+    assert parse_warmup_models("") == []
+    with pytest.raises(ValueError):
+        parse_warmup_models("video")
+
+
+def test_warmup_reports_per_model_timings_and_readiness():
+    manager = FakePipelineManager()
+    warmup = ModelWarmup(manager, [("translation", None), ("summarization", None)])
+    assert not warmup.get_status()["ready"]
+
+    status = warmup.run()
+
+    assert status["ready"]
+    assert status["state"] == "degraded"
+    translation, summarization = status["models"]
+    assert translation["status"] == "ok"
+    assert translation["model_name"] == "t5-small"
+    assert manager.translation.calls == [("en", "es")]
+    assert summarization["status"] == "failed"
+    assert summarization["model_name"] == "facebook/bart-large-cnn"
+    assert "out of memory" in summarization["error"]
+
+
+def test_empty_warmup_is_ready_immediately():
+    warmup = ModelWarmup(FakePipelineManager(), [])
+    assert warmup.run()["state"] == "ready"
+    assert warmup.ready.is_set()
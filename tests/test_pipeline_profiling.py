@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("torch")
+
+from template.pipelines.profiling import StageProfiler, span, timed_iter, traced
+
+
+class _Pipeline:
+    def __init__(self, enabled):
+        self.profiler = StageProfiler(enabled=enabled, track_memory=False)
+
+    @traced
+    def run(self, items):
+        with span("generate"):
+            pass
+        return [item for item in timed_iter(items, "stream")]
+
+    @traced
+    def run_batch(self, batches):
+        # Nested traced calls join the outer trace
+        return [self.run(items) for items in batches]
+
+
+def test_disabled_profiler_records_nothing():
+    pipeline = _Pipeline(enabled=False)
+    assert pipeline.run([1, 2]) == [1, 2]
+    with pipeline.profiler.trace() as trace:
+        with span("generate"):
+            pass
+    assert trace is None
+    assert pipeline.profiler.get_stats() == {'enabled': False, 'traced_calls': 0, 'stages': {}}
+
+
+def test_stages_accumulate_per_trace_and_aggregate():
+    pipeline = _Pipeline(enabled=True)
+    with pipeline.profiler.trace() as trace:
+        pipeline.run([1, 2, 3])
+        with span("generate"):
+            pass
+    # 3 items plus the exhausted iterator
+    assert trace.to_dict()['stream']['calls'] == 4
+    assert trace.to_dict()['generate']['calls'] == 2
+    assert "rss_delta_mb" not in trace.to_dict()['generate']
+
+    pipeline.run_batch([[1], [2]])
+    stats = pipeline.profiler.get_stats()
+    assert stats['traced_calls'] == 2
+    assert stats['stages']['generate']['calls'] == 4
+    assert stats['stages']['generate']['total_time'] >= stats['stages']['generate']['max_time'] >= 0.0
+
+    # Spans outside a trace are no-ops
+    with span("generate"):
+        pass
+    assert pipeline.profiler.get_stats()['stages']['generate']['calls'] == 4
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("bittensor")
+
+from neurons.proxy_client import ProxyHTTPClient
+
+
+def make_client(handler, **kwargs):
+    client = ProxyHTTPClient(backoff_factor=0.0, **kwargs)
+    mock = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._get_client = lambda: mock
+    return client
+
+
+def test_get_retries_on_unavailable():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503 if len(calls) < 3 else 200, json={"ok": True})
+
+    client = make_client(handler, max_retries=3)
+    response = asyncio.run(client.get("http://proxy/api/v1/miners/1/tasks"))
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert client.retries == 2
+
+
+def test_post_is_not_retried_after_reaching_server():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    client = make_client(handler, max_retries=3)
+    response = asyncio.run(client.post("http://proxy/api/v1/miner/response", data={"task_id": "t"}))
+
+    assert response.status_code == 503
+    assert calls == ["POST"]
+
+
+def test_session_applies_default_timeout():
+    seen = {}
+
+    def handler(request):
+        seen["timeout"] = request.extensions.get("timeout")
+        return httpx.Response(200)
+
+    client = make_client(handler)
+
+    async def run():
+        async with client.session(timeout=7.0) as session:
+            return await session.get("http://proxy/health")
+
+    assert asyncio.run(run()).status_code == 200
+    assert seen["timeout"]["read"] == 7.0
@@ -0,0 +1,73 @@
+import hashlib
+import os
+
+import pytest
+
+pytest.importorskip("bittensor")
+
+from neurons.file_downloader import DownloadedFile
+from neurons.speaker_cache import SpeakerCache
+
+URL = "https://r2.example/voices/alice.wav"
+
+
+def make_download(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return DownloadedFile(path=str(path), size=len(data), sha256=hashlib.sha256(data).hexdigest())
+
+
+def test_cached_voice_skips_download_and_conditioning(tmp_path):
+    cache = SpeakerCache(str(tmp_path / "cache"), max_entries=4)
+    assert cache.resolve("alice", URL) is None
+
+    downloaded = make_download(tmp_path, "a.wav", b"alice-voice")
+    key = cache.add("alice", URL, downloaded)
+    assert not os.path.exists(downloaded.path)
+    assert open(cache.wav_path(key), "rb").read() == b"alice-voice"
+
+    assert cache.resolve("alice", URL) == key
+    assert cache.get_latents(key, "xtts_v2") is None
+    cache.set_latents(key, "xtts_v2", ("gpt", "embedding"))
+    assert cache.get_latents(key, "xtts_v2") == ("gpt", "embedding")
+    assert cache.get_latents(key, "other_model") is None
+
+    stats = cache.get_stats()
+    assert stats["download_hits"] == 1
+    assert stats["download_misses"] == 1
+    assert stats["latent_hits"] == 1
+    assert stats["latent_misses"] == 2
+
+
+def test_same_content_reuses_entry_and_stale_urls_are_revalidated(tmp_path):
+    cache = SpeakerCache(str(tmp_path / "cache"), max_entries=4, url_ttl=0)
+    key = cache.add("alice", URL, make_download(tmp_path, "a.wav", b"alice-voice"))
+    cache.set_latents(key, "xtts_v2", "latents")
+
+    # TTL expired - the URL has to be downloaded again, but identical audio keeps its latents
+    assert cache.resolve("alice", URL) is None
+    again = make_download(tmp_path, "b.wav", b"alice-voice")
+    assert cache.add("alice", URL, again) == key
+    assert not os.path.exists(again.path)
+    assert cache.get_latents(key, "xtts_v2") == "latents"
+
+    # Re-uploaded audio becomes a new entry
+    assert cache.add("alice", URL, make_download(tmp_path, "c.wav", b"new-alice")) != key
+
+
+def test_least_recently_used_voice_is_evicted(tmp_path):
+    cache = SpeakerCache(str(tmp_path / "cache"), max_entries=2)
+    alice = cache.add("alice", "u1", make_download(tmp_path, "a.wav", b"a"))
+    bob = cache.add("bob", "u2", make_download(tmp_path, "b.wav", b"b"))
+    cache.resolve("alice", "u1")
+    cache.add("carol", "u3", make_download(tmp_path, "c.wav", b"c"))
+
+    assert cache.resolve("bob", "u2") is None
+    assert cache.wav_path(bob) is None
+    assert cache.resolve("alice", "u1") == alice
+    assert cache.get_stats()["evictions"] == 1
+
+    # Restart keeps the cached WAVs and nothing else
+    reloaded = SpeakerCache(str(tmp_path / "cache"), max_entries=2)
+    assert reloaded.wav_path(alice) is not None
+    assert len(os.listdir(tmp_path / "cache")) == 3
@@ -0,0 +1,126 @@
+import pytest
+
+pytest.importorskip("bittensor")
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from template.pipelines import summarization_pipeline
+from template.pipelines.summarization_pipeline import SummarizationPipeline
+
+
+# Six 5-word sentences: two fit one 11-token chunk, so the document maps to three chunks
+DOCUMENT = (
+    "Alpha one two three four. Beta one two three four. "
+    "Gamma one two three four. Delta one two three four. "
+    "Epsilon one two three four. Zeta one two three four."
+)
+
+
+class StubEncoding(dict):
+    def to(self, device):
+        return self
+
+
+class StubTokenizer:
+    """Word-level tokenizer with one special token and a 12-token model input"""
+
+    model_max_length = 12
+    vocab_size = 100
+
+    def num_special_tokens_to_add(self):
+        return 1
+
+    def __call__(self, texts, add_special_tokens=True, return_tensors=None, **kwargs):
+        if return_tensors:
+            return StubEncoding(texts=list(texts))
+        ids = lambda text: list(range(len(text.split()) + (1 if add_special_tokens else 0)))
+        if isinstance(texts, str):
+            return {"input_ids": ids(texts)}
+        return {"input_ids": [ids(text) for text in texts]}
+
+    def batch_decode(self, outputs, skip_special_tokens=True):
+        return list(outputs)
+
+
+class StubModel:
+    """Summarizes each text as 'Summary <first word>.' and records every generate call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return [f"Summary {text.split()[0].lower()}." for text in texts]
+
+
+@pytest.fixture
+def make_pipeline(monkeypatch):
+    def make(**kwargs):
+        model = StubModel()
+        monkeypatch.setattr(summarization_pipeline, "get_tokenizer", lambda name: StubTokenizer())
+        monkeypatch.setattr(summarization_pipeline, "load_seq2seq_model", lambda *args, **kw: (model, "pytorch"))
+        return SummarizationPipeline("stub-summarizer", chunk_overlap=0, **kwargs), model
+    return make
+
+
+def test_long_document_is_chunked_mapped_in_batches_and_reduced(make_pipeline):
+    pipeline, model = make_pipeline(batch_size=4)
+
+    summary, _ = pipeline.summarize(DOCUMENT)
+
+    assert model.calls == [
+        # Map: all three chunks in one batched generate call
+        [
+            "Alpha one two three four. Beta one two three four.",
+            "Gamma one two three four. Delta one two three four.",
+            "Epsilon one two three four. Zeta one two three four.",
+        ],
+        # Reduce: the joined partial summaries
+        ["Summary alpha. Summary gamma. Summary epsilon."],
+    ]
+    assert summary == "Summary summary."
+
+
+def test_map_batches_respect_batch_size(make_pipeline):
+    pipeline, model = make_pipeline(batch_size=2)
+
+    pipeline.summarize(DOCUMENT)
+
+    assert [len(call) for call in model.calls] == [2, 1, 1]
+
+
+def test_max_depth_zero_cuts_at_sentence_boundary(make_pipeline):
+    pipeline, model = make_pipeline(max_depth=0)
+
+    summary, _ = pipeline.summarize(DOCUMENT)
+
+    # No map round - only the first whole-sentence chunk is summarized
+    assert model.calls == [["Alpha one two three four. Beta one two three four."]]
+    assert summary == "Summary alpha."
+
+
+def test_resubmitted_document_is_served_from_cache(make_pipeline):
+    pipeline, model = make_pipeline()
+
+    first, _ = pipeline.summarize(DOCUMENT)
+    calls = len(model.calls)
+    second, _ = pipeline.summarize(DOCUMENT)
+
+    assert second == first
+    assert len(model.calls) == calls
+    # Three map chunks and the reduce input
+    assert pipeline.cache_misses == 4
+    assert pipeline.cache_hits == 4
+    assert pipeline.get_model_info()["summary_cache"]["entries"] == 4
+
+
+def test_summarize_batch_routes_long_texts_through_map_reduce(make_pipeline):
+    pipeline, model = make_pipeline()
+    short_texts = ["Kappa is short.", "Lambda is also short."]
+
+    results = pipeline.summarize_batch([short_texts[0], DOCUMENT, short_texts[1]])
+
+    assert [summary for summary, _ in results] == ["Summary kappa.", "Summary summary.", "Summary lambda."]
+    # The long text went through summarize() (map + reduce); the short ones shared one call
+    assert sorted(model.calls[-1]) == short_texts
+    assert len(model.calls) == 3
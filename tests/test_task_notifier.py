@@ -0,0 +1,126 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# managers/__init__ pulls in the database layer
+pytest.importorskip("sqlalchemy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "proxy_server"))
+
+from managers.task_notifier import (
+    MAX_WAIT_TIMEOUT,
+    TaskAssignmentNotifier,
+    clamp_wait_timeout,
+    filter_unseen_tasks,
+)
+
+
+def test_notify_from_another_thread_wakes_waiter():
+    notifier = TaskAssignmentNotifier()
+
+    async def run():
+        wait = asyncio.ensure_future(notifier.wait_for_assignment(7, timeout=5.0))
+        while notifier.get_stats()["waiting_requests"] == 0:
+            await asyncio.sleep(0.001)
+        started = time.monotonic()
+        thread = threading.Thread(target=notifier.notify, args=([7],))
+        thread.start()
+        woken = await wait
+        elapsed = time.monotonic() - started
+        thread.join()
+        return woken, elapsed
+
+    woken, elapsed = asyncio.run(run())
+    assert woken
+    assert elapsed < 1.0
+    stats = notifier.get_stats()
+    assert stats["notifications_sent"] == 1
+    assert stats["waits_woken"] == 1
+    assert stats["waiting_requests"] == 0
+
+
+def test_waiter_removed_on_timeout():
+    notifier = TaskAssignmentNotifier()
+
+    woken = asyncio.run(notifier.wait_for_assignment(3, timeout=0.01))
+
+    assert not woken
+    stats = notifier.get_stats()
+    assert stats["waits_timed_out"] == 1
+    assert stats["waiting_miners"] == 0
+    assert stats["waiting_requests"] == 0
+    # Nobody is waiting any more, so nothing is sent
+    notifier.notify([3])
+    assert notifier.get_stats()["notifications_sent"] == 0
+
+
+def test_timeout_is_capped():
+    assert clamp_wait_timeout(600) == MAX_WAIT_TIMEOUT
+    assert clamp_wait_timeout(-1) == 0.0
+    assert clamp_wait_timeout(10) == 10.0
+
+
+def test_wait_for_tasks_returns_open_tasks_immediately():
+    notifier = TaskAssignmentNotifier()
+
+    async def fetch():
+        return [{"task_id": "a"}]
+
+    started = time.monotonic()
+    tasks = asyncio.run(notifier.wait_for_tasks(1, fetch, timeout=30.0))
+
+    assert tasks == [{"task_id": "a"}]
+    assert time.monotonic() - started < 1.0
+    assert notifier.get_stats()["waits_started"] == 0
+
+
+def test_wait_for_tasks_returns_empty_after_hold():
+    notifier = TaskAssignmentNotifier()
+    fetches = []
+
+    async def fetch():
+        fetches.append(time.monotonic())
+        return []
+
+    started = time.monotonic()
+    tasks = asyncio.run(notifier.wait_for_tasks(1, fetch, timeout=0.2, recheck_interval=0.05))
+
+    assert tasks == []
+    assert 0.2 <= time.monotonic() - started < 1.0
+    # Re-checked the database while holding
+    assert len(fetches) > 2
+    assert notifier.get_stats()["waiting_requests"] == 0
+
+
+def test_wait_for_tasks_wakes_on_assignment():
+    notifier = TaskAssignmentNotifier()
+    assigned = []
+
+    async def fetch():
+        return list(assigned)
+
+    async def run():
+        wait = asyncio.ensure_future(notifier.wait_for_tasks(5, fetch, timeout=10.0, recheck_interval=10.0))
+        await asyncio.sleep(0.05)
+        assigned.append({"task_id": "new"})
+        notifier.notify([5])
+        return await asyncio.wait_for(wait, timeout=1.0)
+
+    assert asyncio.run(run()) == [{"task_id": "new"}]
+
+
+def test_filter_unseen_tasks_skips_responded_and_known():
+    tasks = [
+        {"task_id": "done", "miner_responses": [{"miner_uid": 2}, {"miner_uid": "7"}]},
+        {"task_id": "queued", "miner_responses": []},
+        {"task_id": "other", "miner_responses": [{"miner_uid": 2}]},
+        {"task_id": "fresh"},
+    ]
+
+    unseen = filter_unseen_tasks(tasks, 7, known_task_ids=["queued"])
+
+    assert [t["task_id"] for t in unseen] == ["other", "fresh"]
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("bittensor")
+
+from neurons.task_scheduler import TaskScheduler, parse_concurrency_limits
+
+
+def test_parse_concurrency_limits():
+    limits = parse_concurrency_limits("tts=1, transcription=2,text_translation=4,bad,x=0,y=z")
+    assert limits == {"tts": 1, "transcription": 2, "text_translation": 4}
+    assert parse_concurrency_limits("") == {}
+    assert parse_concurrency_limits(None) == {}
+
+
+def test_scheduler_respects_per_type_limits():
+    peak = {}
+    running = {}
+
+    async def process(task):
+        task_type = task["task_type"]
+        running[task_type] = running.get(task_type, 0) + 1
+        peak[task_type] = max(peak.get(task_type, 0), running[task_type])
+        await asyncio.sleep(0.01)
+        running[task_type] -= 1
+
+    async def run():
+        scheduler = TaskScheduler(process, concurrency_limits={"tts": 1, "text_translation": 3})
+        for i in range(6):
+            scheduler.submit({"task_id": f"tts-{i}", "task_type": "tts"})
+            scheduler.submit({"task_id": f"tr-{i}", "task_type": "text_translation"})
+        await scheduler.join()
+        stats = scheduler.get_stats()
+        await scheduler.shutdown()
+        return stats
+
+    stats = asyncio.run(run())
+    assert peak == {"tts": 1, "text_translation": 3}
+    assert stats["tasks_completed"] == 12
+    assert stats["in_flight"] == {"tts": 0, "text_translation": 0}
+
+
+def test_scheduler_rejects_duplicates():
+    processed = []
+
+    async def process(task):
+        processed.append(task["task_id"])
+
+    async def run():
+        scheduler = TaskScheduler(process, is_known_fn=lambda task_id: task_id == "done")
+        assert scheduler.submit({"task_id": "a", "task_type": "tts"})
+        assert not scheduler.submit({"task_id": "a", "task_type": "tts"})
+        assert not scheduler.submit({"task_id": "done", "task_type": "tts"})
+        assert scheduler.is_pending("a")
+        await scheduler.join()
+        assert not scheduler.is_pending("a")
+        await scheduler.shutdown()
+        return scheduler.tasks_rejected
+
+    assert asyncio.run(run()) == 2
+    assert processed == ["a"]
@@ -0,0 +1,51 @@
+import pytest
+
+pytest.importorskip("torch")
+
+from template.pipelines.text_chunker import chunk_text, split_sentences
+
+
+TEXT = (
+    'The council met on Tuesday. "Is it funded?" asked one member. Nobody knew!\n\n'
+    'A review was ordered. The vote is in spring, e.g. around 3.5 months away.'
+)
+
+
+def test_split_sentences_keeps_punctuation_and_quotes():
+    assert split_sentences(TEXT) == [
+        'The council met on Tuesday.',
+        '"Is it funded?"',
+        'asked one member.',
+        'Nobody knew!',
+        'A review was ordered.',
+        'The vote is in spring, e.g.',
+        'around 3.5 months away.',
+    ]
+    assert split_sentences("No terminal punctuation") == ["No terminal punctuation"]
+    assert split_sentences("   ") == []
+
+
+def test_chunks_respect_budget_and_sentence_boundaries():
+    sentences = split_sentences(TEXT)
+    chunks = chunk_text(TEXT, max_tokens=50)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert " ".join(chunks) == " ".join(sentences)
+    assert chunk_text(TEXT, max_tokens=1000) == [" ".join(sentences)]
+
+
+def test_long_sentence_is_split_at_words():
+    sentence = " ".join(["word"] * 30) + "."
+    chunks = chunk_text(sentence, max_tokens=20)
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    assert " ".join(chunks) == sentence
+
+
+def test_overlap_repeats_trailing_sentences():
+    text = "One two. Three four. Five six. Seven eight."
+    counter = lambda s: len(s.split())
+    assert chunk_text(text, max_tokens=5, count_tokens=counter) == ["One two. Three four.", "Five six. Seven eight."]
+    assert chunk_text(text, max_tokens=6, count_tokens=counter, overlap_tokens=3) == [
+        "One two. Three four.", "Three four. Five six.", "Five six. Seven eight."
+    ]
@@ -0,0 +1,103 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("bittensor")
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from template.pipelines import transcription_pipeline
+from template.pipelines.transcription_pipeline import TranscriptionPipeline
+
+
+BAD = -1.0
+
+
+class StubFeatures(list):
+    def to(self, device):
+        return self
+
+
+class StubProcessor:
+    """Whisper processor stand-in: each chunk's 'features' are its first sample"""
+
+    def __call__(self, audio, sampling_rate=None, return_tensors=None):
+        class Inputs:
+            input_features = StubFeatures(float(chunk[0]) for chunk in audio)
+        return Inputs()
+
+    def get_decoder_prompt_ids(self, language, task):
+        return [(1, 0)]
+
+    def batch_decode(self, predicted_ids, skip_special_tokens=True):
+        return [f" chunk {int(value)} " for value in predicted_ids]
+
+
+class StubModel:
+    """Records every generate call and fails on any batch containing a BAD chunk"""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate(self, inputs, **kwargs):
+        self.calls.append(list(inputs))
+        if BAD in inputs:
+            raise RuntimeError("generate failed")
+        return list(inputs)
+
+
+@pytest.fixture
+def make_pipeline(monkeypatch):
+    def make(batch_size):
+        model = StubModel()
+
+        class Processor:
+            @staticmethod
+            def from_pretrained(*args, **kwargs):
+                return StubProcessor()
+
+        monkeypatch.setattr(transcription_pipeline, "WhisperProcessor", Processor)
+        monkeypatch.setattr(transcription_pipeline, "load_seq2seq_model", lambda *args, **kw: (model, "pytorch"))
+        return TranscriptionPipeline("stub-whisper", batch_size=batch_size), model
+    return make
+
+
+def make_chunks(values):
+    """One 1-second chunk per value, starting at 0s, 2s, 4s, ..."""
+    return [(np.full(16, value, dtype=np.float32), 2.0 * i, 2.0 * i + 1.0) for i, value in enumerate(values)]
+
+
+def test_one_generate_call_per_batch(make_pipeline):
+    pipeline, model = make_pipeline(batch_size=2)
+
+    pipeline._decode_chunks(make_chunks([0, 1, 2, 3, 4]), 16000, "en", {})
+
+    assert model.calls == [[0.0, 1.0], [2.0, 3.0], [4.0]]
+
+
+def test_chunk_order_indices_and_times_follow_offsets(make_pipeline):
+    pipeline, _ = make_pipeline(batch_size=2)
+
+    chunks = pipeline._decode_chunks(make_chunks([0, 1, 2]), 16000, "en", {},
+                                     index_offset=5, time_offset=60.0)
+
+    assert [chunk.text for chunk in chunks] == ["chunk 0", "chunk 1", "chunk 2"]
+    assert [chunk.chunk_index for chunk in chunks] == [5, 6, 7]
+    assert [(chunk.start_time, chunk.end_time) for chunk in chunks] == [(60.0, 61.0), (62.0, 63.0), (64.0, 65.0)]
+    assert all(chunk.language == "en" for chunk in chunks)
+
+
+def test_failed_batch_is_retried_chunk_by_chunk(make_pipeline):
+    pipeline, model = make_pipeline(batch_size=3)
+
+    chunks = pipeline._decode_chunks(make_chunks([0, BAD, 2, 3]), 16000, "en", {})
+
+    assert model.calls == [
+        [0.0, BAD, 2.0],
+        # Retried one at a time
+        [0.0], [BAD], [2.0],
+        [3.0],
+    ]
+    # Only the bad chunk is lost
+    assert [chunk.text for chunk in chunks] == ["chunk 0", "[Transcription failed]", "chunk 2", "chunk 3"]
+    assert [chunk.confidence == 0.0 for chunk in chunks] == [False, True, False, False]
+    assert [chunk.chunk_index for chunk in chunks] == [0, 1, 2, 3]
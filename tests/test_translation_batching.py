@@ -0,0 +1,89 @@
+import pytest
+
+pytest.importorskip("torch")
+
+from template.pipelines.text_chunker import plan_token_batches
+
+
+def test_batches_respect_token_budget_and_item_limit():
+    lengths = [100, 20, 300, 25, 90, 400, 30]
+    batches = plan_token_batches(lengths, max_tokens=400, max_items=3)
+
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) <= 3
+        assert len(batch) == 1 or max(lengths[i] for i in batch) * len(batch) <= 400
+
+
+def test_similar_lengths_are_batched_together():
+    lengths = [10, 500, 12, 480, 11]
+    assert plan_token_batches(lengths, max_tokens=1000, max_items=8) == [[1, 3], [2, 4, 0]]
+
+
+def test_oversized_item_gets_its_own_batch():
+    assert plan_token_batches([600, 10], max_tokens=512, max_items=4) == [[0], [1]]
+    assert plan_token_batches([], max_tokens=512, max_items=4) == []
+
+
+class StubTokenizer:
+    """Word-level tokenizer"""
+
+    def __call__(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return {"input_ids": texts.split()}
+        return {"input_ids": [text.split() for text in texts]}
+
+
+class StubTranslator:
+    """Stands in for the HF translation pipeline: upper-cases text, fails on batches containing 'bad'"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, batch_size=None):
+        self.calls.append(list(texts))
+        if len(texts) > 1 and any("bad" in text for text in texts):
+            raise RuntimeError("batch failed")
+        return [{"translation_text": text.upper()} for text in texts]
+
+
+@pytest.fixture
+def translation_pipeline(monkeypatch):
+    pytest.importorskip("bittensor")
+    pytest.importorskip("transformers")
+    pytest.importorskip("fitz")
+    pytest.importorskip("docx")
+    from template.pipelines import translation_pipeline as module
+
+    translator = StubTranslator()
+    monkeypatch.setattr(module, "get_tokenizer", lambda name: StubTokenizer())
+    monkeypatch.setattr(module, "load_seq2seq_model", lambda *args, **kwargs: (object(), "pytorch"))
+    monkeypatch.setattr(module, "pipeline", lambda *args, **kwargs: translator)
+    return module.TranslationPipeline("stub-mt", batch_size=2, memory_entries=0), translator
+
+
+def test_translate_chunks_restores_chunk_order(translation_pipeline):
+    pipeline, translator = translation_pipeline
+    chunks = ["one two three four five six", "seven", "eight nine ten", "eleven twelve", "a b c d"]
+
+    translated = pipeline._translate_chunks(chunks, "en", "es")
+
+    assert translated == [chunk.upper() for chunk in chunks]
+    # Batched by length (longest first), not in chunk order
+    assert translator.calls[0] == ["one two three four five six", "a b c d"]
+    assert all(len(call) <= 2 for call in translator.calls)
+
+
+def test_failed_batch_is_retried_chunk_by_chunk(translation_pipeline):
+    pipeline, translator = translation_pipeline
+    chunks = ["first good chunk", "bad chunk here", "x", "y"]
+
+    translated = pipeline._translate_chunks(chunks, "en", "es")
+
+    assert translated == ["FIRST GOOD CHUNK", "BAD CHUNK HERE", "X", "Y"]
+    assert translator.calls == [
+        ["first good chunk", "bad chunk here"],
+        ["first good chunk"],
+        ["bad chunk here"],
+        ["x", "y"],
+    ]
@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("torch")
+
+from template.pipelines.translation_memory import TranslationMemory
+
+
+def test_key_normalizes_whitespace_and_separates_language_pairs():
+    key = TranslationMemory.make_key("t5-small", "en", "es", "Terms and\n  conditions apply.")
+    assert key == TranslationMemory.make_key("t5-small", "en", "es", " Terms and conditions apply. ")
+    assert key != TranslationMemory.make_key("t5-small", "en", "fr", "Terms and conditions apply.")
+    assert key != TranslationMemory.make_key("opus-mt", "en", "es", "Terms and conditions apply.")
+
+
+def test_lru_eviction_and_hit_rate():
+    memory = TranslationMemory(max_entries=2)
+    memory.put("a", "A")
+    memory.put("b", "B")
+    assert memory.get("a") == "A"
+    memory.put("c", "C")
+
+    assert memory.get("b") is None
+    assert memory.get("c") == "C"
+    stats = memory.get_stats()
+    assert stats['entries'] == 2
+    assert stats['hits'] == 2 and stats['misses'] == 1
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    db_path = str(tmp_path / "tm.sqlite")
+    TranslationMemory(max_entries=10, db_path=db_path).put("key", "Hola")
+
+    memory = TranslationMemory(max_entries=10, db_path=db_path)
+    assert memory.get("key") == "Hola"
+    assert memory.get("key") == "Hola"
+    assert memory.get_stats()['disk_hits'] == 1
+    assert memory.get_stats()['hits'] == 1
@@ -0,0 +1,85 @@
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("torch")
+pytest.importorskip("TTS")
+
+from template.pipelines import tts_pipeline
+from template.pipelines.tts_pipeline import TTSPipeline, streaming_wav_header, to_pcm16
+
+
+class StubSynthesizer:
+    output_sample_rate = 16000
+
+
+class StubTTS:
+    """Coqui TTS stand-in: one 4-sample tone per sentence, louder for each call"""
+
+    languages = None
+    speakers = None
+    synthesizer = StubSynthesizer()
+
+    def __init__(self, model_name=None):
+        self.texts = []
+
+    def to(self, device):
+        return self
+
+    def tts(self, text, **kwargs):
+        self.texts.append(text)
+        return [0.1 * len(self.texts)] * 4
+
+
+def test_streaming_wav_header():
+    header = streaming_wav_header(24000)
+    assert len(header) == 44
+    assert header[:4] == b"RIFF" and header[8:16] == b"WAVEfmt " and header[36:40] == b"data"
+    _, fmt, channels, sample_rate, byte_rate, block_align, bits = struct.unpack("<IHHIIHH", header[16:36])
+    assert (fmt, channels, sample_rate, byte_rate, block_align, bits) == (1, 1, 24000, 48000, 2, 16)
+
+
+def test_pcm16_clips_and_scales():
+    pcm = np.frombuffer(to_pcm16([0.0, 0.5, 1.5, -2.0]), dtype="<i2")
+    assert pcm.tolist() == [0, 16383, 32767, -32767]
+
+
+def test_synthesize_stream_yields_one_block_per_sentence_as_produced(monkeypatch):
+    monkeypatch.setattr(tts_pipeline, "TTS", StubTTS)
+    pipeline = TTSPipeline("stub-tts")
+
+    blocks = pipeline.synthesize_stream("First sentence. Second one! And a third?")
+
+    first = next(blocks)
+    # Only the first sentence has been synthesized when its audio is yielded
+    assert pipeline.tts.texts == ["First sentence."]
+    assert first == to_pcm16([0.1] * 4)
+
+    rest = list(blocks)
+    assert pipeline.tts.texts == ["First sentence.", "Second one!", "And a third?"]
+    assert rest == [to_pcm16([0.2] * 4), to_pcm16([0.3] * 4)]
+    assert pipeline.sample_rate == 16000
+
+
+def test_synthesize_stream_raises_on_synthesis_failure(monkeypatch):
+    monkeypatch.setattr(tts_pipeline, "TTS", StubTTS)
+    pipeline = TTSPipeline("stub-tts")
+    monkeypatch.setattr(pipeline.tts, "tts", lambda text, **kwargs: 1 / 0)
+
+    with pytest.raises(Exception, match="TTS synthesis failed"):
+        next(pipeline.synthesize_stream("Hello there."))
+
+
+def test_synthesize_stream_splits_unpunctuated_text(monkeypatch):
+    monkeypatch.setattr(tts_pipeline, "TTS", StubTTS)
+    pipeline = TTSPipeline("stub-tts")
+    pipeline.max_stream_block_length = 40
+    text = " ".join(["word"] * 50)  # One run-on "sentence" of 249 characters
+
+    blocks = list(pipeline.synthesize_stream(text))
+
+    assert len(blocks) > 1
+    assert len(blocks) == len(pipeline.tts.texts)
+    assert all(len(piece) <= 40 for piece in pipeline.tts.texts)
+    assert " ".join(pipeline.tts.texts) == text
@@ -0,0 +1,59 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("torch")
+
+from template.pipelines.vad import segment_speech
+
+SR = 16000
+
+
+def tone(seconds, amplitude=0.5):
+    t = np.arange(int(seconds * SR)) / SR
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def silence(seconds):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * SR)) * 1e-4).astype(np.float32)
+
+
+def test_silence_is_dropped_and_offsets_are_kept():
+    audio = np.concatenate([silence(40), tone(5), silence(40), tone(4), silence(10)])
+    segments = segment_speech(audio, SR, max_duration=30.0)
+
+    assert len(segments) == 2
+    (first_start, first_end), (second_start, second_end) = segments
+    assert abs(first_start / SR - 40) < 0.3
+    assert abs(first_end / SR - 45) < 0.3
+    assert abs(second_start / SR - 85) < 0.3
+    assert abs(second_end / SR - 89) < 0.3
+
+
+def test_short_speech_runs_are_merged_up_to_the_window():
+    parts = []
+    for _ in range(6):
+        parts += [tone(3), silence(2)]
+    audio = np.concatenate(parts)
+    segments = segment_speech(audio, SR, max_duration=30.0)
+
+    assert len(segments) == 1
+    start, end = segments[0]
+    assert start == 0
+    assert end / SR > 27
+
+
+def test_long_speech_is_cut_at_a_pause():
+    audio = np.concatenate([tone(20), silence(0.3), tone(20)])
+    segments = segment_speech(audio, SR, max_duration=30.0)
+
+    assert len(segments) == 2
+    cut = segments[0][1] / SR
+    assert 20 <= cut <= 20.3
+    assert segments[1][0] == segments[0][1]
+    assert all((end - start) / SR <= 30.0 for start, end in segments)
+
+
+def test_no_speech():
+    assert segment_speech(np.zeros(SR * 5, dtype=np.float32), SR) == []
+    assert segment_speech(np.zeros(0, dtype=np.float32), SR) == []
@@ -0,0 +1,97 @@
+import hashlib
+import shutil
+import subprocess
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("torch")
+
+from template.pipelines import video_utils
+from template.pipelines.video_utils import MIN_EXTRACTION_TIMEOUT, MediaInfo, VideoProcessor
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def _tone_video(path, seconds):
+    # Matroska streams fine through a pipe, so bytes input goes through ffmpeg's stdin
+    subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "lavfi", "-i", f"sine=frequency=440:duration={seconds}",
+         "-ar", "44100", "-c:a", "pcm_s16le", "-y", str(path)],
+        check=True
+    )
+    return path
+
+
+def test_extraction_timeout_scales_with_duration():
+    processor = VideoProcessor.__new__(VideoProcessor)
+    assert processor.extraction_timeout(10.0) == MIN_EXTRACTION_TIMEOUT
+    assert processor.extraction_timeout(3600.0) > processor.extraction_timeout(600.0) > MIN_EXTRACTION_TIMEOUT
+    # Unknown duration is bounded from the size
+    assert processor.extraction_timeout(None, size_bytes=16000 * 3600) == processor.extraction_timeout(3600.0)
+
+
+def test_media_info_from_ffprobe():
+    probe = {
+        "format": {"format_name": "matroska,webm", "duration": "N/A"},
+        "streams": [
+            {"index": 0, "codec_type": "video", "codec_name": "vp9", "width": 640, "height": 360},
+            {"index": 1, "codec_type": "audio", "codec_name": "opus", "sample_rate": "48000",
+             "channels": 2, "duration": "12.5"},
+        ],
+    }
+    info = MediaInfo.from_ffprobe(probe, "clip.webm", 1024, "abc")
+    assert info.duration == 12.5 and info.has_audio and info.sample_rate == 48000
+    assert info.to_dict()["video_resolution"] == "640x360"
+    assert info.to_dict()["audio_codec"] == "opus"
+
+    silent = MediaInfo.from_ffprobe({"streams": [probe["streams"][0]]}, "silent.webm", 1024, "def")
+    assert not silent.has_audio and silent.sample_rate == 0 and silent.duration == 0.0
+
+
+@requires_ffmpeg
+def test_probe_is_cached_by_content(tmp_path):
+    processor = VideoProcessor()
+    video_path = _tone_video(tmp_path / "tone.mkv", 2)
+
+    info = processor.probe(str(video_path), "tone.mkv")
+    assert abs(info.duration - 2.0) < 0.1 and info.sample_rate == 44100
+    # Same bytes under another name hit the cache
+    assert processor.probe(video_path.read_bytes(), "copy.mkv") is info
+    assert processor.get_video_info(str(video_path), "tone.mkv", media_info=info)["duration"] == info.duration
+
+
+@requires_ffmpeg
+def test_probe_uses_known_content_hash(tmp_path, monkeypatch):
+    processor = VideoProcessor()
+    video_path = _tone_video(tmp_path / "tone.mkv", 2)
+    digest = hashlib.sha256(video_path.read_bytes()).hexdigest()
+
+    def no_rehash(video_data):
+        raise AssertionError("input was hashed again")
+
+    monkeypatch.setattr(video_utils, "_content_digest", no_rehash)
+    info = processor.probe(str(video_path), "tone.mkv", content_hash=digest)
+    assert info.content_hash == digest
+    assert processor.probe(str(video_path), "again.mkv", content_hash=digest) is info
+
+
+@requires_ffmpeg
+def test_stream_audio_from_bytes_and_path(tmp_path):
+    processor = VideoProcessor()
+    video_path = _tone_video(tmp_path / "tone.mkv", 3)
+
+    with processor.stream_audio(video_path.read_bytes(), "tone.mkv", block_seconds=1.0) as stream:
+        blocks = list(stream)
+    assert all(block.dtype == np.float32 and len(block) <= 16000 for block in blocks)
+    assert stream.samples_read == sum(len(block) for block in blocks)
+    assert abs(stream.samples_read - 3 * 16000) < 160
+
+    audio = processor.extract_audio_array(str(video_path), "tone.mkv")
+    assert abs(len(audio) - 3 * 16000) < 160 and 0.05 < np.abs(audio).max() <= 1.0
+
+
+@requires_ffmpeg
+def test_stream_audio_reports_ffmpeg_failure():
+    with pytest.raises(Exception, match="FFmpeg extraction failed"):
+        VideoProcessor().extract_audio_array(b"not a video", "broken.mkv")